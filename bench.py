@@ -0,0 +1,509 @@
+"""
+性能测试脚本：生成合成的字幕及小说语料，分阶段测试处理速度
+
+用法: python bench.py [--case pipeline|repeat|startup|karaoke|novel_parallel] [--cues 20000] [--novel-mb 5] [--trad-ratio 0.3] [--out 结果.json]
+
+每个阶段在单独的子进程中运行，结果包括耗时、吞吐量（条/秒、MB/秒）及子进程的内存峰值，
+保存为JSON文件后可以在不同版本之间对比。
+"""
+import sys
+import os
+import io
+import re
+import json
+import time
+import random
+import shutil
+import statistics
+import subprocess
+import argparse
+import platform
+import tempfile
+import contextlib
+import multiprocessing
+
+import sub_process
+
+# 测试使用与程序相同的配置文件
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yml')
+SCRIPT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sub_process.py')
+
+# 原来不限制重复单元长度的正则，用于对比
+LEGACY_REPEAT_RE = re.compile(r'(..+?)(\1){1,}', flags=re.UNICODE|re.MULTILINE)
+
+# 生成语料使用的词语：(简体, 繁体)
+WORD_PAIRS = [
+    ('这是', '這是'), ('测试', '測試'), ('我们', '我們'), ('时间', '時間'), ('问题', '問題'),
+    ('说话', '說話'), ('开始', '開始'), ('没有', '沒有'), ('觉得', '覺得'), ('现在', '現在'),
+    ('知道', '知道'), ('你好', '你好'), ('谢谢', '謝謝'), ('怎么', '怎麼'), ('东西', '東西'),
+    ('电话', '電話'), ('已经', '已經'), ('应该', '應該'), ('还是', '還是'), ('关系', '關係'),
+]
+FILLERS = ['嗯', '啊', '哈哈', '好的', '对', '呃']
+PUNCTUATION = ['，', '。', '！', '？', '…', '']
+
+
+# 返回执行 func 的耗时（秒）及其返回值
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+# 当前进程的内存峰值（MB），不支持的平台返回 None
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 的单位是字节，Linux 是KB
+    return round(rss / 1024 / (1024 if sys.platform == 'darwin' else 1), 1)
+
+
+############################## 合成语料 ############################
+# 生成一句文本，trad_ratio 为使用繁体词语的比例
+def make_sentence(rnd: random.Random, trad_ratio: float, words: int) -> str:
+    parts = []
+    for _ in range(words):
+        if rnd.random() < 0.15:
+            parts.append(rnd.choice(FILLERS))
+        else:
+            simplified, traditional = rnd.choice(WORD_PAIRS)
+            parts.append(traditional if rnd.random() < trad_ratio else simplified)
+    return ''.join(parts) + rnd.choice(PUNCTUATION)
+
+
+# 生成 count 条字幕，返回 (开始毫秒, 结束毫秒, 文本行列表)
+def make_cues(rnd: random.Random, count: int, trad_ratio: float) -> list:
+    cues = []
+    start = 0
+    for _ in range(count):
+        start += rnd.randint(100, 1500)
+        end = start + rnd.randint(500, 9000)
+        lines = [make_sentence(rnd, trad_ratio, rnd.randint(2, 8)) for _ in range(rnd.choice((1, 1, 2)))]
+        cues.append((start, end, lines))
+        start = end
+    return cues
+
+
+def write_srt(path: str, cues: list):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, (start, end, lines) in enumerate(cues, 1):
+            timing = f'{sub_process.ms_to_srt_time(start)} --> {sub_process.ms_to_srt_time(end)}'
+            f.write(f'{i}\n{timing}\n' + '\n'.join(lines) + '\n\n')
+
+
+def write_ass(path: str, cues: list, is_ssa: bool = False):
+    with open(path, 'w', encoding='utf-8') as f:
+        if is_ssa:
+            f.write('[Script Info]\nScriptType: v4.00\n\n[V4 Styles]\n'
+                    'Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, TertiaryColour, BackColour, '
+                    'Bold, Italic, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, AlphaLevel, Encoding\n'
+                    'Style: Default,Arial,20,16777215,65535,65535,-2147483640,-1,0,1,3,0,2,30,30,30,0,0\n\n'
+                    '[Events]\nFormat: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n')
+            layer = 'Marked=0'
+        else:
+            f.write(sub_process.ass_header)
+            layer = '0'
+        for start, end, lines in cues:
+            timing = f'{sub_process.ms_to_ass_time(start)},{sub_process.ms_to_ass_time(end)}'
+            f.write(f'Dialogue: {layer},{timing},Default,,0,0,0,,' + r'\N'.join(lines) + '\n')
+
+
+# 卡拉OK字幕使用的样式：名称及样式行中名称之后的部分
+KARAOKE_STYLES = {
+    'Default': 'Arial,48,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,20,20,40,1',
+    'Kara-Romaji': 'Arial,42,&H00FFFFFF,&H00FF8000,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,0,8,20,20,20,1',
+    'Kara-Kanji': 'Microsoft YaHei,52,&H00FFFFFF,&H00FF8000,&H00000000,&H00000000,1,0,0,0,100,100,0,0,1,2,0,8,20,20,70,1',
+    'Sign': 'Arial,36,&H0000FFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,0,0,5,0,0,0,1',
+}
+
+
+# 生成带多个样式、多层、{\k} 逐字卡拉OK标签及 Comment 模板行的字幕组 ASS 文件，大小约为 size_mb；返回字幕条数
+def write_karaoke_ass(path: str, rnd: random.Random, size_mb: float, trad_ratio: float) -> int:
+    target_size = int(size_mb * 1024 * 1024)
+    styles = ''.join(f'Style: {name},{style}\n' for name, style in KARAOKE_STYLES.items())
+    count = 0
+    start = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[Script Info]\n; Script generated by Aegisub\nTitle: Karaoke\nScriptType: v4.00+\n'
+                'PlayResX: 1920\nPlayResY: 1080\nYCbCr Matrix: TV.709\n\n'
+                '[Aegisub Project Garbage]\nVideo File: ep01.mkv\n\n'
+                '[V4+ Styles]\nFormat: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, '
+                'BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, '
+                'Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n' + styles + '\n'
+                '[Events]\nFormat: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n'
+                'Comment: 0,0:00:00.00,0:00:00.00,Kara-Kanji,,0,0,0,template syl,'
+                '{\\pos($scenter,$middle)\\t($start,$end,\\fscx120)}\n')
+        while f.tell() < target_size:
+            start += rnd.randint(100, 1500)
+            end = start + rnd.randint(2000, 6000)
+            timing = f'{sub_process.ms_to_ass_time(start)},{sub_process.ms_to_ass_time(end)}'
+            sentence = make_sentence(rnd, trad_ratio, rnd.randint(3, 8)).rstrip('，。！？…')
+            syllables = ''.join(f'{{\\k{rnd.randint(10, 60)}}}{char}' for char in sentence)
+            f.write(f'Dialogue: 1,{timing},Kara-Kanji,,0,0,0,karaoke,{syllables}\n'
+                    f'Dialogue: 0,{timing},Kara-Romaji,,0,0,0,,{{\\an8}}{sentence}\n')
+            count += 2
+            if rnd.random() < 0.1:
+                f.write(f'Dialogue: 2,{timing},Sign,,0,0,0,,{{\\pos({rnd.randint(100, 1800)},{rnd.randint(100, 1000)})}}'
+                        f'{make_sentence(rnd, trad_ratio, 2)}\n')
+                count += 1
+            start = end
+    return count
+
+
+# 生成硬回车换行的小说文本，大小约为 size_mb
+def write_novel(path: str, rnd: random.Random, size_mb: float, trad_ratio: float, encoding: str):
+    target_chars = int(size_mb * 1024 * 1024 / 2)   # GBK/Big5 每个汉字2字节
+    written = 0
+    chapter = 0
+    with open(path, 'w', encoding=encoding, errors='replace', newline='\r\n') as f:
+        while written < target_chars:
+            chapter += 1
+            title = f'第{chapter}章 ' + make_sentence(rnd, trad_ratio, 2).rstrip('，。！？…')
+            f.write(title + '\n\n')
+            written += len(title)
+            for _ in range(rnd.randint(20, 60)):
+                paragraph = ''.join(make_sentence(rnd, trad_ratio, rnd.randint(3, 10)) for _ in range(rnd.randint(2, 8)))
+                # 按每行30个字硬换行
+                for i in range(0, len(paragraph), 30):
+                    f.write(paragraph[i:i + 30] + '\n')
+                written += len(paragraph)
+            f.write('\n')
+
+
+# 生成全部测试语料，返回语料信息
+def generate_corpus(out_dir: str, cues: int, novel_mb: float, trad_ratio: float, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    cue_list = make_cues(rnd, cues, trad_ratio)
+    corpus = {
+        'srt': os.path.join(out_dir, 'corpus.srt'),
+        'ass': os.path.join(out_dir, 'corpus.ass'),
+        'ssa': os.path.join(out_dir, 'corpus.ssa'),
+        'novel_gbk': os.path.join(out_dir, 'novel_gbk.txt'),
+        'novel_big5': os.path.join(out_dir, 'novel_big5.txt'),
+    }
+    write_srt(corpus['srt'], cue_list)
+    write_ass(corpus['ass'], cue_list)
+    write_ass(corpus['ssa'], cue_list, is_ssa=True)
+    write_novel(corpus['novel_gbk'], rnd, novel_mb, trad_ratio, 'gbk')
+    # Big5 无法编码简体字，全部使用繁体
+    write_novel(corpus['novel_big5'], rnd, novel_mb, 1.0, 'big5')
+    corpus['cues'] = cues
+    return corpus
+
+
+############################## 各个阶段 ############################
+# 复制一份输入文件，避免原地处理修改语料
+def copy_input(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    copy_path = f'{root}_run{ext}'
+    shutil.copyfile(path, copy_path)
+    return copy_path
+
+
+# 每个阶段：(名称, 输入, 计数单位, 函数)；函数完成准备工作后返回 (需要计时的函数, 处理的条数)
+def stage_read_file(path):
+    return lambda: sub_process.read_file(path), None
+
+
+def stage_tw2cn(path):
+    content = sub_process.read_file(path)
+    return lambda: sub_process.tw2cn(content), None
+
+
+def stage_clean_line(path):
+    sub_run = sub_process.sub_process(False, config_file=CONFIG_FILE)
+    lines = [text_line for _, _, text in sub_process.iter_srt_blocks(io.StringIO(sub_process.read_file(path)))
+             for text_line in text.splitlines()]
+    return lambda: [sub_run.clean_line(line) for line in lines], len(lines)
+
+
+def stage_process_srt(path, is_srt2ass):
+    sub_run = sub_process.sub_process(is_srt2ass, config_file=CONFIG_FILE)
+    sub_run.current_file = copy_input(path)
+    return sub_run.process_srt, None
+
+
+def stage_process_ass(path):
+    sub_run = sub_process.sub_process(True, config_file=CONFIG_FILE)
+    sub_run.current_file = copy_input(path)
+    return sub_run.process_ass, None
+
+
+def stage_process_novel(path):
+    novel_run = sub_process.novel_process(config_file=CONFIG_FILE)
+    return lambda: novel_run.process_novel(path), None
+
+
+# (阶段名, 语料, 计数单位, 准备函数, 额外参数)
+PIPELINE_STAGES = [
+    ('read_file', 'srt', 'cues', stage_read_file, ()),
+    ('read_file', 'novel_gbk', 'MB', stage_read_file, ()),
+    ('read_file', 'novel_big5', 'MB', stage_read_file, ()),
+    ('tw2cn', 'srt', 'cues', stage_tw2cn, ()),
+    ('tw2cn', 'novel_big5', 'MB', stage_tw2cn, ()),
+    ('clean_line', 'srt', 'lines', stage_clean_line, ()),
+    ('process_srt', 'srt', 'cues', stage_process_srt, (False,)),
+    ('process_srt->ass', 'srt', 'cues', stage_process_srt, (True,)),
+    ('process_ass', 'ass', 'cues', stage_process_ass, ()),
+    ('process_ass', 'ssa', 'cues', stage_process_ass, ()),
+    ('process_novel', 'novel_gbk', 'MB', stage_process_novel, ()),
+    ('process_novel', 'novel_big5', 'MB', stage_process_novel, ()),
+]
+
+
+# 在子进程中运行一个阶段，返回结果
+def run_stage(stage_index: int, corpus: dict) -> dict:
+    name, source, unit, prepare, extra = PIPELINE_STAGES[stage_index]
+    path = corpus[source]
+    rss_before = peak_rss_mb()
+    # 处理过程中的提示信息不输出
+    with contextlib.redirect_stdout(io.StringIO()):
+        func, items = prepare(path, *extra)
+        seconds, _ = timed(func)
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    items = items if items is not None else corpus['cues']
+    row = {
+        'case': f'pipeline/{name}/{source}',
+        'seconds': round(seconds, 4),
+        'input_mb': round(size_mb, 3),
+        'mb_per_s': round(size_mb / seconds, 2) if seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'base_rss_mb': rss_before,
+    }
+    if unit != 'MB':
+        row[unit] = items
+        row[f'{unit}_per_s'] = round(items / seconds) if seconds else None
+    return row
+
+
+# 各阶段的吞吐量：每个阶段使用单独的子进程，内存峰值互不影响
+def bench_pipeline(args) -> list:
+    work_dir = args.keep or tempfile.mkdtemp(prefix='sub_bench_')
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        corpus = generate_corpus(work_dir, args.cues, args.novel_mb, args.trad_ratio, args.seed)
+        results = []
+        ctx = multiprocessing.get_context('spawn')
+        for i in range(len(PIPELINE_STAGES)):
+            with ctx.Pool(1) as pool:
+                results.append(pool.apply(run_stage, (i, corpus)))
+        return results
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+############################## 重复内容合并 ############################
+# 生成针对重复内容合并的对抗性长行（没有换行的语音识别字幕等）
+def make_adversarial_lines(length: int, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    words = ['我们', '今天', '这个', '就是', '然后', '其实', '那个', '所以']
+    return {
+        # 几乎没有重复的长行：原正则在每个位置都要尝试到行尾，耗时与行长的平方成正比
+        'prose': ''.join(chr(0x4E00 + rnd.randint(0, 3000)) for _ in range(length)),
+        # 由少量常用词随机组成的长行，大量局部重复
+        'asr': ''.join(rnd.choice(words) for _ in range(length // 2)),
+        # 长单元的近似重复，中间有一个字符不同
+        'near_repeat': ('一二三四五六七八九十' * (length // 20)) + '错' + ('一二三四五六七八九十' * (length // 20)),
+        # 整行都是同一个短语的重复
+        'refrain': '谢谢大家' * (length // 4),
+    }
+
+
+# 重复内容合并：原正则与 collapse_repeats 的对比
+def bench_repeat(args=None, sizes=(500, 2000, 5000)) -> list:
+    results = []
+    for size in sizes:
+        for name, line in make_adversarial_lines(size).items():
+            legacy_time, legacy_out = timed(LEGACY_REPEAT_RE.sub, r'\1', line)
+            new_time, new_out = timed(sub_process.collapse_repeats, line)
+            results.append({
+                'case': f'repeat/{name}',
+                'chars': len(line),
+                'legacy_s': round(legacy_time, 6),
+                'new_s': round(new_time, 6),
+                'same_output': legacy_out == new_out,
+            })
+    return results
+
+
+############################## 启动时间 ############################
+# 运行 command 若干次，返回耗时的中位数（秒）
+def median_run_time(command: list, runs: int, prepare=None) -> float:
+    times = []
+    for _ in range(runs):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+# 拖放单个小文件时的总耗时：解释器启动、导入、读取配置、处理及写入
+def bench_startup(args) -> list:
+    work_dir = tempfile.mkdtemp(prefix='sub_bench_')
+    try:
+        rnd = random.Random(args.seed)
+        sources = {'srt': os.path.join(work_dir, 'source.srt'), 'novel': os.path.join(work_dir, 'source.txt')}
+        write_srt(sources['srt'], make_cues(rnd, 50, args.trad_ratio))
+        write_novel(sources['novel'], rnd, 0.02, args.trad_ratio, 'gbk')
+        runs = args.startup_runs
+        results = [{
+            'case': f'startup/{name}',
+            'runs': runs,
+            'median_s': round(median_run_time([sys.executable, *command], runs), 4),
+        } for name, command in (('python', ['-c', 'pass']),
+                                ('import', ['-c', 'import sub_process']))]
+        for name, source in sources.items():
+            input_path = os.path.join(work_dir, 'input' + os.path.splitext(source)[1])
+            # 每次都重新复制输入文件并使用 --force，确保真正执行了处理
+            median = median_run_time([sys.executable, SCRIPT_FILE, input_path, '--force'], runs,
+                                     prepare=lambda: shutil.copyfile(source, input_path))
+            results.append({
+                'case': f'startup/file/{name}',
+                'runs': runs,
+                'median_s': round(median, 4),
+                'budget_s': args.startup_budget,
+                'within_budget': median <= args.startup_budget,
+            })
+        return results
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+############################## 卡拉OK字幕 ############################
+# 在子进程中处理卡拉OK字幕，并检查样式、分辨率及特效标签是否保留
+def run_karaoke(path: str, cues: int) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        sub_run = sub_process.sub_process(False, config_file=CONFIG_FILE)
+        sub_run.current_file = copy_input(path)
+        seconds, _ = timed(sub_run.process_ass)
+    with open(sub_run.current_file, encoding='utf-8-sig') as f:
+        output = f.read()
+    header, _, events = output.partition('[Events]')
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    return {
+        'case': 'karaoke/process_ass',
+        'seconds': round(seconds, 4),
+        'input_mb': round(size_mb, 3),
+        'mb_per_s': round(size_mb / seconds, 2) if seconds else None,
+        'cues': cues,
+        'cues_per_s': round(cues / seconds) if seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'styles_kept': all(f'Style: {name},{style}' in header for name, style in KARAOKE_STYLES.items()
+                           if name != 'Default'),
+        'playres_kept': 'PlayResX: 1920' in header,
+        'tagged_lines': events.count('karaoke,{\\k'),
+    }
+
+
+# 字幕组的卡拉OK ASS 字幕（默认20MB）：文件头扫描、样式合并及逐行处理的速度
+def bench_karaoke(args) -> list:
+    work_dir = args.keep or tempfile.mkdtemp(prefix='sub_bench_')
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        path = os.path.join(work_dir, 'karaoke.ass')
+        cues = write_karaoke_ass(path, random.Random(args.seed), args.karaoke_mb, args.trad_ratio)
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            return [pool.apply(run_karaoke, (path, cues))]
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+############################## 小说并行处理 ############################
+# 处理一次小说，返回 (输出内容, 章节目录, 耗时)
+def run_novel(path: str, jobs: int, chunk_chars: int) -> tuple:
+    with contextlib.redirect_stdout(io.StringIO()):
+        novel_run = sub_process.novel_process(config_file=CONFIG_FILE)
+        novel_run.novel_jobs = jobs
+        novel_run.novel_parallel_mb = 0
+        novel_run.novel_chunk_chars = chunk_chars
+        novel_run.novel_toc = True
+        seconds, _ = timed(novel_run.process_novel, path)
+    with open(novel_run.result_path, 'rb') as f:
+        return f.read(), novel_run.chapters, seconds
+
+
+# 单个大文件切块并行处理：与逐行处理的输出必须逐字节相同（块很小时分界最多，也一并检查）
+def bench_novel_parallel(args) -> list:
+    work_dir = args.keep or tempfile.mkdtemp(prefix='sub_bench_')
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        path = os.path.join(work_dir, 'novel_parallel.txt')
+        write_novel(path, random.Random(args.seed), args.novel_mb, args.trad_ratio, 'gbk')
+        jobs = max(args.jobs or os.cpu_count() or 1, 2)
+        serial_output, serial_toc, serial_time = run_novel(path, 1, sub_process.NOVEL_CHUNK_CHARS)
+        results = []
+        for chunk_chars in (sub_process.NOVEL_CHUNK_CHARS, 4096):
+            output, toc, seconds = run_novel(path, jobs, chunk_chars)
+            results.append({
+                'case': f'novel_parallel/chunk_{chunk_chars}',
+                'jobs': jobs,
+                'input_mb': round(os.path.getsize(path) / 1024 / 1024, 3),
+                'serial_s': round(serial_time, 4),
+                'parallel_s': round(seconds, 4),
+                'speedup': round(serial_time / seconds, 2) if seconds else None,
+                'identical': output == serial_output and toc == serial_toc,
+            })
+        return results
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+BENCH_CASES = {
+    'pipeline': bench_pipeline,
+    'repeat': bench_repeat,
+    'startup': bench_startup,
+    'karaoke': bench_karaoke,
+    'novel_parallel': bench_novel_parallel,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='字幕及小说处理的性能测试')
+    parser.add_argument('--case', choices=sorted(BENCH_CASES), action='append',
+                        help='需要运行的测试，可以多次指定；默认运行全部')
+    parser.add_argument('--cues', type=int, default=20000, help='合成字幕的条数，默认20000')
+    parser.add_argument('--novel-mb', type=float, default=5, help='合成小说的大小（MB），默认5')
+    parser.add_argument('--jobs', type=int, default=0, help='novel_parallel 使用的进程数，默认为CPU核心数（至少2）')
+    parser.add_argument('--karaoke-mb', type=float, default=20, help='卡拉OK字幕的大小（MB），默认20')
+    parser.add_argument('--trad-ratio', type=float, default=0.3, help='语料中繁体词语的比例，默认0.3')
+    parser.add_argument('--seed', type=int, default=0, help='随机数种子')
+    parser.add_argument('--keep', default='', help='将合成的语料保存在该文件夹中（默认使用临时文件夹并在结束后删除）')
+    parser.add_argument('--startup-runs', type=int, default=10, help='启动时间测试的运行次数，默认10')
+    parser.add_argument('--startup-budget', type=float, default=0.3,
+                        help='处理单个小文件的耗时目标（秒），默认0.3')
+    parser.add_argument('--out', default='', help='将结果保存为JSON文件')
+    args = parser.parse_args()
+
+    results = []
+    for name in args.case or sorted(BENCH_CASES):
+        for row in BENCH_CASES[name](args):
+            print(json.dumps(row, ensure_ascii=False))
+            results.append(row)
+
+    if args.out:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': {'cues': args.cues, 'novel_mb': args.novel_mb, 'trad_ratio': args.trad_ratio, 'seed': args.seed},
+            'results': results,
+        }
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f'✓ 结果已保存为: {args.out}')
+    # 并行处理与逐行处理的输出不同时返回非0，可以在发布前作为检查使用
+    different = [row['case'] for row in results if row.get('identical') is False]
+    if different:
+        print('✗ 输出与逐行处理不同: ' + ', '.join(different))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
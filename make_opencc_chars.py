@@ -0,0 +1,91 @@
+"""
+生成 sub_process.py 中的 OPENCC_PHRASE_CHARS：各转换配置的词典中只在词组里才会被转换的字符（如“瞭解 -> 了解”中的“瞭”）
+
+用法: python make_opencc_chars.py [转换配置 ...]
+
+需要安装 OpenCC 官方 Python 包（自带 opencc_dict，用于把 ocd2 词典导出为文本），只在开发时运行；
+程序运行时只使用生成的结果，不读取词典。升级 OpenCC 后重新运行，用输出替换 sub_process.py 中的同名常量。
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+
+import opencc
+
+import sub_process
+
+
+# 读取词典的全部词条 (原文, [转换结果, ...])：txt 词典直接读取，ocd2/ocd 词典用 opencc_dict 导出为文本
+def iter_opencc_dict(path: str, tool: str):
+    if path.endswith('.txt'):
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            text_path = os.path.join(temp_dir, 'dict.txt')
+            subprocess.run([tool, '-i', path, '-o', text_path, '-f', os.path.splitext(path)[1][1:], '-t', 'text'],
+                           check=True, capture_output=True)
+            with open(text_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+    for line in text.splitlines():
+        key, _, values = line.partition('\t')
+        if key and values:
+            yield key, values.split(' ')
+
+
+# 转换配置用到的所有词典文件
+def iter_dict_files(config_path: str, dirs: list):
+    with open(config_path, 'r', encoding='utf-8') as f:
+        pending = [json.load(f)]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif isinstance(node, dict):
+            pending.extend(v for k, v in node.items() if k != 'file')
+            if isinstance(node.get('file'), str):
+                path = sub_process.find_in_dirs(node['file'], dirs)
+                if not path:
+                    raise FileNotFoundError(node['file'])
+                yield path
+
+
+# 词典中会被转换的字符（词条原文与转换结果逐字比较，取不同位置上的原文字符，长度不同时取词条中的全部字符），
+# 去掉运行时逐字检查的区段（OPENCC_CHAR_RANGES）中单独转换时就会改变的字符
+def phrase_chars(profile: str, tool: str) -> str:
+    dirs = sub_process.opencc_data_dirs(opencc)
+    config_path = sub_process.find_in_dirs(f'{profile}.json', dirs)
+    dirs = [os.path.dirname(config_path)] + dirs
+    chars = set()
+    for path in iter_dict_files(config_path, dirs):
+        for key, values in iter_opencc_dict(path, tool):
+            for value in values:
+                if len(value) == len(key):
+                    chars.update(k for k, v in zip(key, value) if k != v)
+                else:
+                    chars.update(key)
+    cc = opencc.OpenCC(profile)
+    probed = {chr(c) for start, end in sub_process.OPENCC_CHAR_RANGES for c in range(start, end + 1)}
+    return ''.join(sorted(c for c in chars if c not in probed or cc.convert(c) == c))
+
+
+def main():
+    dirs = sub_process.opencc_data_dirs(opencc)
+    profiles = sys.argv[1:] or sorted(name[:-5] for folder in dirs if os.path.isdir(folder)
+                                      for name in os.listdir(folder) if name.endswith('.json'))
+    tool = shutil.which('opencc_dict') or sub_process.find_in_dirs(
+        'opencc_dict.exe' if os.name == 'nt' else 'opencc_dict', [os.path.join(os.path.dirname(opencc.__file__), 'clib', 'bin')])
+    if not tool:
+        sys.exit('找不到 opencc_dict，请安装 OpenCC 官方 Python 包')
+    print(f"# 由 make_opencc_chars.py 根据 OpenCC {getattr(opencc, '__version__', '')} 的词典生成")
+    print('OPENCC_PHRASE_CHARS = {')
+    for profile in profiles:
+        print(f'    {profile!r}: {phrase_chars(profile, tool)!r},')
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
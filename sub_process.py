@@ -1,13 +1,21 @@
 import sys
 import os
 import re
-import chardet
-from opencc import OpenCC
-import datetime
-import yaml
-from typing import List, Tuple
+import io
+import argparse
+import contextlib
+import itertools
+import codecs
+import json
+import hashlib
+import time
+import shutil
+import collections
+import functools
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+# chardet、opencc、yaml、csv 等在第一次使用时才导入，减少单个文件处理时的启动时间
 
-# import json
 # import configparser
 
 # 默认ASS文件头
@@ -28,23 +36,24 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
 
 # 时间格式正则表达式（兼容ASS和SRT）
-SUB_TIME_RE = re.compile(r'\d{1,2}:\d{2}:\d{2}[,.]\d{2,3}')
+SUB_TIME_RE = re.compile(r'\d{1,3}:\d{2}:\d{2}[,.]\d{2,3}')
 
 # ----------  针对SRT格式的正则 ----------
-SRT_SPLIT_RE = re.compile(r'\r?\n\s*\n',flags=re.UNICODE|re.MULTILINE)          # 段落分隔
 SRT_BLOCK_RE = re.compile(
     r'^\s*(\d+)\s*\n'                             # 序号
-    r'(\d{2}:\d{2}:\d{2}[,.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,.]\d{3})\s*\n'  # 时间轴
+    r'(\d{2,3}:\d{2}:\d{2}[,.]\d{3}\s*-->\s*\d{2,3}:\d{2}:\d{2}[,.]\d{3})\s*\n'  # 时间轴
     r'([\s\S]*)$',
     flags=re.UNICODE|re.MULTILINE     # 字幕文本
 )
 
 # ----------  针对ASS格式的正则 ----------
-ASS_HEADER_RE = re.compile(r'^.*?(?=Dialogue)', re.DOTALL)
-ASS_DIALOGUE_RE = re.compile(r'^(Dialogue:\s*\d+,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,)(.*)$', flags=re.UNICODE|re.MULTILINE)
+# Dialogue 行：Layer（SSA 中为 Marked=0）、Start、End、Style、Name/MarginL/MarginR/MarginV/Effect、Text
+ASS_DIALOGUE_RE = re.compile(r'^Dialogue:\s*(?:Marked=\d*|(\d+)),([^,]*),([^,]*),([^,]*),([^,]*,[^,]*,[^,]*,[^,]*,[^,]*),(.*)$', flags=re.UNICODE)
 
 # ###########需要清理的内容#######################
 # 去掉开头的标点符号和空白符
+# 行首的 ASS 特效标签，如 {\an8}、{\k20}
+ASS_TAGS_HEAD_RE = re.compile(r'^\s*(?:\{[^{}]*\}\s*)+')
 BLANK_HEAD_RE = re.compile(r'^[^\w(（\'"‘“]+', flags=re.UNICODE|re.MULTILINE)
 # text = re.sub(r'^[\W]+', '', text, flags=re.UNICODE)
 
@@ -52,7 +61,12 @@ BLANK_HEAD_RE = re.compile(r'^[^\w(（\'"‘“]+', flags=re.UNICODE|re.MULTILIN
 BLANK_TAIL_RE = re.compile(r'[,.:;，。：；、\s]+$', flags=re.UNICODE|re.MULTILINE)
 
 # 将文本中重复了2次及以上的多字字符串替换为1次
-REPEAT_CONTENT_RE = re.compile(r'(..+?)(\1){1,}', flags=re.UNICODE|re.MULTILINE)# 匹配任何重复至少2次的双字及以上的子字符串
+# 重复单元的最大长度：限制长度后每个位置最多尝试 REPEAT_MAX_UNIT 种单元，整行的处理时间与行长成线性关系
+# （不超过 2*REPEAT_MAX_UNIT+1 个字符的行，结果与不限长度的 (..+?)(\1){1,} 完全相同）
+REPEAT_MAX_UNIT = 50
+# 超过该长度的行（如没有换行的语音识别字幕）不做重复内容的合并
+REPEAT_MAX_LINE = 10000
+REPEAT_CONTENT_RE = re.compile(r'(.{2,%d}?)\1+' % REPEAT_MAX_UNIT, flags=re.UNICODE|re.MULTILINE)# 匹配任何重复至少2次的双字及以上的子字符串
 
 # 如果一行中有重叠的2个及以上语气词，则只保留1个
 REPEAT_CHAR_RE = re.compile(r'([ ,.，。！!?？：；;嗯呵哒喽呗嘛哟哇呃啊哦啦唉欸诶喔呀呐哼哈喂唔]){2,}',flags=re.UNICODE)
@@ -62,39 +76,484 @@ BLANK_RE = re.compile(r'^[ ,.，。！!?？：；;—\-\–…\"\'「」『』()
 ###############################################################
 
 ################### 开始定义公用的函数 ################################
+# 编码检测时读取的样本大小
+DETECT_SAMPLE_SIZE = 64 * 1024
+# 样本为纯ASCII时（如开头是大段的时间轴、样式），继续读取的最大字节数
+DETECT_MAX_SIZE = 1024 * 1024
+
+# 常见的BOM及对应的编码（UTF-32 的 BOM 以 UTF-16 的 BOM 开头，需要先判断）
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# chardet 置信度不高时也可以采用的中日韩编码
+CJK_ENCODINGS = {'gb18030', 'gbk', 'gb2312', 'hz-gb-2312', 'big5', 'big5hkscs', 'euc-tw',
+                 'shift_jis', 'cp932', 'euc-jp', 'euc-kr', 'cp949'}
+
+
+class encoding_cache:
+    """
+    文件编码检测结果的缓存，以 (路径, 文件大小, 修改时间) 为键。
+    指定 cache_file 后可以保存到磁盘，再次处理同一批文件时跳过编码检测。
+    """
+    def __init__(self):
+        self.cache_file = ''
+        self.entries = {}       # 路径 -> [文件大小, 修改时间, 编码]
+        self.new_entries = {}   # 本次新检测的结果，进程池模式下返回给主进程合并
+
+    def load(self, cache_file: str):
+        self.cache_file = cache_file
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.entries.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        if not self.cache_file or not self.new_entries:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            write_chunks(self.cache_file, [json.dumps(self.entries, ensure_ascii=False)], encoding='utf-8')
+            self.new_entries = {}
+        except OSError as e:
+            print(f"警告：编码缓存保存失败：{e}")
+
+    def get(self, file_path: str):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        entry = self.entries.get(os.path.abspath(file_path))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def put(self, file_path: str, encoding: str):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+        entry = [stat.st_size, stat.st_mtime_ns, encoding]
+        self.entries[os.path.abspath(file_path)] = entry
+        self.new_entries[os.path.abspath(file_path)] = entry
+
+    # 取出本次新检测的结果
+    def pop_new_entries(self) -> dict:
+        new_entries, self.new_entries = self.new_entries, {}
+        return new_entries
+
+    # 合并其他进程检测的结果
+    def merge(self, entries: dict):
+        self.entries.update(entries)
+        self.new_entries.update(entries)
+
+
+# 全局的编码检测缓存
+ENCODING_CACHE = encoding_cache()
+
+
+# 读取编码检测所需的样本：默认读取 DETECT_SAMPLE_SIZE 字节，纯ASCII时继续读取直到出现非ASCII字符
+def read_sample(f) -> Tuple[bytes, bool]:
+    sample = f.read(DETECT_SAMPLE_SIZE)
+    while len(sample) < DETECT_MAX_SIZE and sample.isascii():
+        chunk = f.read(DETECT_SAMPLE_SIZE)
+        if not chunk:
+            break
+        sample += chunk
+    # 返回样本及样本是否为完整的文件内容
+    return sample, not f.read(1)
+
+
+# 根据字节样本检测编码：BOM -> 严格UTF-8解码 -> chardet 增量检测
+def detect_bytes_encoding(sample: bytes, is_complete: bool = True) -> str:
+    # 1. BOM
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+
+    # 2. 严格的UTF-8解码（样本不完整时，允许末尾有被截断的多字节字符）
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=is_complete)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    # 3. chardet 增量检测，检测器有结论后即停止
+    import chardet
+    detector = chardet.UniversalDetector()
+    for i in range(0, len(sample), 8192):
+        detector.feed(sample[i:i + 8192])
+        if detector.done:
+            break
+    detector.close()
+    result = detector.result
+    encoding = (result.get('encoding') or '').lower()
+    # 处理常见编码别名问题
+    encoding = 'gb18030' if encoding in ['gbk', 'gb2312'] else encoding
+    if encoding and encoding != 'ascii' and (result.get('confidence', 0) > 0.7 or encoding in CJK_ENCODINGS):
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=is_complete)
+            return encoding
+        except (UnicodeDecodeError, LookupError):
+            pass
+    # 已经确定不是UTF-8，中文文本最常见的是 GB18030（兼容GBK/GB2312）
+    return 'gb18030'
+
+
 # 检测字幕的文件编码，并将编码以字符串的形式返回
-def detect_encoding(file_path) -> str:
-    """检测文件编码"""
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-        encoding = result['encoding'] if result['confidence'] > 0.7 else 'utf-8'
-        # 处理常见编码别名问题
-        encoding = 'gb18030' if encoding.lower() in ['gbk', 'gb2312'] else encoding
+def detect_encoding(file_path, data: bytes = None) -> str:
+    """检测文件编码：只读取有限的样本，结果按 (路径, 大小, 修改时间) 缓存；data 为已经读取的文件内容"""
+    encoding = ENCODING_CACHE.get(file_path)
+    if encoding:
         return encoding
-    
+    # 已经读取了文件内容时，取同样的样本，保证结果与直接读取文件时一致
+    with open(file_path, 'rb') if data is None else io.BytesIO(data) as f:
+        sample, is_complete = read_sample(f)
+    encoding = detect_bytes_encoding(sample, is_complete)
+    ENCODING_CACHE.put(file_path, encoding)
+    return encoding
+
+# 检测的编码解码失败时，依次尝试的常见编码
+FALLBACK_ENCODINGS = ['gbk', 'gb2312', 'utf-8', 'latin-1']
+
+
+# 返回依次尝试的编码列表：检测到的编码在前，常见编码在后
+def candidate_list(encoding: str) -> List[str]:
+    return [encoding] + [enc for enc in FALLBACK_ENCODINGS if enc != encoding]
+
+
+def candidate_encodings(file_path: str, data: bytes = None) -> List[str]:
+    return candidate_list(detect_encoding(file_path, data))
+
+
 # 读取文件，并将内容返回
 def read_file(file_path: str) -> str:
-    """读取文件并自动处理编码"""
-    encoding = detect_encoding(file_path)
-    try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # 如果检测的编码失败，尝试常见编码
-        for enc in ['gbk', 'gb2312', 'utf-8', 'latin-1']:
+    """读取文件并自动处理编码（文件只读取一次）"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    content = decode_bytes(data, candidate_encodings(file_path, data))
+    if content is None:
+        raise Exception(f"无法解码文件: {file_path}")
+    return content
+
+
+# 将字节内容解码为文本，依次尝试 encodings（为 None 时检测编码，不使用缓存），全部失败时返回 None
+def decode_bytes(data: bytes, encodings: List[str] = None):
+    if encodings is None:
+        sample, is_complete = read_sample(io.BytesIO(data))
+        encodings = candidate_list(detect_bytes_encoding(sample, is_complete))
+    for enc in encodings:
+        try:
+            content = data.decode(enc)
+        except UnicodeDecodeError:
+            # 如果检测的编码失败，尝试常见编码
+            continue
+        if enc in ('utf-8', 'utf-8-sig'):
+            content = content.lstrip('\ufeff')
+        # 与文本方式读取文件一致，统一换行符
+        return normalize_newlines(content)
+    return None
+
+
+# 与文本方式读取文件一致，统一换行符
+def normalize_newlines(content: str) -> str:
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# 按指定编码逐行读取文件，读取完毕后立即关闭文件
+# data 不为 None 时（文件内容已经预读到内存中）从 data 中读取，换行符的处理与读取文件时相同
+def iter_file_lines(file_path: str, encoding: str, data: bytes = None) -> Iterator[str]:
+    with open(file_path, 'r', encoding=encoding) if data is None else \
+            io.TextIOWrapper(io.BytesIO(data), encoding=encoding) as f:
+        yield from f
+
+
+# 流式读取时每次最多读取的字节数（有数据可读时立即返回，不等待读满）
+STREAM_READ_SIZE = 1 << 16
+
+
+# 从二进制流中逐行读取原始字节（保留行尾），与读取文件时相同，\r\n、\r、\n 都作为换行符
+# 末尾为 \r 的行要等到下一次读取（或输入结束）才能确定后面是否还有 \n
+def iter_raw_lines(stream) -> Iterator[bytes]:
+    parts = []
+    while True:
+        data = stream.read1(STREAM_READ_SIZE)
+        if not data:
+            break
+        if b'\n' not in data and b'\r' not in data and not (parts and parts[-1].endswith(b'\r')):
+            parts.append(data)
+            continue
+        lines = (b''.join(parts) + data).splitlines(keepends=True)
+        parts = [] if lines[-1].endswith(b'\n') else [lines.pop()]
+        yield from lines
+    if parts:
+        yield b''.join(parts)
+
+
+# 从二进制流（如标准输入）中逐行读取并解码，不等待输入结束
+# 有BOM时按BOM的编码读取；否则纯ASCII的行立即返回；第一个非ASCII的行是合法的UTF-8时之后都按UTF-8处理，
+# 否则先缓存，取与 read_sample 相同的样本检测一次编码（与读取文件时的结果一致），之后都使用该编码
+def iter_stream_lines(stream) -> Iterator[str]:
+    head = stream.peek(4)[:4]
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            yield from io.TextIOWrapper(stream, encoding=encoding)
+            return
+    sample, pending = bytearray(), []
+    target = DETECT_MAX_SIZE
+    encodings = None
+    for data in iter_raw_lines(stream):
+        if encodings is not None:
+            yield decode_bytes(data, encodings)
+            continue
+        if not pending and data.isascii():
+            sample += data
+            if len(sample) >= DETECT_MAX_SIZE:
+                # 与 read_sample 相同：开头 DETECT_MAX_SIZE 字节都是ASCII时按UTF-8处理
+                encodings = candidate_list('utf-8')
+            yield normalize_newlines(data.decode('ascii'))
+            continue
+        if not pending:
             try:
-                with open(file_path, 'r', encoding=enc) as f:
-                    return f.read()
-            except UnicodeDecodeError:
+                data.decode('utf-8')
+                encodings = candidate_list('utf-8')
+                yield decode_bytes(data, encodings)
                 continue
-        raise Exception(f"无法解码文件: {file_path}")
+            except UnicodeDecodeError:
+                pass
+            # 样本读到第一个非ASCII字节所在的 DETECT_SAMPLE_SIZE 块的末尾
+            pos = len(sample) + next(i for i, b in enumerate(data) if b > 127)
+            target = min((pos // DETECT_SAMPLE_SIZE + 1) * DETECT_SAMPLE_SIZE, DETECT_MAX_SIZE)
+        sample += data
+        pending.append(data)
+        if len(sample) <= target:
+            continue
+        encodings = candidate_list(detect_bytes_encoding(bytes(sample[:target]), is_complete=False))
+        yield from (decode_bytes(d, encodings) for d in pending)
+        sample, pending = None, []
+    if pending:
+        encodings = candidate_list(detect_bytes_encoding(bytes(sample[:target]), is_complete=len(sample) <= target))
+        yield from (decode_bytes(d, encodings) for d in pending)
+
+
+# 写入文件时的缓冲区大小：小的文本块先合并，凑够后再一次写入
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+# 将生成器产生的文本块写入文件（默认为UTF-8-BOM编码）
+# 先写入同目录下的临时文件，全部完成后再替换目标文件：目标文件可以就是正在读取的源文件，
+# 中途出错或按 Ctrl-C 中断时删除临时文件，原文件保持不变；fsync 为 True 时确保数据写入磁盘后再替换
+def write_chunks(result_path: str, chunks: Iterable[str], encoding='utf-8-sig', fsync: bool = False):
+    temp_path = f'{result_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w', encoding=encoding, buffering=WRITE_BUFFER_SIZE) as f:  # utf-8-sig添加BOM确保兼容性
+            buffer, size = [], 0
+            for chunk in chunks:
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= WRITE_BUFFER_SIZE:
+                    f.write(''.join(buffer))
+                    buffer, size = [], 0
+            f.write(''.join(buffer))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # 覆盖原文件时保留原文件的权限
+        if os.path.exists(result_path):
+            with contextlib.suppress(OSError):
+                shutil.copymode(result_path, temp_path)
+        os.replace(temp_path, result_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if fsync and os.name == 'posix':
+        # 同时保证文件夹中的改名记录写入磁盘
+        dir_fd = os.open(os.path.dirname(os.path.abspath(result_path)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+# 将 srt 内容按空行分块，逐块返回 (序号, 时间轴, 字幕文本)，不合法的块直接跳过
+def iter_srt_blocks(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    block = []
+    for line in itertools.chain(lines, ('',)):
+        if line.strip():
+            block.append(line.lstrip('\ufeff') if not block else line)
+            continue
+        if block:
+            m = SRT_BLOCK_RE.match(''.join(block).strip())
+            block = []
+            if m:   # 不是合法 block 则跳过
+                yield m.groups()
+
+# 将文本中重复了2次及以上的多字字符串替换为1次，如“我爱你我爱你” -> “我爱你”
+def collapse_repeats(text: str) -> str:
+    # 少于4个字符不可能有重复的多字字符串；过长的行直接跳过
+    if len(text) < 4 or len(text) > REPEAT_MAX_LINE:
+        return text
+    return REPEAT_CONTENT_RE.sub(r'\1', text)
+
+
+# 生成转换字符集时检查的 Unicode 区段：CJK标点、扩展A、基本区、兼容汉字、全角符号、扩展B
+OPENCC_CHAR_RANGES = [(0x3000, 0x303F), (0x3400, 0x4DBF), (0x4E00, 0x9FFF),
+                      (0xF900, 0xFAFF), (0xFF00, 0xFFEF), (0x20000, 0x2A6DF)]
+
+
+# OpenCC 配置文件和词典所在的文件夹：OpenCC 官方 Python 包、opencc-python-reimplemented、系统安装
+def opencc_data_dirs(opencc_module) -> List[str]:
+    package_dir = os.path.dirname(os.path.abspath(opencc_module.__file__))
+    return [os.path.join(package_dir, 'clib', 'share', 'opencc'), os.path.join(package_dir, 'config'),
+            os.path.join(package_dir, 'dictionary'), '/usr/share/opencc', '/usr/local/share/opencc']
+
+
+# 在多个文件夹中查找文件，找不到时返回空字符串
+def find_in_dirs(name: str, dirs: List[str]) -> str:
+    for folder in dirs:
+        path = os.path.join(folder, name)
+        if os.path.isfile(path):
+            return path
+    return ''
+
+
+# 各转换配置的词典中只在词组里才会被转换的字符（如“瞭解 -> 了解”中的“瞭”），单独转换时会改变的字符在运行时逐字检查得到
+# 由 make_opencc_chars.py 根据 OpenCC 1.4.2 的词典生成，升级 OpenCC 后重新生成
+OPENCC_PHRASE_CHARS = {
+    'hk2s': '么仝俱像兑卧叁叚台吃哩唇喆囱坏堃媪彷悦愠户才捝揾敚核棁椀榅氲沈涚淼温澂灶煴犇甦甯痴皂瞭礆祇秘税筦粽絜耑脱腽菉葱蒀藉蜕覆迺邨阪龢𪟖𪷓𫒡𫜦丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰻞',
+    'hk2sp': '·丹么仝伊伺佐佛作依侯俱像克兑凡利力化匹占卡卧厘叁叚古台史吃吉哈哩唇喆嘉囱地坏基堃堡士夏大夫奇姆威媪安尼山州廉式彷彼德悦愠户才托拉拔拿捝提揾敚料斯昆曼服朗杜柏核格梳棁森椀概榅模比氲沈沙治法波活涚淮淼温游湛滑澂灶烈煴特犇率珍理瑟甘甦甯田痴皂瞭碟碧礆祇福私秘程税筦米粽絜耑脱腽艾芙芝芬茵荷菉葱蒀藉蜕西覆路辛迪迺邨里金阪雯露高鼠龢𪟖𪷓𫒡𫜦丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰻞',
+    'hk2t': '才核煙丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+    'jp2t': '䀋丁世供侠係俊保個値倶偏停先克兎典内冗凶刹削匀包卑却厠反合向呉呪唇唱喜嘆嘘回固坪塡奉姉委姫宜害寧展峰州差希帳幻庄床延弦張彦役御心息悦憶戒戸扇才技抵拍拘控掴援携放散族昇晋暖暗暴曁枯査格棄楡模死殿母氷汚決没注浸消涛混溌溶漂炎焔煙燥猫獲班産用甲留略畵疎痺皐眼知砺税稜竃範粉粧粽純絶練繋群義考聡背舎舖舗英茘莱葱蝉裕補諭謙講謝贋踏輌迫退送途連遊運選郭酢醗量鋭阻障隣集雇風飛食駈高鬪鼈丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+    's2hk': '了仇仿佛俊修借僵克兑具冢冬凌出刮制匯千升卜卧卷叁只台吃合吊同向吣呆周咽哄唇啓啟喂噪回困囱坐坯堤夫奸妍妝姍姜娘媪它家寧局峯巨布席幸幺庵弦強彝彩御志念恆恤悦愈愠戚户扇才扎托扣折抵拐拿挨挽捆捍捝揾搜敚斤斫旋昆暗曲札朱杆杯松板果柏栗核梁棁榅檗欲氲沈沖沾泛注浚涚温溪漓澄灶焰煴牀狸玩琅璇症痴皂矩硷礦私秋秘税穎穗筱粽糊系累線緼繡羣耇胄背胡脱腽臘致舍芸苔葱蒀蒙蔑藤藴蜕衞表詠證谷豆豔象輼酸醖雕面韻麪鼇𪜎𪞝𪟎𪟝𪠀𪠟𪠡𪠳𪠵𪠸𪠺𪠽𪡀𪡃𪡋𪡏𪡛𪡞𪡺𪢌𪢐𪢒𪢕𪢖𪢠𪢮𪢸𪣆𪣒𪣻𪤄𪤚𪥠𪥫𪥰𪥿𪧀𪧘𪨊𪨗𪨧𪨩𪨶𪨷𪨹𪩇𪩎𪩘𪩛𪩷𪩸𪪏𪪑𪪞𪪴𪪼𪫌𪫡𪫷𪫺𪬚𪬯𪭝𪭢𪭧𪭯𪭵𪭾𪮃𪮋𪮖𪮳𪮶𪯋𪰶𪱥𪱷𪲎𪲔𪲛𪲮𪳍𪳗𪴙𪵑𪵣𪵱𪶄𪶒𪶮𪷍𪷽𪸕𪸩𪹀𪹠𪹳𪹹𪺣𪺪𪺭𪺷𪺸𪺻𪺽𪻐𪻨𪻲𪻺𪼋𪼴𪽈𪽝𪽪𪽭𪽮𪽴𪽷𪾔𪾢𪾣𪾦𪾸𪿊𪿞𪿫𪿵𫀌𫀓𫀨𫀬𫀮𫁂𫁟𫁡𫁱𫁲𫁳𫁷𫁺𫂃𫂆𫂈𫂖𫂿𫃗𫄙𫄚𫄛𫄜𫄝𫄞𫄟𫄠𫄡𫄢𫄣𫄤𫄥𫄦𫄧𫄨𫄩𫄪𫄫𫄬𫄭𫄮𫄯𫄰𫄱𫄲𫄳𫄴𫄵𫄶𫄷𫄸𫄹𫅅𫅗𫅥𫅭𫅼𫆏𫆝𫆫𫇘𫇛𫇪𫇭𫇴𫇽𫈉𫈎𫈟𫈵𫉁𫉄𫊪𫊮𫊸𫊹𫊻𫋇𫋌𫋲𫋷𫋹𫋻𫌀𫌇𫌋𫌨𫌪𫌫𫌬𫌭𫌯𫍐𫍙𫍚𫍛𫍜𫍝𫍞𫍟𫍠𫍡𫍢𫍣𫍤𫍥𫍦𫍧𫍨𫍩𫍪𫍫𫍬𫍭𫍮𫍯𫍰𫍱𫍲𫍳𫍴𫍵𫍶𫍷𫍸𫍹𫍺𫍻𫍼𫍽𫍾𫍿𫎆𫎌𫎦𫎧𫎨𫎩𫎪𫎫𫎬𫎭𫎱𫎳𫎸𫎺𫏃𫏆𫏋𫏌𫏐𫏑𫏕𫏞𫏨𫐄𫐅𫐆𫐇𫐈𫐉𫐊𫐋𫐌𫐍𫐎𫐏𫐐𫐑𫐒𫐓𫐔𫐕𫐖𫐗𫐘𫐙𫐷𫑘𫑡𫑷𫓥𫓦𫓧𫓨𫓩𫓪𫓫𫓬𫓭𫓮𫓯𫓰𫓱𫓲𫓳𫓴𫓵𫓶𫓷𫓸𫓹𫓺𫓻𫓼𫓽𫓾𫓿𫔀𫔁𫔂𫔃𫔄𫔅𫔆𫔇𫔈𫔉𫔊𫔋𫔌𫔍𫔎𫔏𫔐𫔑𫔒𫔓𫔔𫔕𫔖𫔭𫔮𫔯𫔰𫔲𫔴𫔵𫔶𫔽𫕚𫕥𫕨𫖃𫖅𫖇𫖑𫖒𫖓𫖔𫖕𫖖𫖪𫖫𫖬𫖭𫖮𫖯𫖰𫖱𫖲𫖳𫖴𫖵𫖶𫖷𫖸𫖹𫖺𫗇𫗈𫗉𫗊𫗋𫗚𫗞𫗟𫗠𫗡𫗢𫗣𫗤𫗥𫗦𫗧𫗨𫗩𫗪𫗫𫗬𫗭𫗮𫗯𫗰𫗱𫗳𫗴𫗵𫘛𫘜𫘝𫘞𫘟𫘠𫘡𫘣𫘤𫘥𫘦𫘧𫘨𫘩𫘪𫘫𫘬𫘭𫘮𫘯𫘰𫘱𫘽𫙂𫚈𫚉𫚊𫚋𫚌𫚍𫚎𫚏𫚐𫚑𫚒𫚓𫚔𫚕𫚖𫚗𫚘𫚙𫚚𫚛𫚜𫚝𫚞𫚟𫚠𫚡𫚢𫚣𫚤𫚥𫚦𫚧𫚨𫚩𫚪𫚫𫚬𫚭𫛚𫛛𫛜𫛝𫛞𫛟𫛠𫛡𫛢𫛣𫛤𫛥𫛦𫛧𫛨𫛩𫛪𫛫𫛬𫛭𫛮𫛯𫛰𫛱𫛲𫛳𫛴𫛵𫛶𫛷𫛸𫛹𫛺𫛻𫛼𫛽𫛾𫜀𫜁𫜂𫜃𫜄𫜅𫜊𫜑𫜒𫜓𫜔𫜕𫜙𫜟𫜨𫜩𫜪𫜫𫜬𫜭𫜮𫜯𫜰𫜲𫜳𫝈𫝋𫝦𫝧𫝨𫝩𫝪𫝫𫝬𫝭𫝮𫝵𫞅𫞗𫞚𫞛𫞝𫞠𫞡𫞢𫞣𫞥𫞦𫞧𫞨𫞩𫞷𫟃𫟄𫟅𫟆𫟇𫟑𫟕𫟞𫟟𫟠𫟡𫟢𫟤𫟥𫟦𫟫𫟬𫟲𫟳𫟴𫟵𫟶𫟷𫟸𫟹𫟺𫟻𫟼𫟽𫟾𫟿𫠀𫠁𫠂𫠅𫠆𫠇𫠈𫠊𫠋𫠌𫠏𫠐𫠑𫠒𫠖𫠜𫢸𫧃𫧮𫫇𫬐𫭟𫭢𫭼𫮃𫰛𫵷𫶇𫷷𫸩𬀩𬀪𬂩𬃊𬇕𬇙𬇹𬉼𬊈𬊤𬍛𬍡𬍤𬒈𬒗𬕂𬘓𬘘𬘡𬘩𬘫𬘬𬘭𬘯𬙂𬙊𬙋𬜬𬜯𬞟𬟁𬟽𬣙𬣞𬣡𬣳𬤇𬤊𬤝𬨂𬨎𬩽𬪩𬬩𬬭𬬮𬬱𬬸𬬹𬬻𬬿𬭁𬭊𬭎𬭚𬭛𬭤𬭩𬭬𬭭𬭯𬭳𬭶𬭸𬭼𬮱𬮿𬯀𬯎𬱖𬱟𬳵𬳶𬳽𬳿𬴂𬴃𬴊𬶋𬶍𬶏𬶐𬶟𬶠𬶨𬶭𬶮𬷕𬸘𬸚𬸣𬸦𬸪𬸯𬹼𬺈𬺓丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰬸𰰨𰶎𰻝𰾄𰾭𱊜',
+    's2hkp': '·丁丹了亞仇件仿伊伍伯何佛作來俄俊修借傑僵光克兑內具冢冬凌凱出列利刮制務匯千升博卜卡卧卷叁只台史吃合吉吊同向吣呆周咽哄哈唇啓啟喂喬噪回因困囱圖坎坐坯堤塞多大夫奇奎奸妍妝姆姍姜威娘媪存它家寧尼局山岡峯州巨布席帶幸幺幾庵廉弗弦強彝彩彼得御德志念恆恤恩悦愈愠懷戚户扇才扎托扣折抵拉拐拿挨挽捆捍捝揾搜操敚文斤斫斯於旋昆暗曲曼服朗本札朱杆杭杯松板林果柏栗核格梁梅條棁森概榅標檗欲歇歷氲沃沈沖治沾法泛注浚涚温湯溪漓澄澤灶焰煴爾牀特狸率玩琅琳瑟璇畢症痴皂皮盤矩硷礦福私秋科秘程税穎穗筱簡米粽糊系約納索累絲維線編緼繡羅羣耇肖胄背胡脱腽臘致舍舒艾芬芸苔莫華萊葱蒀蒂蒙蔑蕾薩藤藴蘭蜕衞表裏西詠詹諾證谷豆豔象貝贊輼迪通道遜邁酸醖金阿隆隱雕雷霍面韻魯麥麪鼇鼠𪜎𪞝𪟎𪟝𪠀𪠟𪠡𪠳𪠵𪠸𪠺𪠽𪡀𪡃𪡋𪡏𪡛𪡞𪡺𪢌𪢐𪢒𪢕𪢖𪢠𪢮𪢸𪣆𪣒𪣻𪤄𪤚𪥠𪥫𪥰𪥿𪧀𪧘𪨊𪨗𪨧𪨩𪨶𪨷𪨹𪩇𪩎𪩘𪩛𪩷𪩸𪪏𪪑𪪞𪪴𪪼𪫌𪫡𪫷𪫺𪬚𪬯𪭝𪭢𪭧𪭯𪭵𪭾𪮃𪮋𪮖𪮳𪮶𪯋𪰶𪱥𪱷𪲎𪲔𪲛𪲮𪳍𪳗𪴙𪵑𪵣𪵱𪶄𪶒𪶮𪷍𪷽𪸕𪸩𪹀𪹠𪹳𪹹𪺣𪺪𪺭𪺷𪺸𪺻𪺽𪻐𪻨𪻲𪻺𪼋𪼴𪽈𪽝𪽪𪽭𪽮𪽴𪽷𪾔𪾢𪾣𪾦𪾸𪿊𪿞𪿫𪿵𫀌𫀓𫀨𫀬𫀮𫁂𫁟𫁡𫁱𫁲𫁳𫁷𫁺𫂃𫂆𫂈𫂖𫂿𫃗𫄙𫄚𫄛𫄜𫄝𫄞𫄟𫄠𫄡𫄢𫄣𫄤𫄥𫄦𫄧𫄨𫄩𫄪𫄫𫄬𫄭𫄮𫄯𫄰𫄱𫄲𫄳𫄴𫄵𫄶𫄷𫄸𫄹𫅅𫅗𫅥𫅭𫅼𫆏𫆝𫆫𫇘𫇛𫇪𫇭𫇴𫇽𫈉𫈎𫈟𫈵𫉁𫉄𫊪𫊮𫊸𫊹𫊻𫋇𫋌𫋲𫋷𫋹𫋻𫌀𫌇𫌋𫌨𫌪𫌫𫌬𫌭𫌯𫍐𫍙𫍚𫍛𫍜𫍝𫍞𫍟𫍠𫍡𫍢𫍣𫍤𫍥𫍦𫍧𫍨𫍩𫍪𫍫𫍬𫍭𫍮𫍯𫍰𫍱𫍲𫍳𫍴𫍵𫍶𫍷𫍸𫍹𫍺𫍻𫍼𫍽𫍾𫍿𫎆𫎌𫎦𫎧𫎨𫎩𫎪𫎫𫎬𫎭𫎱𫎳𫎸𫎺𫏃𫏆𫏋𫏌𫏐𫏑𫏕𫏞𫏨𫐄𫐅𫐆𫐇𫐈𫐉𫐊𫐋𫐌𫐍𫐎𫐏𫐐𫐑𫐒𫐓𫐔𫐕𫐖𫐗𫐘𫐙𫐷𫑘𫑡𫑷𫓥𫓦𫓧𫓨𫓩𫓪𫓫𫓬𫓭𫓮𫓯𫓰𫓱𫓲𫓳𫓴𫓵𫓶𫓷𫓸𫓹𫓺𫓻𫓼𫓽𫓾𫓿𫔀𫔁𫔂𫔃𫔄𫔅𫔆𫔇𫔈𫔉𫔊𫔋𫔌𫔍𫔎𫔏𫔐𫔑𫔒𫔓𫔔𫔕𫔖𫔭𫔮𫔯𫔰𫔲𫔴𫔵𫔶𫔽𫕚𫕥𫕨𫖃𫖅𫖇𫖑𫖒𫖓𫖔𫖕𫖖𫖪𫖫𫖬𫖭𫖮𫖯𫖰𫖱𫖲𫖳𫖴𫖵𫖶𫖷𫖸𫖹𫖺𫗇𫗈𫗉𫗊𫗋𫗚𫗞𫗟𫗠𫗡𫗢𫗣𫗤𫗥𫗦𫗧𫗨𫗩𫗪𫗫𫗬𫗭𫗮𫗯𫗰𫗱𫗳𫗴𫗵𫘛𫘜𫘝𫘞𫘟𫘠𫘡𫘣𫘤𫘥𫘦𫘧𫘨𫘩𫘪𫘫𫘬𫘭𫘮𫘯𫘰𫘱𫘽𫙂𫚈𫚉𫚊𫚋𫚌𫚍𫚎𫚏𫚐𫚑𫚒𫚓𫚔𫚕𫚖𫚗𫚘𫚙𫚚𫚛𫚜𫚝𫚞𫚟𫚠𫚡𫚢𫚣𫚤𫚥𫚦𫚧𫚨𫚩𫚪𫚫𫚬𫚭𫛚𫛛𫛜𫛝𫛞𫛟𫛠𫛡𫛢𫛣𫛤𫛥𫛦𫛧𫛨𫛩𫛪𫛫𫛬𫛭𫛮𫛯𫛰𫛱𫛲𫛳𫛴𫛵𫛶𫛷𫛸𫛹𫛺𫛻𫛼𫛽𫛾𫜀𫜁𫜂𫜃𫜄𫜅𫜊𫜑𫜒𫜓𫜔𫜕𫜙𫜟𫜨𫜩𫜪𫜫𫜬𫜭𫜮𫜯𫜰𫜲𫜳𫝈𫝋𫝦𫝧𫝨𫝩𫝪𫝫𫝬𫝭𫝮𫝵𫞅𫞗𫞚𫞛𫞝𫞠𫞡𫞢𫞣𫞥𫞦𫞧𫞨𫞩𫞷𫟃𫟄𫟅𫟆𫟇𫟑𫟕𫟞𫟟𫟠𫟡𫟢𫟤𫟥𫟦𫟫𫟬𫟲𫟳𫟴𫟵𫟶𫟷𫟸𫟹𫟺𫟻𫟼𫟽𫟾𫟿𫠀𫠁𫠂𫠅𫠆𫠇𫠈𫠊𫠋𫠌𫠏𫠐𫠑𫠒𫠖𫠜𫢸𫧃𫧮𫫇𫬐𫭟𫭢𫭼𫮃𫰛𫵷𫶇𫷷𫸩𬀩𬀪𬂩𬃊𬇕𬇙𬇹𬉼𬊈𬊤𬍛𬍡𬍤𬒈𬒗𬕂𬘓𬘘𬘡𬘩𬘫𬘬𬘭𬘯𬙂𬙊𬙋𬜬𬜯𬞟𬟁𬟽𬣙𬣞𬣡𬣳𬤇𬤊𬤝𬨂𬨎𬩽𬪩𬬩𬬭𬬮𬬱𬬸𬬹𬬻𬬿𬭁𬭊𬭎𬭚𬭛𬭤𬭩𬭬𬭭𬭯𬭳𬭶𬭸𬭼𬮱𬮿𬯀𬯎𬱖𬱟𬳵𬳶𬳽𬳿𬴂𬴃𬴊𬶋𬶍𬶏𬶐𬶟𬶠𬶨𬶭𬶮𬷕𬸘𬸚𬸣𬸦𬸪𬸯𬹼𬺈𬺓丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰬸𰰨𰶎𰻝𰾄𰾭𱊜',
+    's2t': '了仇仿佛俊修借僵克具冢冬凌出刮制千升卜卷只合吊同向吣呆周咽哄喂噪回困坐坯堤夫奸姜娘它家局巨布席幸庵弦彩御志念恤愈戚扇才扎托扣折抵拐拿挨挽捆捍搜斤斫旋昆暗曲札朱杆杯松板果栗核梁棱檗欲沈沾泛注浚溪漓澄焰狸玩琅璇症矩硷私秋穗筱糊系累耇胄背胡致舍芸苔蒙蔑藤表谷豆象酸雕面𪜎𪞝𪟎𪟝𪠀𪠟𪠡𪠳𪠵𪠸𪠺𪠽𪡀𪡃𪡋𪡏𪡛𪡞𪡺𪢌𪢐𪢒𪢕𪢖𪢠𪢮𪢸𪣆𪣒𪣻𪤄𪤚𪥠𪥫𪥰𪥿𪧀𪧘𪨊𪨗𪨧𪨩𪨶𪨷𪨹𪩇𪩎𪩘𪩛𪩷𪩸𪪏𪪑𪪞𪪴𪪼𪫌𪫡𪫷𪫺𪬚𪬯𪭝𪭢𪭧𪭯𪭵𪭾𪮃𪮋𪮖𪮳𪮶𪯋𪰶𪱥𪱷𪲎𪲔𪲛𪲮𪳍𪳗𪴙𪵑𪵣𪵱𪶄𪶒𪶮𪷍𪷽𪸕𪸩𪹀𪹠𪹳𪹹𪺣𪺪𪺭𪺷𪺸𪺻𪺽𪻐𪻨𪻲𪻺𪼋𪼴𪽈𪽝𪽪𪽭𪽮𪽴𪽷𪾔𪾢𪾣𪾦𪾸𪿊𪿞𪿫𪿵𫀌𫀓𫀨𫀬𫀮𫁂𫁟𫁡𫁱𫁲𫁳𫁷𫁺𫂃𫂆𫂈𫂖𫂿𫃗𫄙𫄚𫄛𫄜𫄝𫄞𫄟𫄠𫄡𫄢𫄣𫄤𫄥𫄦𫄧𫄨𫄩𫄪𫄫𫄬𫄭𫄮𫄯𫄰𫄱𫄲𫄳𫄴𫄵𫄶𫄷𫄸𫄹𫅅𫅗𫅥𫅭𫅼𫆏𫆝𫆫𫇘𫇛𫇪𫇭𫇴𫇽𫈉𫈎𫈟𫈵𫉁𫉄𫊪𫊮𫊸𫊹𫊻𫋇𫋌𫋲𫋷𫋹𫋻𫌀𫌇𫌋𫌨𫌪𫌫𫌬𫌭𫌯𫍐𫍙𫍚𫍛𫍜𫍝𫍞𫍟𫍠𫍡𫍢𫍣𫍤𫍥𫍦𫍧𫍨𫍩𫍪𫍫𫍬𫍭𫍮𫍯𫍰𫍱𫍲𫍳𫍴𫍵𫍶𫍷𫍸𫍹𫍺𫍻𫍼𫍽𫍾𫍿𫎆𫎌𫎦𫎧𫎨𫎩𫎪𫎫𫎬𫎭𫎱𫎳𫎸𫎺𫏃𫏆𫏋𫏌𫏐𫏑𫏕𫏞𫏨𫐄𫐅𫐆𫐇𫐈𫐉𫐊𫐋𫐌𫐍𫐎𫐏𫐐𫐑𫐒𫐓𫐔𫐕𫐖𫐗𫐘𫐙𫐷𫑘𫑡𫑷𫓥𫓦𫓧𫓨𫓩𫓪𫓫𫓬𫓭𫓮𫓯𫓰𫓱𫓲𫓳𫓴𫓵𫓶𫓷𫓸𫓹𫓺𫓻𫓼𫓽𫓾𫓿𫔀𫔁𫔂𫔃𫔄𫔅𫔆𫔇𫔈𫔉𫔊𫔋𫔌𫔍𫔎𫔏𫔐𫔑𫔒𫔓𫔔𫔕𫔖𫔭𫔮𫔯𫔰𫔲𫔴𫔵𫔶𫔽𫕚𫕥𫕨𫖃𫖅𫖇𫖑𫖒𫖓𫖔𫖕𫖖𫖪𫖫𫖬𫖭𫖮𫖯𫖰𫖱𫖲𫖳𫖴𫖵𫖶𫖷𫖸𫖹𫖺𫗇𫗈𫗉𫗊𫗋𫗚𫗞𫗟𫗠𫗡𫗢𫗣𫗤𫗥𫗦𫗧𫗨𫗩𫗪𫗫𫗬𫗭𫗮𫗯𫗰𫗱𫗳𫗴𫗵𫘛𫘜𫘝𫘞𫘟𫘠𫘡𫘣𫘤𫘥𫘦𫘧𫘨𫘩𫘪𫘫𫘬𫘭𫘮𫘯𫘰𫘱𫘽𫙂𫚈𫚉𫚊𫚋𫚌𫚍𫚎𫚏𫚐𫚑𫚒𫚓𫚔𫚕𫚖𫚗𫚘𫚙𫚚𫚛𫚜𫚝𫚞𫚟𫚠𫚡𫚢𫚣𫚤𫚥𫚦𫚧𫚨𫚩𫚪𫚫𫚬𫚭𫛚𫛛𫛜𫛝𫛞𫛟𫛠𫛡𫛢𫛣𫛤𫛥𫛦𫛧𫛨𫛩𫛪𫛫𫛬𫛭𫛮𫛯𫛰𫛱𫛲𫛳𫛴𫛵𫛶𫛷𫛸𫛹𫛺𫛻𫛼𫛽𫛾𫜀𫜁𫜂𫜃𫜄𫜅𫜊𫜑𫜒𫜓𫜔𫜕𫜙𫜟𫜨𫜩𫜪𫜫𫜬𫜭𫜮𫜯𫜰𫜲𫜳𫝈𫝋𫝦𫝧𫝨𫝩𫝪𫝫𫝬𫝭𫝮𫝵𫞅𫞗𫞚𫞛𫞝𫞠𫞡𫞢𫞣𫞥𫞦𫞧𫞨𫞩𫞷𫟃𫟄𫟅𫟆𫟇𫟑𫟕𫟞𫟟𫟠𫟡𫟢𫟤𫟥𫟦𫟫𫟬𫟲𫟳𫟴𫟵𫟶𫟷𫟸𫟹𫟺𫟻𫟼𫟽𫟾𫟿𫠀𫠁𫠂𫠅𫠆𫠇𫠈𫠊𫠋𫠌𫠏𫠐𫠑𫠒𫠖𫠜𫢸𫧃𫧮𫫇𫬐𫭟𫭢𫭼𫮃𫰛𫵷𫶇𫷷𫸩𬀩𬀪𬂩𬃊𬇕𬇙𬇹𬉼𬊈𬊤𬍛𬍡𬍤𬒈𬒗𬕂𬘓𬘘𬘡𬘩𬘫𬘬𬘭𬘯𬙂𬙊𬙋𬜬𬜯𬞟𬟁𬟽𬣙𬣞𬣡𬣳𬤇𬤊𬤝𬨂𬨎𬩽𬪩𬬩𬬭𬬮𬬱𬬸𬬹𬬻𬬿𬭁𬭊𬭎𬭚𬭛𬭤𬭩𬭬𬭭𬭯𬭳𬭶𬭸𬭼𬮱𬮿𬯀𬯎𬱖𬱟𬳵𬳶𬳽𬳿𬴂𬴃𬴊𬶋𬶍𬶏𬶐𬶟𬶠𬶨𬶭𬶮𬷕𬸘𬸚𬸣𬸦𬸪𬸯𬹼𬺈𬺓丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰬸𰰨𰶎𰻝𰾄𰾭𱊜',
+    's2tw': '了仇仿佛俊修借僵克具冢冬凌出刮制千升卜卷只吃合吊同向吣呆周咽哄唇喂噪回困坐坯堤夫奸姜娘它家局峰巨布席幸床庵弦彩御志念恤愈戚扇才扎托扣折抵拐拿挨挽捆捍搜斤斫旋昆暗曲札朱杆杯松板果栗核梁檗欲沈沾泛注浚溪漓澄灶焰狸玩琅璇症痴皂矩硷私秋秘穗筱粽糊系累群耇胄背胡致舍芸苔蒙蔑藤表谷豆象酸雕面麼𪜎𪞝𪟎𪟝𪠀𪠟𪠡𪠳𪠵𪠸𪠺𪠽𪡀𪡃𪡋𪡏𪡛𪡞𪡺𪢌𪢐𪢒𪢕𪢖𪢠𪢮𪢸𪣆𪣒𪣻𪤄𪤚𪥠𪥫𪥰𪥿𪧀𪧘𪨊𪨗𪨧𪨩𪨶𪨷𪨹𪩇𪩎𪩘𪩛𪩷𪩸𪪏𪪑𪪞𪪴𪪼𪫌𪫡𪫷𪫺𪬚𪬯𪭝𪭢𪭧𪭯𪭵𪭾𪮃𪮋𪮖𪮳𪮶𪯋𪰶𪱥𪱷𪲎𪲔𪲛𪲮𪳍𪳗𪴙𪵑𪵣𪵱𪶄𪶒𪶮𪷍𪷽𪸕𪸩𪹀𪹠𪹳𪹹𪺣𪺪𪺭𪺷𪺸𪺻𪺽𪻐𪻨𪻲𪻺𪼋𪼴𪽈𪽝𪽪𪽭𪽮𪽴𪽷𪾔𪾢𪾣𪾦𪾸𪿊𪿞𪿫𪿵𫀌𫀓𫀨𫀬𫀮𫁂𫁟𫁡𫁱𫁲𫁳𫁷𫁺𫂃𫂆𫂈𫂖𫂿𫃗𫄙𫄚𫄛𫄜𫄝𫄞𫄟𫄠𫄡𫄢𫄣𫄤𫄥𫄦𫄧𫄨𫄩𫄪𫄫𫄬𫄭𫄮𫄯𫄰𫄱𫄲𫄳𫄴𫄵𫄶𫄷𫄸𫄹𫅅𫅗𫅥𫅭𫅼𫆏𫆝𫆫𫇘𫇛𫇪𫇭𫇴𫇽𫈉𫈎𫈟𫈵𫉁𫉄𫊪𫊮𫊸𫊹𫊻𫋇𫋌𫋲𫋷𫋹𫋻𫌀𫌇𫌋𫌨𫌪𫌫𫌬𫌭𫌯𫍐𫍙𫍚𫍛𫍜𫍝𫍞𫍟𫍠𫍡𫍢𫍣𫍤𫍥𫍦𫍧𫍨𫍩𫍪𫍫𫍬𫍭𫍮𫍯𫍰𫍱𫍲𫍳𫍴𫍵𫍶𫍷𫍸𫍹𫍺𫍻𫍼𫍽𫍾𫍿𫎆𫎌𫎦𫎧𫎨𫎩𫎪𫎫𫎬𫎭𫎱𫎳𫎸𫎺𫏃𫏆𫏋𫏌𫏐𫏑𫏕𫏞𫏨𫐄𫐅𫐆𫐇𫐈𫐉𫐊𫐋𫐌𫐍𫐎𫐏𫐐𫐑𫐒𫐓𫐔𫐕𫐖𫐗𫐘𫐙𫐷𫑘𫑡𫑷𫓥𫓦𫓧𫓨𫓩𫓪𫓫𫓬𫓭𫓮𫓯𫓰𫓱𫓲𫓳𫓴𫓵𫓶𫓷𫓸𫓹𫓺𫓻𫓼𫓽𫓾𫓿𫔀𫔁𫔂𫔃𫔄𫔅𫔆𫔇𫔈𫔉𫔊𫔋𫔌𫔍𫔎𫔏𫔐𫔑𫔒𫔓𫔔𫔕𫔖𫔭𫔮𫔯𫔰𫔲𫔴𫔵𫔶𫔽𫕚𫕥𫕨𫖃𫖅𫖇𫖑𫖒𫖓𫖔𫖕𫖖𫖪𫖫𫖬𫖭𫖮𫖯𫖰𫖱𫖲𫖳𫖴𫖵𫖶𫖷𫖸𫖹𫖺𫗇𫗈𫗉𫗊𫗋𫗚𫗞𫗟𫗠𫗡𫗢𫗣𫗤𫗥𫗦𫗧𫗨𫗩𫗪𫗫𫗬𫗭𫗮𫗯𫗰𫗱𫗳𫗴𫗵𫘛𫘜𫘝𫘞𫘟𫘠𫘡𫘣𫘤𫘥𫘦𫘧𫘨𫘩𫘪𫘫𫘬𫘭𫘮𫘯𫘰𫘱𫘽𫙂𫚈𫚉𫚊𫚋𫚌𫚍𫚎𫚏𫚐𫚑𫚒𫚓𫚔𫚕𫚖𫚗𫚘𫚙𫚚𫚛𫚜𫚝𫚞𫚟𫚠𫚡𫚢𫚣𫚤𫚥𫚦𫚧𫚨𫚩𫚪𫚫𫚬𫚭𫛚𫛛𫛜𫛝𫛞𫛟𫛠𫛡𫛢𫛣𫛤𫛥𫛦𫛧𫛨𫛩𫛪𫛫𫛬𫛭𫛮𫛯𫛰𫛱𫛲𫛳𫛴𫛵𫛶𫛷𫛸𫛹𫛺𫛻𫛼𫛽𫛾𫜀𫜁𫜂𫜃𫜄𫜅𫜊𫜑𫜒𫜓𫜔𫜕𫜙𫜟𫜨𫜩𫜪𫜫𫜬𫜭𫜮𫜯𫜰𫜲𫜳𫝈𫝋𫝦𫝧𫝨𫝩𫝪𫝫𫝬𫝭𫝮𫝵𫞅𫞗𫞚𫞛𫞝𫞠𫞡𫞢𫞣𫞥𫞦𫞧𫞨𫞩𫞷𫟃𫟄𫟅𫟆𫟇𫟑𫟕𫟞𫟟𫟠𫟡𫟢𫟤𫟥𫟦𫟫𫟬𫟲𫟳𫟴𫟵𫟶𫟷𫟸𫟹𫟺𫟻𫟼𫟽𫟾𫟿𫠀𫠁𫠂𫠅𫠆𫠇𫠈𫠊𫠋𫠌𫠏𫠐𫠑𫠒𫠖𫠜𫢸𫧃𫧮𫫇𫬐𫭟𫭢𫭼𫮃𫰛𫵷𫶇𫷷𫸩𬀩𬀪𬂩𬃊𬇕𬇙𬇹𬉼𬊈𬊤𬍛𬍡𬍤𬒈𬒗𬕂𬘓𬘘𬘡𬘩𬘫𬘬𬘭𬘯𬙂𬙊𬙋𬜬𬜯𬞟𬟁𬟽𬣙𬣞𬣡𬣳𬤇𬤊𬤝𬨂𬨎𬩽𬪩𬬩𬬭𬬮𬬱𬬸𬬹𬬻𬬿𬭁𬭊𬭎𬭚𬭛𬭤𬭩𬭬𬭭𬭯𬭳𬭶𬭸𬭼𬮱𬮿𬯀𬯎𬱖𬱟𬳵𬳶𬳽𬳿𬴂𬴃𬴊𬶋𬶍𬶏𬶐𬶟𬶠𬶨𬶭𬶮𬷕𬸘𬸚𬸣𬸦𬸪𬸯𬹼𬺈𬺓丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰬸𰰨𰶎𰻝𰾄𰾭𱊜',
+    's2twp': '-BLNPQSU·丁上下丙並中串丹主久乍乙也了二互亞交亨京亮人什仇他仙代令以件任仿伊伍伯佈位佐何佛作來例便係俄俊保信修借偉停備傳像僵價儀優儲元先光克免入內全公共具兼冊冒冢冬凌凡凱出函分切列別利刮制刷刻則前創力加努勃動務勞勳化區千升半博卜卡印危卵卷卸厄參口古句只叫可史司吃合吉吊同名向吣吧吸呆周呼命和咽哄哈員哥唇唐問喂單喱噁器噪囊回因困固國圖團土在圭地址坎坐坦坯型埃城域執基堤報場塊塔塞壁壓士夏外多大天太夫奇奎奔套奧奶奸姜威娘子孕字存孤學它安宏官定客室家寄密實寧審寫寶射尋對導尼局居屏展層屬岡峰島嵌州巢巨巴布希帕席帶年幸幾床序度庫庵康廉建式引弗弦強彙彩彪後得御循徵德心志念性恤恩息愈意感態應懷戊成戚截戰戶房所扇才扎打托扣找技抑折抵抽拉拋拐拷拿持指挖挨挽捆捍捲掘掛採接控提插換損搜摩摸撒撲撾擊操據擬擴攜效散數文料斤斫斯新斷方於施旋日旺昂昆明易星映時普晶暗暫曲曼替最有服朗期本札朱杆杭杯松板析林枚果柄柏查柳栗核格框桑梁梅梗條棍棧森極概構標模機檔檗欄權欣欲歇歐正步歷歸死段殺比毛氏民氧氨汀求沃沈沙沾法泛波注洛津洪活浚浦海涅消涼淨添清源溪溫滯滾漓演潔澄澤激灶烏無焰熱營爾片物特狸獨獲率玩珀琅理瑙瑟瑪璇環瓜瓦產用由甲界留略異當疆疫病症痛痴發白皂的皮盤盧目省眉看真眠睡矢知矩短硷碼示禁福私秋科秘租移程稿穀穆穗穢空突窗立童端符第筱算管節範簡米粘粽糊系約紅納紙級索累細紹終組結絡絲綁經綜維網綴線編緩縮總繫缺罕置羅美群義老耇耶聖聯聲肖肯胄背胞胡胺能脫腕腦腳腸腺自致臺舌舍航艾芬芯花芸苄苔英茨茲莫菜華菲萊萬蒂蒙蓬蓮蔑薩藍藤處虛蛋血行術表裝製複西視角解觸言計訊記訪設註詞試話認語調論諾識護谷豆象貝貼賴贊超路蹦軟載輔轉辨迪通速造連進運過道達遜適選邁那部鄰酋配酚酮酸釋重量金針銷錄鍵鏈鏡鐘長門閃開間閘關阿限陷隊雅集雕雲雷電霍面韋頁項預頓頭頻類顫顯飛首香馬馳驅體高魯鮑麥麼黑默鼠𪜎𪞝𪟎𪟝𪠀𪠟𪠡𪠳𪠵𪠸𪠺𪠽𪡀𪡃𪡋𪡏𪡛𪡞𪡺𪢌𪢐𪢒𪢕𪢖𪢠𪢮𪢸𪣆𪣒𪣻𪤄𪤚𪥠𪥫𪥰𪥿𪧀𪧘𪨊𪨗𪨧𪨩𪨶𪨷𪨹𪩇𪩎𪩘𪩛𪩷𪩸𪪏𪪑𪪞𪪴𪪼𪫌𪫡𪫷𪫺𪬚𪬯𪭝𪭢𪭧𪭯𪭵𪭾𪮃𪮋𪮖𪮳𪮶𪯋𪰶𪱥𪱷𪲎𪲔𪲛𪲮𪳍𪳗𪴙𪵑𪵣𪵱𪶄𪶒𪶮𪷍𪷽𪸕𪸩𪹀𪹠𪹳𪹹𪺣𪺪𪺭𪺷𪺸𪺻𪺽𪻐𪻨𪻲𪻺𪼋𪼴𪽈𪽝𪽪𪽭𪽮𪽴𪽷𪾔𪾢𪾣𪾦𪾸𪿊𪿞𪿫𪿵𫀌𫀓𫀨𫀬𫀮𫁂𫁟𫁡𫁱𫁲𫁳𫁷𫁺𫂃𫂆𫂈𫂖𫂿𫃗𫄙𫄚𫄛𫄜𫄝𫄞𫄟𫄠𫄡𫄢𫄣𫄤𫄥𫄦𫄧𫄨𫄩𫄪𫄫𫄬𫄭𫄮𫄯𫄰𫄱𫄲𫄳𫄴𫄵𫄶𫄷𫄸𫄹𫅅𫅗𫅥𫅭𫅼𫆏𫆝𫆫𫇘𫇛𫇪𫇭𫇴𫇽𫈉𫈎𫈟𫈵𫉁𫉄𫊪𫊮𫊸𫊹𫊻𫋇𫋌𫋲𫋷𫋹𫋻𫌀𫌇𫌋𫌨𫌪𫌫𫌬𫌭𫌯𫍐𫍙𫍚𫍛𫍜𫍝𫍞𫍟𫍠𫍡𫍢𫍣𫍤𫍥𫍦𫍧𫍨𫍩𫍪𫍫𫍬𫍭𫍮𫍯𫍰𫍱𫍲𫍳𫍴𫍵𫍶𫍷𫍸𫍹𫍺𫍻𫍼𫍽𫍾𫍿𫎆𫎌𫎦𫎧𫎨𫎩𫎪𫎫𫎬𫎭𫎱𫎳𫎸𫎺𫏃𫏆𫏋𫏌𫏐𫏑𫏕𫏞𫏨𫐄𫐅𫐆𫐇𫐈𫐉𫐊𫐋𫐌𫐍𫐎𫐏𫐐𫐑𫐒𫐓𫐔𫐕𫐖𫐗𫐘𫐙𫐷𫑘𫑡𫑷𫓥𫓦𫓧𫓨𫓩𫓪𫓫𫓬𫓭𫓮𫓯𫓰𫓱𫓲𫓳𫓴𫓵𫓶𫓷𫓸𫓹𫓺𫓻𫓼𫓽𫓾𫓿𫔀𫔁𫔂𫔃𫔄𫔅𫔆𫔇𫔈𫔉𫔊𫔋𫔌𫔍𫔎𫔏𫔐𫔑𫔒𫔓𫔔𫔕𫔖𫔭𫔮𫔯𫔰𫔲𫔴𫔵𫔶𫔽𫕚𫕥𫕨𫖃𫖅𫖇𫖑𫖒𫖓𫖔𫖕𫖖𫖪𫖫𫖬𫖭𫖮𫖯𫖰𫖱𫖲𫖳𫖴𫖵𫖶𫖷𫖸𫖹𫖺𫗇𫗈𫗉𫗊𫗋𫗚𫗞𫗟𫗠𫗡𫗢𫗣𫗤𫗥𫗦𫗧𫗨𫗩𫗪𫗫𫗬𫗭𫗮𫗯𫗰𫗱𫗳𫗴𫗵𫘛𫘜𫘝𫘞𫘟𫘠𫘡𫘣𫘤𫘥𫘦𫘧𫘨𫘩𫘪𫘫𫘬𫘭𫘮𫘯𫘰𫘱𫘽𫙂𫚈𫚉𫚊𫚋𫚌𫚍𫚎𫚏𫚐𫚑𫚒𫚓𫚔𫚕𫚖𫚗𫚘𫚙𫚚𫚛𫚜𫚝𫚞𫚟𫚠𫚡𫚢𫚣𫚤𫚥𫚦𫚧𫚨𫚩𫚪𫚫𫚬𫚭𫛚𫛛𫛜𫛝𫛞𫛟𫛠𫛡𫛢𫛣𫛤𫛥𫛦𫛧𫛨𫛩𫛪𫛫𫛬𫛭𫛮𫛯𫛰𫛱𫛲𫛳𫛴𫛵𫛶𫛷𫛸𫛹𫛺𫛻𫛼𫛽𫛾𫜀𫜁𫜂𫜃𫜄𫜅𫜊𫜑𫜒𫜓𫜔𫜕𫜙𫜟𫜨𫜩𫜪𫜫𫜬𫜭𫜮𫜯𫜰𫜲𫜳𫝈𫝋𫝦𫝧𫝨𫝩𫝪𫝫𫝬𫝭𫝮𫝵𫞅𫞗𫞚𫞛𫞝𫞠𫞡𫞢𫞣𫞥𫞦𫞧𫞨𫞩𫞷𫟃𫟄𫟅𫟆𫟇𫟑𫟕𫟞𫟟𫟠𫟡𫟢𫟤𫟥𫟦𫟫𫟬𫟲𫟳𫟴𫟵𫟶𫟷𫟸𫟹𫟺𫟻𫟼𫟽𫟾𫟿𫠀𫠁𫠂𫠅𫠆𫠇𫠈𫠊𫠋𫠌𫠏𫠐𫠑𫠒𫠖𫠜𫢸𫧃𫧮𫫇𫬐𫭟𫭢𫭼𫮃𫰛𫵷𫶇𫷷𫸩𬀩𬀪𬂩𬃊𬇕𬇙𬇹𬉼𬊈𬊤𬍛𬍡𬍤𬒈𬒗𬕂𬘓𬘘𬘡𬘩𬘫𬘬𬘭𬘯𬙂𬙊𬙋𬜬𬜯𬞟𬟁𬟽𬣙𬣞𬣡𬣳𬤇𬤊𬤝𬨂𬨎𬩽𬪩𬬩𬬭𬬮𬬱𬬸𬬹𬬻𬬿𬭁𬭊𬭎𬭚𬭛𬭤𬭩𬭬𬭭𬭯𬭳𬭶𬭸𬭼𬮱𬮿𬯀𬯎𬱖𬱟𬳵𬳶𬳽𬳿𬴂𬴃𬴊𬶋𬶍𬶏𬶐𬶟𬶠𬶨𬶭𬶮𬷕𬸘𬸚𬸣𬸦𬸪𬸯𬹼𬺈𬺓丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰬸𰰨𰶎𰻝𰾄𰾭𱊜',
+    't2hk': '匯只台吃啓啟妍妝姍寧峯幺強彝恆柏沖温牀礦穎線繡羣臘藴衞詠證豔韻麪鼇丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+    't2jp': '丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+    't2s': '么仝俱像叚哩喆坏堃彷椀沈淼澂犇甦甯瞭礆祇筦絜耑菉藉衹覆迺邨阪龢𪟖𪷓𫒡𫜦丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰻞',
+    't2tw': '麼丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+    'tw2s': '仝俱像叚吃哩唇喆坏堃峰床彷才核梁椀沈淼澂灶犇甦甯痴皂瞭礆祇秘筦粽絜群耑菉藉衹覆迺邨阪龢𪟖𪷓𫒡𫜦丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰻞',
+    'tw2sp': 'ABCDELMNPQSW·丁三上下中串丹主乃乏乙乳互京人介他仝代令件伊伯伺位佛作佳使例保俱候停像元充先光克免入全公共冷凡出函分列利别制前副割力勃勒勘包化匹千半卓南卡印即卵厄原及取叚口叫叮可台史司吃合吉同名吐向吸告呼命和咖哈哥哩唇唐喆器囊圈土地坏垂型埃域基堃塔塞增士夏外多大天太夫失奈契套好妥始威子字存孟安宏宕定宣室密寮射小尚尤尼尾展山岸峰州巢工巨巴布希帕帛席幕平年床序度康廉建式引弗形彩彭影彷彼微德心快性悌患感慧戴房才托技拉指捷排探接控提援摩攻效散敦整文料斯新方旋日昆明映普晶智曼替最有服朗本札朵杜束板析林柏查柯核格案桌梁梅梗梭棒森椀槽模次欣歇止正步母比氏民氧永汀汶汽沈沙治法泡波泰流海淼清游湘源滑演澂激灌灶然片牙物特犇率珍班球理琉瑞瑟瓜瓦甘生甦用甯由疫症痴登白皂的目直相真眠睡瞭破碟磁礆示祇福科秘程稽穆空突窗立端符第筦算簿米粽素索絜缺罕置美群老者耑肌肯胺腕自航色艾芬芳茅荀荷菉菲萍落葛蒂蒲薛藉融血行衣表衹西覆解言象赫超路跳踏躁身辛迦迺通速造道遮那邨部都酚酸里重金阪防阿除隆隧雅集雷霍露非面音食首高麻默鼠龢𪟖𪷓𫒡𫜦丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀𰻞',
+    'tw2t': '梁丽丸乁𠄢你侮侻倂偺備僧像㒞𠘺免兔兤具𠔜㒹內再𠕋冗冤仌冬况𩇟凵刃㓟刻剆割剷㔕勇勉勤勺包匆北卉卑博即卽卿卿卿𠨬灰及叟𠭣叫叱吆咞吸呈周咢哶唐啓啣善善喙喫喳嗂圖嘆圗噑噴切壮城埴堍型堲報墬𡓤売壷夆多夢奢𡚨𡛪姬娛娧姘婦㛮㛼嬈嬾嬾𡧈寃寘寧寳𡬘寿将当尢㞁屠屮峀岍𡷤嵃𡷦嵮嵫嵼巡巢㠯巽帨帽幩㡢𢆃㡼庰庳庶廊𪎒廾𢌱𢌱舁弢弢㣇𣊸𦇚形彫㣣徚忍志忹悁㤺㤜悔𢛔惇慈慌慎慌慺憎憲憤憯懞懲懶成戛扝抱拔捐𢬌挽拼捨掃揤𢯱搢揅掩㨮摩摾撝摷㩬敏敬𣀊旣書晉㬙暑㬈㫤冒冕最暜肭䏙朗望朡杞杓𣏃㭉柺枅桒梅𣑭梎栟椔㮝楂榣槪檨𣚣櫛㰘次𣢧歔㱎歲殟殺殻𣪍𡴋𣫺汎𣲼沿泍汧洖派海流浩浸涅𣴞洴港湮㴳滋滇𣻑淹潮𣽞𣾎濆瀹瀞瀛㶖灊災灷炭𠔥煅𤉣熜𤎫爨爵牐𤘈犀犕𤜵𤠔獺王㺬玥㺸㺸瑇瑜瑱璅瓊㼛甤𤰶甾𤲒異𢆟瘐𤾡𤾸𥁄㿼䀈直𥃳𥃲𥄙𥄳眞真真睊䀹瞋䁆䂖𥐝硎碌磌䃣𥘦祖𥚚𥛅福秫䄯穀穊穏𥥼𥪧𥪧竮䈂𥮫篆築䈧𥲀糒䊠糨糣紀𥾆絣䌁緇縂繅䌴𦈨𦉇䍙𦋙罺𦌾羕翺者𦓚𦔣聠𦖨聰𣍟䏕育脃䐋脾媵𦞧𦞵𣎓𣎜舁舄辞䑫芑芋芝劳花芳芽苦𦬼若茝荣莭茣莽菧著荓菊菌菜𦰶𦵫𦳕䔫蓱蓳蔖𧏊蕤𦼬䕝䕡𦾱𧃒䕫虐虜虧虩蚩蚈蜎蛢蝹蜨蝫螆䗗蟡蠁䗹衠衣𧙧裗裞䘵裺㒻𧢮𧥦䚾䛇誠諭變豕𧲨貫賁贛起𧼯𠠄跋趼跰𠣞軔輸𨗒𨗭邔郱鄑𨜮鄛鈸鋗鋘鉼鏹鐕𨯺開䦕閷𨵷䧦雃嶲霣𩅅𩈚䩮䩶韠𩐊䪲𩒖頋頋頩𩖶飢䬳餩馧駂駾䯎𩬰鬒鱀鳽䳎䳭鵧𪃎䳸𪄅𪈎𪊑麻䵖黹黾鼅鼏鼖鼻𪘀',
+}
+
+
+class opencc_converter:
+    """
+    OpenCC 转换器：每个转换配置（t2s、tw2sp、hk2s、s2t…）在进程中只加载一次。
+    第一次使用时，逐字转换一遍常用的 Unicode 区段，再加上 OPENCC_PHRASE_CHARS 中只在词组里才会被转换的字符，得到会被转换的字符集
+    （保存在 cache_dir 中，下次启动时直接读取）；文本中没有这些字符时（如已经是简体的文本）直接跳过转换。
+    OPENCC_PHRASE_CHARS 中没有的转换配置（如自定义的配置文件）在标准错误中提示一次，不跳过任何文本。
+    """
+    def __init__(self, profile: str = 't2s', cache_dir: str = ''):
+        self.profile = profile
+        self._cc = None
+        if profile:
+            import opencc
+            self._cc = opencc.OpenCC(profile)
+            self._version = getattr(opencc, '__version__', '')
+        self._cache_file = os.path.join(cache_dir, f'opencc_{profile}.json') if cache_dir and profile else ''
+        self._trigger_chars = None
+        self._trigger_ready = False
+
+    # 会被转换的字符集；不知道转换配置的词组字符时为 None
+    @property
+    def trigger_chars(self):
+        if not self._trigger_ready:
+            self._trigger_chars = self._load_trigger_chars()
+            if self._trigger_chars is None:
+                self._trigger_chars = self._build_trigger_chars()
+                if self._trigger_chars is not None:
+                    self._save_trigger_chars()
+            self._trigger_ready = True
+        return self._trigger_chars
+
+    def _build_trigger_chars(self):
+        phrase_chars = self._phrase_chars()
+        if phrase_chars is None:
+            print(f'提示：没有转换配置 {self.profile} 的词组字符，所有文本都会进行繁简转换（速度较慢，结果不受影响）',
+                  file=sys.stderr)
+            return None
+        chars = [chr(c) for start, end in OPENCC_CHAR_RANGES for c in range(start, end + 1)]
+        converted = self._cc.convert('\n'.join(chars)).split('\n')
+        return frozenset(c for c, new_c in zip(chars, converted) if c != new_c) | frozenset(phrase_chars)
+
+    # OPENCC_PHRASE_CHARS 中的词组字符（转换配置可以带 .json 后缀），没有时返回 None
+    def _phrase_chars(self):
+        return OPENCC_PHRASE_CHARS.get(self.profile[:-5] if self.profile.endswith('.json') else self.profile)
+
+    # 缓存的字符集与 OpenCC 版本、字符区段及词组字符对应，任何一个改变后重新生成
+    def _cache_key(self) -> list:
+        return [self.profile, self._version, OPENCC_CHAR_RANGES, self._phrase_chars()]
+
+    def _load_trigger_chars(self):
+        if not self._cache_file:
+            return None
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['key'] == json.loads(json.dumps(self._cache_key())):
+                return frozenset(cached['chars'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _save_trigger_chars(self):
+        if not self._cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            cached = {'key': self._cache_key(), 'chars': ''.join(sorted(self._trigger_chars))}
+            write_chunks(self._cache_file, [json.dumps(cached, ensure_ascii=False)], encoding='utf-8')
+        except OSError:
+            pass
+
+    # 文本中是否含有需要转换的字符
+    def needs_convert(self, text: str) -> bool:
+        if self._cc is None:
+            return False
+        chars = self.trigger_chars
+        return chars is None or not chars.isdisjoint(text)
+
+    def convert(self, text: str) -> str:
+        return self._cc.convert(text) if self.needs_convert(text) else text
+
+    # 逐行转换：文件中一旦出现需要转换的字符，之后的所有行都完整转换，保证词组转换（如“乾燥”）不会漏掉
+    def convert_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        lines = iter(lines)
+        for line in lines:
+            if self.needs_convert(line):
+                yield self._cc.convert(line)
+                break
+            yield line
+        yield from map(self._cc.convert, lines) if self._cc is not None else lines
+
+
+# 已加载的 OpenCC 转换器，按转换配置缓存
+_opencc_converters = {}
+
+
+# 获取指定配置的 OpenCC 转换器（进程内共享），cache_dir 为保存字符集的缓存文件夹
+def get_converter(profile: str = 't2s', cache_dir: str = '') -> opencc_converter:
+    converter = _opencc_converters.get(profile)
+    if converter is None:
+        converter = _opencc_converters[profile] = opencc_converter(profile, cache_dir)
+    return converter
+
 
 # 繁体转简体
-def tw2cn(content: str) -> str:
-    # 繁体转简体
-    cc = OpenCC('t2s')  # 繁体转简体
-    return cc.convert(content)
+def tw2cn(content: str, profile: str = 't2s') -> str:
+    # 繁体转简体，已经是简体的文本直接返回
+    return get_converter(profile).convert(content)
 
 
 # 判断所给的文件路径是否为文件或文件夹，如果是需要处理的文件，则添加到列表中；否则遍历该文件夹，添加所有需要类型的文件到列表中
@@ -107,6 +566,8 @@ def find_files(file_path: str, type_lst) -> list:
 
     elif os.path.isdir(file_path):
         for root, dirs, files in os.walk(file_path):
+            # 跳过按章节拆分的输出文件夹
+            dirs[:] = [d for d in dirs if not d.endswith('_已处理' + NOVEL_SPLIT_SUFFIX)]
             try:
                 for file in files:
                     _, ext = os.path.splitext(file)
@@ -119,22 +580,43 @@ def find_files(file_path: str, type_lst) -> list:
     return input_files
 
 # 读取配置文件
+# 同一进程中按 (路径, 修改时间, 大小) 缓存，sub_process 和 novel_process 共用同一次解析的结果（只读）
+_yaml_configs = {}
+
+
 def read_yaml_config(config_file='config.yml'):
     # 是否存在config.yml文件：
-    if os.path.exists(config_file):  # 检查文件是否存在
-        try:
-            yaml_config = yaml.load(open(config_file, 'r', encoding='utf-8'), Loader=yaml.FullLoader)
-            return yaml_config
-        
-        except yaml.YAMLError:
-            print(f"错误：'{config_file}' 不是一个有效的YAML文件。\n")
-            return ''
-        except Exception as e:
-            print(f"错误：'{config_file}' 读取失败：{e}\n")
-            return ''
-    else:
+    try:
+        st = os.stat(config_file)
+    except OSError:
         return ''
         # print(f"警告：没有或未找到配置文件：{self.config_file}\n")
+    key = (os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+    if key not in _yaml_configs:
+        _yaml_configs[key] = load_yaml_config(config_file)
+    return _yaml_configs[key]
+
+
+def load_yaml_config(config_file: str):
+    import yaml
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            # 安装了 libyaml 时使用 C 实现的解析器
+            return yaml.load(f, Loader=getattr(yaml, 'CFullLoader', yaml.FullLoader))
+    except yaml.YAMLError:
+        print(f"错误：'{config_file}' 不是一个有效的YAML文件。\n")
+        return ''
+    except Exception as e:
+        print(f"错误：'{config_file}' 读取失败：{e}\n")
+        return ''
+
+
+# 返回缓存文件夹：配置中的 cache_dir 优先，否则使用用户的缓存目录；配置为空字符串时不使用缓存
+def get_cache_dir(cache_dir=None) -> str:
+    if cache_dir is not None:
+        return os.path.expanduser(str(cache_dir)) if cache_dir else ''
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'subtitle_process')
 
 
 # 判断执行的环境，将当前工作目录修改为可执行文件所在的目录
@@ -153,62 +635,891 @@ def change_to_exe_dir():
 ############################## 公共函数结束 ############################
 
 
+############################## 时间轴处理函数 ############################
+# 时间统一使用整数毫秒表示，避免 datetime 的解析和格式化开销
+
+# 将 SRT（00:00:39,560）或 ASS（0:00:39.56）格式的时间字符串转换为整数毫秒
+def time_to_ms(time_str: str) -> int:
+    hms, _, frac = time_str.strip().replace(',', '.').partition('.')
+    h, m, s = hms.split(':')
+    # 小数部分按位数换算：1位为1/10秒，2位为厘秒，3位为毫秒
+    ms = int(frac[:3].ljust(3, '0')) if frac else 0
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + ms
+
+
+# 将整数毫秒格式化为 SRT 时间：HH:MM:SS,mmm（小时超过两位时原样保留）
+def ms_to_srt_time(ms: int) -> str:
+    ms = max(ms, 0)
+    s, ms = divmod(ms, 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f'{h:02d}:{m:02d}:{s:02d},{ms:03d}'
+
+
+# 将整数毫秒格式化为 ASS 时间：H:MM:SS.cc（厘秒四舍五入）
+def ms_to_ass_time(ms: int) -> str:
+    cs = (max(ms, 0) + 5) // 10
+    s, cs = divmod(cs, 100)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f'{h:d}:{m:02d}:{s:02d}.{cs:02d}'
+
+
+############################## 时间轴批量调整 ############################
+# 字幕按批（最多 CUE_BATCH_SIZE 条）解析后，开始、结束时间分别存放在整数数组中，
+# 平移、帧率转换、最短/最长持续时间、重叠修正等调整对整批的时间数组各执行一次
+CUE_BATCH_SIZE = 4096
+# SRT 字幕转为 ASS 时使用的 Style 及 Name、MarginL、MarginR、MarginV、Effect 字段
+DEFAULT_STYLE = 'Default'
+DEFAULT_FIELDS = ',0,0,0,'
+# 批量不小于该条数且安装了 NumPy 时使用 NumPy 计算
+NUMPY_MIN_BATCH = 256
+# 常见的 NTSC 帧率写法对应的精确值
+NTSC_FRAMERATES = {23.976: 24000 / 1001, 29.97: 30000 / 1001, 59.94: 60000 / 1001}
+
+_numpy = None
+
+
+# 按需导入 NumPy（可选依赖），未安装时返回 None
+def get_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class cue_batch:
+    """
+    一批字幕的列式存储（SRT 和 ASS 共用）：开始、结束时间（毫秒）和 Layer 为整数数组，其余各列为列表。
+    SRT 字幕使用默认的 Style 等字段；ASS 字幕保留原来的 Layer、Style、Name、边距和 Effect 字段，
+    pre 为该条字幕之前需要原样输出的其他行（如 Comment 行）。
+    """
+    __slots__ = ('starts', 'ends', 'texts', 'styles', 'layers', 'fields', 'pres')
+
+    def __init__(self):
+        self.starts = array('q')
+        self.ends = array('q')
+        self.texts = []     # 字幕文本，多行用 \n 分隔
+        self.styles = []
+        self.layers = array('l')
+        self.fields = []    # Name、MarginL、MarginR、MarginV、Effect 五个字段的原文
+        self.pres = []
+
+    def __len__(self):
+        return len(self.texts)
+
+    # cue 为 (开始时间, 结束时间, 文本, Style, Layer, 其他字段, 之前的其他行)
+    def append(self, start_ms: int, end_ms: int, text: str, style: str = DEFAULT_STYLE, layer: int = 0,
+               fields: str = DEFAULT_FIELDS, pre: str = ''):
+        self.starts.append(start_ms)
+        self.ends.append(end_ms)
+        self.texts.append(text)
+        self.styles.append(style)
+        self.layers.append(layer)
+        self.fields.append(fields)
+        self.pres.append(pre)
+
+    # 取出最后一条字幕，返回与 append 参数相同的元组
+    def pop(self) -> tuple:
+        return (self.starts.pop(), self.ends.pop(), self.texts.pop(), self.styles.pop(),
+                self.layers.pop(), self.fields.pop(), self.pres.pop())
+
+    def __iter__(self) -> Iterator[tuple]:
+        return zip(self.starts, self.ends, self.texts, self.styles, self.layers, self.fields, self.pres)
+
+
+class cue_timing:
+    """
+    字幕时间轴的调整，按以下顺序对整批字幕执行：
+    1. 帧率转换（fps_from -> fps_to）及整体平移 offset
+    2. 持续时间不足 min_duration 的延长，超过 max_duration 的截短
+    3. fix_overlap 时，结束时间晚于下一条字幕的开始时间（减去 min_gap）的提前结束，但持续时间不少于 min_duration（为0时不少于1毫秒）
+    merge_duplicates 为 True 时，在调整之前先合并相邻的重复字幕（见 sub_process.merge_cues）
+    """
+    def __init__(self, offset=0, fps_from=0, fps_to=0, min_duration=0, max_duration=7, fix_overlap=False, min_gap=0,
+                 merge_duplicates=False, merge_gap=0.2):
+        self.offset_ms = round(offset * 1000)
+        fps_from, fps_to = NTSC_FRAMERATES.get(fps_from, fps_from), NTSC_FRAMERATES.get(fps_to, fps_to)
+        # 字幕原来对应 fps_from 的视频，转换后对应 fps_to 的视频
+        self.scale = fps_from / fps_to if fps_from and fps_to else 1.0
+        self.min_ms = round(min_duration * 1000)
+        self.max_ms = round(max_duration * 1000)
+        self.fix_overlap = bool(fix_overlap)
+        self.gap_ms = round(min_gap * 1000)
+        self.merge_duplicates = bool(merge_duplicates)
+        self.merge_gap_ms = round(merge_gap * 1000)
+
+    # 从配置文件的 timing 部分生成，max_duration 沿用原来的配置项
+    @classmethod
+    def from_config(cls, config: dict, max_duration=7):
+        keys = ('offset', 'fps_from', 'fps_to', 'min_duration', 'fix_overlap', 'min_gap', 'merge_duplicates', 'merge_gap')
+        return cls(max_duration=max_duration, **{k: config[k] for k in keys if config.get(k) is not None})
+
+    def settings(self) -> list:
+        return [self.offset_ms, self.scale, self.min_ms, self.max_ms, self.fix_overlap, self.gap_ms,
+                self.merge_duplicates, self.merge_gap_ms]
+
+    # 单个时间的帧率转换及平移
+    def shift_ms(self, ms: int) -> int:
+        if self.scale != 1.0:
+            ms = round(ms * self.scale)
+        return ms + self.offset_ms
+
+    # 调整一批字幕的时间；next_start 为下一批第一条字幕的原始开始时间（用于重叠修正），没有下一批时为 None
+    def apply(self, batch: cue_batch, next_start: int = None):
+        if not batch.texts:
+            return
+        if next_start is not None:
+            next_start = self.shift_ms(next_start)
+        np = get_numpy() if len(batch) >= NUMPY_MIN_BATCH else None
+        if np is not None:
+            self._apply_numpy(np, batch, next_start)
+            return
+
+        starts, ends = batch.starts, batch.ends
+        if self.scale != 1.0:
+            scale = self.scale
+            starts = array('q', [round(t * scale) for t in starts])
+            ends = array('q', [round(t * scale) for t in ends])
+        if self.offset_ms:
+            offset = self.offset_ms
+            starts = array('q', [t + offset for t in starts])
+            ends = array('q', [t + offset for t in ends])
+        if self.min_ms > 0:
+            min_ms = self.min_ms
+            ends = array('q', [e if e - s >= min_ms else s + min_ms for s, e in zip(starts, ends)])
+        if self.max_ms > 0:
+            max_ms = self.max_ms
+            ends = array('q', [e if e - s <= max_ms else s + max_ms for s, e in zip(starts, ends)])
+        if self.fix_overlap:
+            # 只和开始时间更晚的下一条比较：同时出现的多行字幕（如 ASS 中不同位置的字幕）不做修改
+            gap, floor = self.gap_ms, max(self.min_ms, 1)
+            nexts = itertools.chain(itertools.islice(starts, 1, None), (starts[-1] if next_start is None else next_start,))
+            ends = array('q', [min(e, max(s + floor, n - gap)) if n > s else e for s, e, n in zip(starts, ends, nexts)])
+        batch.starts, batch.ends = starts, ends
+
+    # 与 apply 相同的计算，使用 NumPy 的数组运算
+    def _apply_numpy(self, np, batch: cue_batch, next_start: int):
+        starts = np.frombuffer(batch.starts, dtype=np.int64)
+        ends = np.frombuffer(batch.ends, dtype=np.int64)
+        if self.scale != 1.0:
+            # np.rint 与 round 相同，都是四舍六入五成双
+            starts = np.rint(starts * self.scale).astype(np.int64)
+            ends = np.rint(ends * self.scale).astype(np.int64)
+        if self.offset_ms:
+            starts = starts + self.offset_ms
+            ends = ends + self.offset_ms
+        if self.min_ms > 0:
+            ends = np.maximum(ends, starts + self.min_ms)
+        if self.max_ms > 0:
+            ends = np.minimum(ends, starts + self.max_ms)
+        if self.fix_overlap:
+            nexts = np.append(starts[1:], starts[-1] if next_start is None else next_start)
+            limits = np.maximum(starts + max(self.min_ms, 1), nexts - self.gap_ms)
+            ends = np.where(nexts > starts, np.minimum(ends, limits), ends)
+        batch.starts = array('q', starts.astype(np.int64).tobytes())
+        batch.ends = array('q', ends.astype(np.int64).tobytes())
+
+
+# 将 (开始时间, 结束时间, 文本, ...)（与 cue_batch.append 的参数相同）分批调整时间后逐批返回
+# 需要重叠修正时，每批的最后一条字幕留到下一批处理，以便和它的下一条比较
+def iter_timed_batches(cues: Iterable[tuple], timing: cue_timing, batch_size: int = CUE_BATCH_SIZE) -> Iterator[cue_batch]:
+    batch = cue_batch()
+    for cue in cues:
+        batch.append(*cue)
+        if len(batch) >= batch_size:
+            carry = batch.pop() if timing.fix_overlap else None
+            timing.apply(batch, carry[0] if carry else None)
+            yield batch
+            batch = cue_batch()
+            if carry:
+                batch.append(*carry)
+    if batch.texts:
+        timing.apply(batch)
+        yield batch
+
+
+
+############################## 字幕解析与输出 ############################
+# 解析出的字幕为 (开始时间, 结束时间, 文本各行, Style, Layer, 其他字段, 之前的其他行)，
+# 文本清理后与 cue_batch.append 的参数相同；SRT 和 ASS 共用同一套时间轴调整和输出
+
+# 解析 srt 内容，逐条返回字幕，时间轴不合法的字幕直接跳过
+def parse_srt(lines: Iterable[str]) -> Iterator[tuple]:
+    for seq, timing, text in iter_srt_blocks(lines):
+        # 提取开始和结束时间（整数毫秒），格式类似于 00:00:39,560 --> 00:00:43,830
+        times = SUB_TIME_RE.findall(timing)
+        if len(times) < 2:
+            continue
+        try:
+            start_ms, end_ms = time_to_ms(times[0]), time_to_ms(times[1])
+        except ValueError:
+            continue
+        yield start_ms, end_ms, text.splitlines(), DEFAULT_STYLE, 0, DEFAULT_FIELDS, ''
+
+
+# 逐行扫描 ass 文件头，返回 ({节名: [各行]}, [Events] 之后的各行)
+# 遇到 [Events] 节（跳过其 Format 行）或第一条 Dialogue 时停止，之后的行不读入内存
+def scan_ass_header(lines: Iterable[str]) -> Tuple[dict, Iterator[str]]:
+    lines = iter(lines)
+    sections = {}
+    current = None
+    for line in lines:
+        text = line.strip().lstrip('\ufeff')
+        if text.startswith('[') and text.endswith(']'):
+            if text[1:-1].strip().lower() == 'events':
+                return sections, skip_events_format(lines)
+            current = sections.setdefault(text[1:-1].strip(), [])
+        elif text.startswith('Dialogue:'):
+            return sections, itertools.chain((text + '\n',), lines)
+        elif text and current is not None:
+            current.append(text)
+    raise ValueError('不是有效的 ASS/SSA 文件！')
+
+
+# 跳过 [Events] 节的 Format 行（输出时统一使用 ASS 的格式）
+def skip_events_format(lines: Iterator[str]) -> Iterator[str]:
+    for line in lines:
+        if line.strip():
+            if not line.lstrip().startswith('Format:'):
+                yield line
+            break
+    yield from lines
+
+
+# Script Info 的项名、样式名等：'PlayResX: 1280' -> 'PlayResX'，'Style: Default,...' -> 'Style:Default'
+def ass_line_key(line: str) -> str:
+    key, sep, value = line.partition(':')
+    if key.strip() == 'Style':
+        return 'Style:' + value.split(',', 1)[0].strip()
+    return key.strip() if sep else line
+
+
+class ass_template:
+    """
+    解析后的 ASS 文件头：各节按顺序保存为 {节名: [各行]}，不含 [Events]（其 Format 行在输出时统一生成）。
+    配置的模板只解析一次；处理 ASS 文件时用 merge 与输入文件自己的文件头合并
+    """
+    EVENTS_FORMAT = 'Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text'
+    STYLE_SECTIONS = ('v4+ styles', 'v4 styles')
+    # 输出总是 ASS（v4.00+）格式，这些项使用模板中的值
+    TEMPLATE_INFO_KEYS = frozenset(['ScriptType'])
+
+    def __init__(self, sections: dict):
+        self.sections = sections
+        self._text = None
+
+    @classmethod
+    def parse(cls, text: str) -> 'ass_template':
+        sections, _ = scan_ass_header(text.splitlines())
+        return cls(sections)
+
+    # 样式节的名称（[V4+ Styles] 或 SSA 的 [V4 Styles]），没有时为 None
+    def style_section(self):
+        return next((name for name in self.sections if name.lower() in self.STYLE_SECTIONS), None)
+
+    # 样式节的 Format 行（忽略空格），用于判断两个文件的样式能否合并
+    def style_format(self) -> str:
+        lines = self.sections.get(self.style_section(), [])
+        return next((l.replace(' ', '') for l in lines if l.startswith('Format:')), '')
+
+    def merge(self, other: 'ass_template') -> 'ass_template':
+        """
+        合并输入文件的文件头，保留输入文件自己的样式：
+        输入文件的样式格式与模板相同时，使用输入文件的 Script Info（PlayResX/PlayResY 与样式大小、\\pos 等坐标对应，
+        ScriptType 除外）和样式，模板中有而输入文件中没有的样式补充在后面；
+        格式不同时（如 SSA 的 [V4 Styles]）使用模板的 Script Info 和样式。Fonts 等其他节原样保留
+        """
+        if not other.sections:
+            return self
+        sections = {}
+        name = self.style_section()
+        if name is not None and other.style_section() is not None and self.style_format() == other.style_format():
+            fixed = {ass_line_key(l): l for l in self.sections.get('Script Info', [])
+                     if ass_line_key(l) in self.TEMPLATE_INFO_KEYS}
+            info = [fixed.pop(ass_line_key(l), l) for l in other.sections.get('Script Info', [])]
+            sections['Script Info'] = list(fixed.values()) + info
+            styles = list(other.sections[other.style_section()])
+            keys = {ass_line_key(l) for l in styles}
+            sections[name] = styles + [l for l in self.sections[name]
+                                       if l.startswith('Style:') and ass_line_key(l) not in keys]
+        else:
+            sections['Script Info'] = self.sections.get('Script Info', [])
+            if name is not None:
+                sections[name] = self.sections[name]
+        skipped = {'script info'} | set(self.STYLE_SECTIONS)
+        for source in (other.sections, self.sections):
+            for name, lines in source.items():
+                if name.lower() not in skipped and name not in sections:
+                    sections[name] = lines
+        return ass_template(sections)
+
+    # 输出的文件头文本，以 [Events] 的 Format 行结束
+    def render(self) -> str:
+        if self._text is None:
+            parts = [f'[{name}]\n' + ''.join(l + '\n' for l in lines) for name, lines in self.sections.items()]
+            self._text = '\n'.join(parts + [f'[Events]\n{self.EVENTS_FORMAT}\n'])
+        return self._text
+
+
+# 默认的ASS文件头
+DEFAULT_ASS_TEMPLATE = ass_template.parse(ass_header)
+
+# 配置的模板ASS文件按 (路径, 修改时间, 大小) 缓存，只解析一次
+_ass_templates = {}
+
+
+# 读取模板ASS文件，没有有效的文件头时抛出 ValueError
+def load_ass_template(ass_file: str) -> ass_template:
+    st = os.stat(ass_file)
+    key = (os.path.abspath(ass_file), st.st_mtime_ns, st.st_size)
+    if key not in _ass_templates:
+        with open(ass_file, 'r', encoding='utf-8-sig') as f:
+            template = ass_template.parse(f.read())
+        if not template.sections:
+            raise ValueError(ass_file)
+        _ass_templates[key] = template
+    return _ass_templates[key]
+
+
+# 逐行解析 ass 内容，逐条返回字幕；格式行、Comment 行等非字幕行放入 raw，作为下一条字幕的 pre 输出
+def parse_ass(lines: Iterable[str], raw: List[str]) -> Iterator[tuple]:
+    for line in lines:
+        line = line.rstrip('\r\n')
+        m = ASS_DIALOGUE_RE.match(line)
+        if not m:
+            if line.strip():
+                raw.append(line + '\n')
+            continue
+        layer, start, end, style, fields, text = m.groups()
+        try:
+            start_ms, end_ms = time_to_ms(start), time_to_ms(end)
+        except ValueError:
+            continue
+        pre = ''.join(raw)
+        raw.clear()
+        # 同一文件中的 Style 等字段大多相同，共用同一个字符串对象
+        # ASS 文本常带 \N 手动换行
+        yield (start_ms, end_ms, text.replace(r'\N', '\n').splitlines(), sys.intern(style), int(layer or 0),
+               sys.intern(fields), pre)
+
+
+# 将一批字幕输出为 ASS 的 Dialogue 行
+def render_ass(batch: cue_batch) -> Iterator[str]:
+    for start_ms, end_ms, text, style, layer, fields, pre in batch:
+        text = text.replace('\n', r'\N')     # ASS中使用\N表示换行
+        yield f"{pre}Dialogue: {layer},{ms_to_ass_time(start_ms)},{ms_to_ass_time(end_ms)},{style},{fields},{text}\n"
+
+
+# 将一批字幕输出为 SRT 的字幕块，counter 为跨批次连续的序号
+def render_srt(batch: cue_batch, counter: Iterator[int]) -> Iterator[str]:
+    for start_ms, end_ms, text, *_ in batch:
+        n = next(counter)
+        # 块之间空一行
+        yield ('' if n == 1 else '\n\n') + f'{n}\n{ms_to_srt_time(start_ms)} --> {ms_to_srt_time(end_ms)}\n{text}'
+
+
+############################## 替换规则引擎 ############################
+# 正则表达式中的元字符
+REGEX_META_CHARS = frozenset('.^$*+?{}[]|()')
+
+
+# 如果正则表达式只是普通文本（不含元字符，只有 \. 这样的转义），则返回其对应的文本，否则返回 None
+def regex_literal(pattern: str):
+    chars = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            # \d、\n 等字母数字转义具有特殊含义，不视为普通文本
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            chars.append(pattern[i + 1])
+            i += 2
+            continue
+        if c in REGEX_META_CHARS:
+            return None
+        chars.append(c)
+        i += 1
+    return ''.join(chars)
+
+
+# 如果是形如 '.*98堂.*': '' 的整行删除规则，则返回其中的关键文本，否则返回 None
+def drop_line_literal(pattern: str, replacement: str):
+    if replacement != '':
+        return None
+    core = pattern[1:] if pattern.startswith('^') else pattern
+    core = core[:-1] if core.endswith('$') and not core.endswith('\\$') else core
+    if len(core) <= 4 or not core.startswith('.*') or not core.endswith('.*') or core.endswith('\\.*'):
+        return None
+    return regex_literal(core[2:-2]) or None
+
+
+class replace_rules:
+    """
+    替换规则引擎：在读取配置时一次性校验并编译 replacements / text_replacements 中的规则，结果与按配置顺序依次执行 re.sub 相同。
+    1. 整行删除规则（如 '.*98堂.*': ''）改为子串判断，连续的多条合并为一步；之前的规则不会产生或去掉其关键文本时，提前到最先执行；
+    2. 连续的纯文本规则合并为一个多选正则，一次扫描完成替换（只有一条时直接使用 str.replace）；
+    3. 其余规则预先编译，按配置中的顺序依次执行；
+    4. 语法错误的规则只在编译时报告一次，记录在 errors 中。
+    """
+    def __init__(self, rules: dict = None):
+        self.errors = []
+        # 每个步骤为 (类型, 参数1, 参数2)，类型为 'drops' / 'literal' / 'literals' / 'regex'
+        self.steps = []
+        # 每个步骤对应的配置中的原始规则（'literals' 步骤为 关键文本 -> 原始规则 的字典，'drops' 步骤为原始规则的列表），用于统计命中次数
+        self.step_keys = []
+        # _empty_stable[i] 为 True 表示从第 i 步开始，空字符串经过后续所有步骤仍为空
+        self._empty_stable = [True]
+        self.compile(rules or {})
+
+    def __bool__(self):
+        return bool(self.steps)
+
+    def compile(self, rules: dict):
+        literal_run = []    # 当前连续的纯文本规则
+        drop_run = []       # 当前连续的（不能提前执行的）整行删除规则
+        hoisted = []        # 提前到最先执行的整行删除规则
+        earlier = []        # 之前的规则 (纯文本关键词, 替换为)，正则规则及没有提前的删除规则的关键词为 None
+        for old_wd, new_wd in rules.items():
+            if not isinstance(old_wd, str) or not isinstance(new_wd, (str, int, float)):
+                self.errors.append(f"'{old_wd}': '{new_wd}' 不是有效的替换规则")
+                continue
+            new_wd = str(new_wd)
+            try:
+                pattern = re.compile(old_wd, flags=re.UNICODE)
+                pattern.sub(new_wd, '')     # 校验替换模板（如 \1）是否有效
+            except re.error as e:
+                self.errors.append(f"'{old_wd}'正则表达式语法错误: {e}")
+                continue
+
+            drop_word = drop_line_literal(old_wd, new_wd)
+            if drop_word:
+                if all(self._keeps_keyword(literal, new, drop_word) for literal, new in earlier):
+                    hoisted.append((drop_word, old_wd, pattern))
+                else:
+                    self._add_literal_run(literal_run)
+                    literal_run = []
+                    drop_run.append((drop_word, old_wd, pattern))
+                    earlier.append((None, ''))
+                continue
+
+            self._add_drop_run(drop_run)
+            drop_run = []
+            literal = regex_literal(old_wd)
+            if literal and '\\' not in new_wd:
+                if not all(self._is_independent(k, v, literal) for k, v, _ in literal_run):
+                    self._add_literal_run(literal_run)
+                    literal_run = []
+                literal_run.append((literal, new_wd, old_wd))
+                earlier.append((literal, new_wd))
+                continue
+
+            self._add_literal_run(literal_run)
+            literal_run = []
+            self.steps.append(('regex', pattern, new_wd))
+            self.step_keys.append(old_wd)
+            earlier.append((None, new_wd))
+        self._add_literal_run(literal_run)
+        self._add_drop_run(drop_run)
+        if hoisted:
+            self._add_drop_run(hoisted, index=0)
+
+        # 从后往前计算每一步之后空字符串是否保持为空，用于提前结束
+        self._empty_stable = [True] * (len(self.steps) + 1)
+        for i in range(len(self.steps) - 1, -1, -1):
+            self._empty_stable[i] = self._empty_stable[i + 1] and self._apply_step(self.steps[i], '') == ''
+
+    # 两条纯文本规则合并为一次扫描后，结果是否与依次替换相同：
+    # 关键词不能互相包含、首尾不能重叠；第一条的替换结果（与前后的文本一起）不能组成第二条的关键词
+    @staticmethod
+    def _is_independent(old1: str, new1: str, old2: str) -> bool:
+        if old1 in old2 or old2 in old1:
+            return False
+        for i in range(1, min(len(old1), len(old2))):
+            if old1.endswith(old2[:i]) or old2.endswith(old1[:i]):
+                return False
+        # 替换结果含有第二条关键词的字符，或替换为空后前后的文本拼接起来，都可能组成第二条的关键词
+        return set(new1).isdisjoint(old2) and (new1 != '' or len(old2) == 1)
+
+    # 纯文本规则 literal -> new 是否一定不会产生或去掉文本中的 keyword（literal 为 None 表示正则规则，无法判断）
+    @staticmethod
+    def _keeps_keyword(literal, new: str, keyword: str) -> bool:
+        if literal is None:
+            return False
+        # 关键词与规则的文本没有相同的字符，且替换为空时前后的文本不会拼成关键词
+        return set(literal).isdisjoint(keyword) and set(new).isdisjoint(keyword) and (new != '' or len(keyword) == 1)
+
+    def _add_literal_run(self, literal_run: list):
+        if len(literal_run) == 1:
+            self.steps.append(('literal', literal_run[0][0], literal_run[0][1]))
+            self.step_keys.append(literal_run[0][2])
+        elif literal_run:
+            mapping = {k: v for k, v, _ in literal_run}
+            pattern = re.compile('|'.join(re.escape(k) for k, _, _ in literal_run))
+            self.steps.append(('literals', pattern, mapping))
+            self.step_keys.append({k: old_wd for k, _, old_wd in literal_run})
+
+    # 连续的整行删除规则合为一步：先用所有关键文本的多选正则判断，单行文本包含任意一个关键文本时整行删除
+    def _add_drop_run(self, drop_run: list, index: int = None):
+        if not drop_run:
+            return
+        keyword_re = re.compile('|'.join(re.escape(w) for w, _, _ in drop_run))
+        step = ('drops', keyword_re, [(w, p) for w, _, p in drop_run])
+        keys = [old_wd for _, old_wd, _ in drop_run]
+        if index is None:
+            self.steps.append(step)
+            self.step_keys.append(keys)
+        else:
+            self.steps.insert(index, step)
+            self.step_keys.insert(index, keys)
+
+    @staticmethod
+    def _apply_step(step, text: str) -> str:
+        kind, arg1, arg2 = step
+        if kind == 'drops':
+            if not arg1.search(text):
+                return text
+            if '\n' in text:   # 多行文本时 .* 只删除所在行
+                for _, pattern in arg2:
+                    text = pattern.sub('', text)
+                return text
+            return ''
+        if kind == 'literal':
+            return text.replace(arg1, arg2)
+        if kind == 'literals':
+            return arg1.sub(lambda m: arg2[m.group(0)], text)
+        return arg1.sub(arg2, text)
+
+    def apply(self, text: str) -> str:
+        for i, step in enumerate(self.steps):
+            if not text and self._empty_stable[i]:
+                return ''
+            text = self._apply_step(step, text)
+        return text
+
+    # 与 apply 相同，同时在 hits 中累计每条规则（以配置中的原始写法为键）的命中次数，用于 --profile
+    def apply_counted(self, text: str, hits: dict) -> str:
+        for i, (kind, arg1, arg2) in enumerate(self.steps):
+            if not text and self._empty_stable[i]:
+                return ''
+            key = self.step_keys[i]
+            if kind == 'drops':
+                if not arg1.search(text):
+                    continue
+                if '\n' in text:
+                    for old_wd, (_, pattern) in zip(key, arg2):
+                        text, count = pattern.subn('', text)
+                        if count:
+                            hits[old_wd] = hits.get(old_wd, 0) + count
+                else:
+                    # 依次执行时由配置中第一条包含的规则删除
+                    old_wd = next(k for k, (w, _) in zip(key, arg2) if w in text)
+                    hits[old_wd] = hits.get(old_wd, 0) + 1
+                    text = ''
+                continue
+            if kind == 'literals':
+                def replace_counted(m, mapping=arg2, keys=key):
+                    old_wd = keys[m.group(0)]
+                    hits[old_wd] = hits.get(old_wd, 0) + 1
+                    return mapping[m.group(0)]
+                text = arg1.sub(replace_counted, text)
+                continue
+            if kind == 'literal':
+                count = text.count(arg1)
+                text = text.replace(arg1, arg2) if count else text
+            else:
+                text, count = arg1.subn(arg2, text)
+            if count:
+                hits[key] = hits.get(key, 0) + count
+        return text
+
+    # 配置中所有有效规则的原始写法
+    def rule_keys(self) -> List[str]:
+        keys = []
+        for key in self.step_keys:
+            keys.extend(key.values() if isinstance(key, dict) else key if isinstance(key, list) else [key])
+        return keys
+
+    # 打印编译时发现的无效规则
+    def report_errors(self, log=print):
+        for error in self.errors:
+            log(error)
+
+
+# 清理结果缓存的默认条数，以及参与缓存的行的最大长度（更长的行很少重复，直接处理）
+LINE_MEMO_SIZE = 65536
+LINE_MEMO_MAX_LEN = 100
+
+
+class line_memo:
+    """
+    逐行清理结果的有界 LRU 缓存，以原始行文本为键：语气词、“好的”、字幕组信息、卡拉OK的副歌等重复的行只清理一次。
+    属于处理对象，同一批处理中的所有文件共用；读取配置（替换规则）时重新创建。size 为 0 时不缓存。
+    --profile 时使用 counted：缓存中同时保存该行的替换规则命中次数，命中缓存时照样累计，与不缓存时的统计结果相同
+    """
+    def __init__(self, func, size: int = LINE_MEMO_SIZE, max_len: int = LINE_MEMO_MAX_LEN):
+        self.size = size
+        self.max_len = max_len
+        self._func = func
+        self._cached = functools.lru_cache(maxsize=size)(func) if size > 0 else None
+        self._counted = functools.lru_cache(maxsize=size)(self._run_counted) if size > 0 else None
+        self._profiler = None
+
+    def __call__(self, text: str) -> str:
+        if self._cached is None or len(text) > self.max_len:
+            return self._func(text)
+        return self._cached(text)
+
+    # 与 __call__ 相同，同时将替换规则的命中次数累计到 profiler 中（func 通过 profiler.apply_rules 执行替换规则）
+    def counted(self, text: str, profiler: 'stage_profiler') -> str:
+        if self._counted is None or len(text) > self.max_len:
+            return self._func(text)
+        self._profiler = profiler
+        result, hits = self._counted(text)
+        rule_hits = profiler.rule_hits
+        for key, n in hits:
+            rule_hits[key] = rule_hits.get(key, 0) + n
+        return result
+
+    # 执行 func，返回结果及这一行的规则命中次数
+    def _run_counted(self, text: str) -> tuple:
+        profiler = self._profiler
+        rule_hits, profiler.rule_hits = profiler.rule_hits, {}
+        try:
+            return self._func(text), tuple(profiler.rule_hits.items())
+        finally:
+            profiler.rule_hits = rule_hits
+
+    def clear(self):
+        if self._cached is not None:
+            self._cached.cache_clear()
+            self._counted.cache_clear()
+
+    # 命中次数、未命中次数、当前条数及命中率
+    def stats(self) -> dict:
+        if self._cached is None:
+            return {'hits': 0, 'misses': 0, 'entries': 0, 'hit_rate': 0.0}
+        infos = [self._cached.cache_info(), self._counted.cache_info()]
+        hits, misses = sum(i.hits for i in infos), sum(i.misses for i in infos)
+        total = hits + misses
+        return {'hits': hits, 'misses': misses, 'entries': sum(i.currsize for i in infos),
+                'hit_rate': round(hits / total, 4) if total else 0.0}
+
+
+
+
+############################## 性能统计 ############################
+class stage_profiler:
+    """
+    --profile 时的性能统计：记录每个阶段的耗时（秒，不含内层已统计的阶段）、各类计数以及替换规则的命中次数。
+    未开启时处理对象的 profiler 为 None，处理流程中只多一次判断。
+    """
+    def __init__(self):
+        self.times = {}
+        self.counts = {}
+        self.rule_hits = {}
+        self._accounted = 0.0   # 已经计入各阶段的总时间，用于扣除内层阶段的耗时
+
+    def add_time(self, stage: str, seconds: float):
+        self.times[stage] = self.times.get(stage, 0.0) + seconds
+        self._accounted += seconds
+
+    def count(self, name: str, n: int = 1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    # 记录处理一个文件期间清理结果缓存的命中和未命中次数，before 为开始时的 memo.stats()
+    def count_memo(self, memo: line_memo, before: dict):
+        after = memo.stats()
+        self.count('memo_hits', after['hits'] - before['hits'])
+        self.count('memo_misses', after['misses'] - before['misses'])
+
+    # 统计 with 语句块的耗时
+    @contextlib.contextmanager
+    def stage(self, stage: str):
+        start = time.perf_counter()
+        accounted = self._accounted
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start - (self._accounted - accounted))
+
+    # 包装迭代器，将每次取值的耗时计入 stage（流式处理时各阶段交替执行）
+    def iter(self, iterable: Iterable, stage: str) -> Iterator:
+        it = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            accounted = self._accounted
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - start - (self._accounted - accounted))
+            yield item
+
+    # 执行替换规则，同时统计耗时和每条规则的命中次数
+    def apply_rules(self, rules: replace_rules, text: str) -> str:
+        start = time.perf_counter()
+        text = rules.apply_counted(text, self.rule_hits)
+        self.add_time('replace', time.perf_counter() - start)
+        return text
+
+    def to_dict(self) -> dict:
+        return {
+            'times': {k: round(v, 6) for k, v in self.times.items()},
+            'counts': dict(self.counts),
+            'rule_hits': dict(self.rule_hits),
+        }
+
+
+# 将各个文件的性能统计汇总，写入 JSON 和 CSV 文件，返回汇总结果
+# rule_keys 为 {'sub': [...], 'novel': [...]}，用于列出一次都没有命中的规则
+def write_profile_report(results: List[dict], report_base: str, rule_keys: dict) -> dict:
+    total = {'times': {}, 'counts': {}, 'rule_hits': {kind: dict.fromkeys(keys, 0) for kind, keys in rule_keys.items()}}
+    files = []
+    for r in results:
+        profile = r.get('profile')
+        if not profile:
+            continue
+        files.append({'file': r['file'], 'kind': r.get('kind', ''), **profile})
+        for k, v in profile['times'].items():
+            total['times'][k] = round(total['times'].get(k, 0.0) + v, 6)
+        for k, v in profile['counts'].items():
+            total['counts'][k] = total['counts'].get(k, 0) + v
+        hits = total['rule_hits'].setdefault(r.get('kind', ''), {})
+        for k, v in profile['rule_hits'].items():
+            hits[k] = hits.get(k, 0) + v
+    total['unused_rules'] = {kind: [k for k, v in hits.items() if not v] for kind, hits in total['rule_hits'].items()}
+
+    with open(report_base + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'total': total, 'files': files}, f, ensure_ascii=False, indent=1)
+    # CSV：每个文件一行，列为各阶段耗时及计数
+    stages = sorted({k for item in files for k in item['times']})
+    counts = sorted({k for item in files for k in item['counts']})
+    import csv
+    with open(report_base + '.csv', 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['file', 'kind'] + [f'{k}_s' for k in stages] + counts)
+        for item in files:
+            writer.writerow([item['file'], item['kind']] + [item['times'].get(k, 0) for k in stages]
+                            + [item['counts'].get(k, 0) for k in counts])
+    return total
+
+
 class sub_process:
-    def __init__(self, is_srt2ass=True, config_file='config.yml'):
+    def __init__(self, is_srt2ass=True, config_file='config.yml', quiet: bool = False):
         self.is_srt2ass = is_srt2ass
-        self.ass_style = ass_header
+        # quiet 为 True 时读取配置时不打印提示信息（作为库使用时）
+        self.quiet = quiet
+        self.ass_template = DEFAULT_ASS_TEMPLATE
         self.config_file = config_file
 
         self.replace_words = {}
+        self.replace_rules = replace_rules()
+        # 清理结果缓存的条数（配置文件中的 line_memo_size），为0时不缓存
+        self.line_memo = line_memo(self._clean_line)
         self.max_duration = 7
-
-        # 当前正在处理的字幕文件：
+        # 时间轴调整（平移、帧率转换、持续时间、重叠修正）
+        self.timing = cue_timing()
+        self.cache_dir = get_cache_dir()
+        # OpenCC 转换配置，为空时不进行繁简转换
+        self.opencc_profile = 't2s'
+        # 是否记录各阶段的耗时等性能统计（--profile），开启时每个文件使用一个新的 stage_profiler
+        self.profile = False
+        self.profiler = None
+        # 写入输出文件后是否 fsync
+        self.fsync = False
+        # 输出文件的写入函数，批处理时可以替换为后台写入；后台写入时保存成功的信息先记在 saved_log 中，写入完成后再打印
+        self.writer = write_chunks
+        self.saved_log = None
+
+        # 当前正在处理的字幕文件及其输出文件，source_data 为预读的文件内容（没有时为 None）：
         self.current_file = ''
-        self.current_content = ''
+        self.source_data = None
+        self.result_path = ''
+        # 当前文件中清理后为空而删除的字幕条数、合并的重复字幕条数
+        self.cues_dropped = 0
+        self.cues_merged = 0
 
         # 从config_file中读取配置参数
         self.get_config()
 
+    # 打印提示信息，quiet 时不输出
+    def log(self, *args):
+        if not self.quiet:
+            print(*args)
+
+    # 打印保存成功的信息；后台写入时先记下，由 process_batch 在写入完成后打印
+    def log_saved(self, message: str):
+        if self.saved_log is None:
+            print(message)
+        else:
+            self.saved_log.append(message)
+
     # 读取配置文件
     def get_config(self):
         # 读取config.yml文件：
         yaml_config = read_yaml_config(self.config_file)
 
         if yaml_config:  # 检查是否为空
-            print(f'找到并将使用 配置文件：{self.config_file}')
+            self.log(f'找到并将使用 配置文件：{self.config_file}')
             # 读取 max_duration 的值
             self.max_duration = yaml_config.get("max_duration", 7)
-            print(f"max_duration: {self.max_duration}")
+            self.log(f"max_duration: {self.max_duration}")
+            self.timing = cue_timing.from_config(yaml_config.get("timing") or {}, self.max_duration)
+            # 缓存文件夹（编码检测结果等）
+            self.cache_dir = get_cache_dir(yaml_config.get("cache_dir"))
+            # 繁简转换配置（t2s、tw2sp、hk2s、s2t…）
+            self.opencc_profile = yaml_config.get("opencc_profile", 't2s') or ''
+            self.profile = bool(yaml_config.get("profile", False))
+            self.fsync = bool(yaml_config.get("fsync", False))
 
             # 读取配置文件中的替换字典，将整个section转为字典
-            self.replace_words = yaml_config.get("replacements", {})
+            self.replace_words = yaml_config.get("replacements", {}) or {}
             if self.replace_words:
-                print(f"找到并将使用 替换单词")
+                self.log("找到并将使用 替换单词")
             # for key, value in self.replace_words.items():
             #     print(f"替换单词：{key} -> {value}")
+            # 一次性编译替换规则，错误的规则只报告一次
+            self.replace_rules = replace_rules(self.replace_words)
+            self.replace_rules.report_errors(self.log)
+            # 替换规则改变后，之前缓存的清理结果失效
+            self.line_memo = line_memo(self._clean_line, int(yaml_config.get("line_memo_size", LINE_MEMO_SIZE) or 0))
 
             # 处理ass_file文件：
             ass_file = yaml_config.get('ass_file', '')
             if ass_file and os.path.exists(ass_file):
-                with open(ass_file, 'r', encoding='utf-8') as f:
-                    # print(f'找到并使用了配置的ASS文件：{ass_file}\n')
-                    ass_content = f.read().strip()
-                    match = ASS_HEADER_RE.search(ass_content)
-                    if match:
-                        self.ass_style = match.group(0)
-                        print(f"找到并将使用 配置的ASS文件\n")
-                    else:
-                        print(f"警告：配置的ASS文件未发现有效的ass文件头：{ass_file}\n")
-                        self.ass_style = ass_header
+                try:
+                    self.ass_template = load_ass_template(ass_file)
+                    self.log("找到并将使用 配置的ASS文件\n")
+                except ValueError:
+                    self.log(f"警告：配置的ASS文件未发现有效的ass文件头：{ass_file}\n")
+                    self.ass_template = DEFAULT_ASS_TEMPLATE
             else:
-                print(f'警告：没有或未找到模板ASS文件：{ass_file}\n')
+                self.log(f'警告：没有或未找到模板ASS文件：{ass_file}\n')
 
         else:
-            print(f"警告：没有或未找到配置文件：{self.config_file}\n")
+            self.log(f"警告：没有或未找到配置文件：{self.config_file}\n")
 
 
-    # 清理字幕文件
+    # 影响字幕处理结果的配置的哈希值，配置改变后处理记录失效
+    def config_hash(self) -> str:
+        return hash_config(['sub', self.is_srt2ass, self.timing.settings(), list(self.replace_words.items()),
+                            self.ass_template.render(), self.opencc_profile])
+
+    # 清理字幕文件（重复的行直接使用缓存的结果）
     def clean_line(self, text: str) -> str:
+        if self.profiler is not None:
+            self.profiler.count('lines')
+            return self.line_memo.counted(text, self.profiler)
+        return self.line_memo(text)
+
+    def _clean_line(self, text: str) -> str:
         """
         1. 去掉首尾【一般】标点
         2. 同时清除收尾标点，结尾的问号需要保留
@@ -218,18 +1529,14 @@ class sub_process:
             return ''
 
         # 替换和删除特定词语（支持正则表达式)
-        if self.replace_words:
-            for old_wd, new_wd in self.replace_words.items():
-                try:
-                    text = re.sub(old_wd, new_wd, text, flags=re.UNICODE)
-                except re.error as e:
-                    print(f"'{old_wd}'正则表达式语法错误: {e}")
-                    continue
-                except Exception as e:
-                    continue
+        if self.profiler is not None:
+            if self.replace_rules:
+                text = self.profiler.apply_rules(self.replace_rules, text)
+        elif self.replace_rules:
+            text = self.replace_rules.apply(text)
 
         # 将文本中重复了2次及以上的多字字符串替换为1次
-        text = REPEAT_CONTENT_RE.sub(r'\1', text)
+        text = collapse_repeats(text)
 
         # 如果一行中有重叠的2个及以上语气词，则只保留1个
         text = REPEAT_CHAR_RE.sub(r'\1', text)
@@ -246,227 +1553,413 @@ class sub_process:
         return text.strip()
 
 
-    # 处理srt文件
-    def process_srt(self):
-        if not self.current_content:
-            return
-
-        blocks = SRT_SPLIT_RE.split(self.current_content)
-        cleaned_blocks = []
-        counter = 1
-        for blk in blocks:
-            m = SRT_BLOCK_RE.match(blk.strip())
-            if not m:  # 不是合法 block
-                continue
-            seq, timing, text = m.groups()
-            # #########################################
-            # 开始处理时间，格式类似于 00:00:39,560 --> 00:00:43,830
-            # 提取开始和结束时间
-            times = SUB_TIME_RE.findall(timing)
-            if len(times) < 2:
-                continue
-            #
-            start_time_str, end_time_str = [t.replace(',', '.') for t in times[:2]]
-            # 将时间字符串转换为时间对象
-            try:
-                start_time = datetime.datetime.strptime(start_time_str, '%H:%M:%S.%f')
-                end_time = datetime.datetime.strptime(end_time_str, '%H:%M:%S.%f')
-            except ValueError:
+    # 行首的 ASS 特效标签不参与清理（否则会被当作标点删掉），清理后的文本不为空时再加回行首
+    def clean_tagged_line(self, text: str) -> str:
+        m = ASS_TAGS_HEAD_RE.match(text)
+        if m is None:
+            return self.clean_line(text)
+        rest = self.clean_line(text[m.end():])
+        return m.group(0).strip() + rest if rest else ''
+
+    # 逐块解析srt内容，生成输出的文本块（srt 或 ass 格式）
+    # 清理解析出的字幕文本，清理后为空的行删除，全部为空的字幕丢弃（之前的其他行留给下一条字幕输出）
+    def clean_cues(self, cues: Iterable[tuple], raw: List[str]) -> Iterator[tuple]:
+        profiler = self.profiler
+        pending = ''
+        for start_ms, end_ms, lines, style, layer, fields, pre in cues:
+            if profiler is not None:
+                profiler.count('cues_in')
+            new_lines = [self.clean_tagged_line(l) if l.lstrip().startswith('{') else self.clean_line(l)
+                         for l in lines]
+            new_lines = [l for l in new_lines if l]  # 删掉清洗后变空白的
+            if not new_lines:
+                pending += pre
+                self.cues_dropped += 1
                 continue
+            if profiler is not None:
+                profiler.count('cues_out')
+            yield start_ms, end_ms, '\n'.join(new_lines), style, layer, fields, pending + pre
+            pending = ''
+        if pending:
+            raw.insert(0, pending)
+
+    # 合并相邻的重复字幕（语音识别生成的字幕常见）：清理后文本、Style 等字段都相同，
+    # 开始时间不晚于上一条结束后 merge_gap，且合并后的持续时间不超过 max_duration 的连续字幕合并为一条。
+    # 中间有 Comment 等其他行时不合并；比较使用时间轴调整之前的原始时间
+    def merge_cues(self, cues: Iterable[tuple]) -> Iterator[tuple]:
+        gap_ms, max_ms = self.timing.merge_gap_ms, self.timing.max_ms
+        prev = None
+        for cue in cues:
+            if prev is not None:
+                start_ms, end_ms, text, style, layer, fields, pre = cue
+                if (not pre and text == prev[2] and style == prev[3] and layer == prev[4] and fields == prev[5]
+                        and prev[0] <= start_ms <= prev[1] + gap_ms
+                        and (max_ms <= 0 or max(end_ms, prev[1]) - prev[0] <= max_ms)):
+                    prev = (prev[0], max(end_ms, prev[1])) + prev[2:]
+                    self.cues_merged += 1
+                    continue
+                yield prev
+            prev = cue
+        if prev is not None:
+            yield prev
+
+    # 解析 -> 清理 -> 按批调整时间轴 -> 输出，fmt 为输入的格式（'srt' 或 'ass'）
+    # to_ass 为 None 时按输入格式和 is_srt2ass 决定输出格式；batch_size 为时间轴调整的每批条数（管道模式下逐条输出）
+    def iter_subtitle(self, lines: Iterable[str], fmt: str, to_ass: bool = None,
+                      batch_size: int = CUE_BATCH_SIZE) -> Iterator[str]:
+        raw = []
+        # 换用其他编码重新处理时重新计数
+        self.cues_dropped = self.cues_merged = 0
+        template = self.ass_template
+        if fmt == 'ass':
+            # 输入文件自己的样式等与模板合并，每条字幕原来的 Style 等字段不变
+            sections, lines = scan_ass_header(lines)
+            template = template.merge(ass_template(sections))
+            cues = parse_ass(lines, raw)
+        else:
+            cues = parse_srt(lines)
+        cues = self.clean_cues(cues, raw)
+        if self.timing.merge_duplicates:
+            cues = self.merge_cues(cues)
+        if to_ass is None:
+            to_ass = fmt == 'ass' or self.is_srt2ass
+        if to_ass:
+            yield template.render()
+        counter = itertools.count(1)
+        # 时间轴调整（如果持续时间超过max_duration秒，则调整为max_duration秒等）
+        for batch in iter_timed_batches(cues, self.timing, batch_size):
+            yield from render_ass(batch) if to_ass else render_srt(batch, counter)
+        if to_ass:
+            # 最后一条字幕之后的其他行
+            yield ''.join(raw)
+        else:
+            yield '\n'
 
-            ############### 处理字幕的持续时间 ###################################
-            # 计算持续时间（秒）
-            duration = (end_time - start_time).total_seconds()
-
-            # 如果持续时间超过max_duration秒，则调整为max_duration秒
-            if duration > self.max_duration:
-                end_time = start_time + datetime.timedelta(seconds=self.max_duration)
-                end_time_str = end_time.strftime('%H:%M:%S,%f')[:-3]  # 保留毫秒部分3位
-
-            if not self.is_srt2ass:     # 需要保留成SRT格式
-                # 格式化时间字符串（SRT格式）
-                start_time_str = start_time.strftime('%H:%M:%S,%f')[:-3]  # 保留毫秒部分3位
-                end_time_str = end_time.strftime('%H:%M:%S,%f')[:-3]  # 保留毫秒部分3位
-                timing = f'{start_time_str} --> {end_time_str}'
-            else:       # 需要保留成ASS格式
-                # 格式化时间字符串（ASS格式）
-                start_time_str = start_time.strftime('%H:%M:%S.%f')[:-4]  # 保留毫秒部分2位
-                end_time_str = end_time.strftime('%H:%M:%S.%f')[:-4]  # 保留毫秒部分2位
-
-                # 处理strftime 的格式占位符会把小时 固定 为两位（%H）的问题：
-                start_time_str = start_time_str[1:] if start_time_str.startswith('0') else start_time_str
-                end_time_str = end_time_str[1:] if end_time_str.startswith('0') else end_time_str
-            ############### 处理字幕的持续时间 结束 ###################################
-
-            ##################################################
-            # 开始清理字幕内容
-            lines = text.splitlines()
-            new_lines = [self.clean_line(l) for l in lines]
-            new_lines = [l for l in new_lines if l]  # 删掉清洗后变空白的
-            if new_lines:
-                if self.is_srt2ass:
-                    text = r'\N'.join(new_lines)  # ASS中使用\N表示换行
-                    ass_line = f"Dialogue: 0,{start_time_str},{end_time_str},Default,,0,0,0,,{text}"
-                    cleaned_blocks.append(ass_line)
-                else:
-                    cleaned_blocks.append(f'{counter}\n{timing}\n' + '\n'.join(new_lines))
-                    counter += 1
-        # 保存结果：
-        if self.is_srt2ass:
-            content = self.ass_style.strip() + '\n' + '\n'.join(cleaned_blocks) + '\n'
-            result_path = self.current_file.replace('.srt', '.ass')
-            # 9. 写入文件（UTF-8-BOM编码）
-            with open(result_path, 'w', encoding='utf-8-sig') as f:  # utf-8-sig添加BOM确保兼容性
-                f.write(content)
-            print(f'✓ {self.current_file} -> {result_path}')
+    def iter_srt(self, lines: Iterable[str]) -> Iterator[str]:
+        return self.iter_subtitle(lines, 'srt')
 
+    # 处理srt文件
+    def process_srt(self) -> bool:
+        if self.is_srt2ass:
+            result_path = os.path.splitext(self.current_file)[0] + '.ass'
         else:
-            content = '\n\n'.join(cleaned_blocks) + '\n'
-            # 9. 写入文件（UTF-8-BOM 编码）
-            with open(self.current_file, 'w', encoding='utf-8-sig') as f:  # utf-8-sig添加BOM确保兼容性
-                f.write(content)
-            print(f'✓ {self.current_file} -> {self.current_file}')
+            result_path = self.current_file
+        if not self.stream_file(result_path, self.iter_srt):
+            return False
+        self.log_saved(f'✓ {self.current_file} -> {result_path}{self.cue_report()}')
+        return True
 
+    # 逐行解析ass内容，生成输出的文本行
+    def iter_ass(self, lines: Iterable[str]) -> Iterator[str]:
+        return self.iter_subtitle(lines, 'ass')
 
     # 处理 ass 格式文件：
     # ----------  ASS/SSA ----------
-    def process_ass(self):
-        if not self.current_content:
-            return
-
-        # 1. 先按段落保存 Script Info 等开头的元数据
-        ass_header_m = ASS_HEADER_RE.search(self.current_content)
-        if not ass_header_m:
-            print('Error!! 不是有效的 ASS/SSA 文件！')
-            return
-        # # 保留原来的 ass_header
-        # ass_header_origin = ass_header_m.group(0)
+    def process_ass(self) -> bool:
+        # 增加对于 .ssa 文件的处理
+        base, ext = os.path.splitext(self.current_file)
+        result_path = base + '.ass' if ext.lower() == '.ssa' else self.current_file
+        try:
+            if not self.stream_file(result_path, self.iter_ass):
+                return False
+        except ValueError as e:
+            print(f'Error!! {e}')
+            return False
+        self.log_saved(f'✓ {self.current_file} -> {result_path}{self.cue_report()}')
+        return True
+
+    # 删除和合并的字幕条数（都为0时为空），同时计入性能统计
+    def cue_report(self) -> str:
+        if self.profiler is not None and self.cues_merged:
+            self.profiler.count('cues_merged', self.cues_merged)
+        parts = [f'删除空字幕 {self.cues_dropped} 条' if self.cues_dropped else '',
+                 f'合并重复字幕 {self.cues_merged} 条' if self.cues_merged else '']
+        parts = [p for p in parts if p]
+        return f'（{"，".join(parts)}）' if parts else ''
+
+    # 以流的方式处理当前文件：逐行读取 -> 繁简转换 -> 清理 -> 逐块写入 result_path
+    def stream_file(self, result_path: str, process) -> bool:
+        data = self.source_data
+        if (len(data) if data is not None else os.path.getsize(self.current_file)) == 0:
+            return False
+        converter = get_converter(self.opencc_profile, self.cache_dir)  # 繁体转简体
+        for encoding in candidate_encodings(self.current_file, data):
+            try:
+                # 9. 写入文件（UTF-8-BOM编码）
+                lines = iter_file_lines(self.current_file, encoding, data)
+                profiler = self.profiler
+                if profiler is None:
+                    self.writer(result_path, process(converter.convert_lines(lines)), fsync=self.fsync)
+                else:
+                    # 按阶段统计：读取解码 -> 繁简转换 -> 解析清理（替换规则单独统计） -> 写入
+                    lines = profiler.iter(lines, 'read')
+                    chunks = profiler.iter(process(profiler.iter(converter.convert_lines(lines), 'opencc')), 'clean')
+                    memo = self.line_memo.stats()
+                    with profiler.stage('write'):
+                        self.writer(result_path, chunks, fsync=self.fsync)
+                    profiler.count_memo(self.line_memo, memo)
+                self.result_path = result_path
+                return True
+            except UnicodeDecodeError:
+                # 检测的编码解码失败，换下一个常见编码重新处理
+                continue
+        raise Exception(f"无法解码文件: {self.current_file}")
 
-        # 获取字幕的正文部分：
-        dialogue_part = self.current_content[ass_header_m.end():].strip()
-        if not dialogue_part:
-            print('Error!! ASS/SSA 文件中未包含有效字幕！')
-            return
+    # 处理内存中的字幕文本，返回处理结果（不读写文件、不打印）；fmt 为 'srt'、'ass' 或 'ssa'
+    # 同一个对象不能在多个线程中同时使用
+    def process_text(self, text: str, fmt: str = 'srt') -> str:
+        self.profiler = None
+        converter = get_converter(self.opencc_profile)
+        lines = io.StringIO(normalize_newlines(text).lstrip('\ufeff'))
+        return ''.join(self.iter_subtitle(converter.convert_lines(lines), 'ass' if fmt.lower() in ('ass', 'ssa') else 'srt'))
 
-        new_dialogues = []
-        for dl_line in dialogue_part.splitlines(True):
-            m = ASS_DIALOGUE_RE.match(dl_line)
-            if not m:
-                # 格式行、样式行等等直接保留
-                new_dialogues.append(dl_line)
-                continue
-            prefix, text = m.groups()
+    # sub_process类的入口函数：
+    def process_all(self, input_file) -> bool:
+        self.current_file = input_file  
+        self.result_path = ''
+        self.profiler = stage_profiler() if self.profile else None
+        print(f"正在处理: {self.current_file}")
 
-            # #########################################
-            # 开始处理时间，格式类似于 00:00:39,560 --> 00:00:43,830
-            # 提取开始和结束时间
-            times = SUB_TIME_RE.findall(prefix)
-            if len(times) < 2:
+        _, ext = os.path.splitext(input_file)
+        if ext.lower() == '.srt':
+            return self.process_srt()
+        else:
+            return self.process_ass()
+
+
+############################## 章节识别 ############################
+try:
+    from re import _parser as sre_parse     # Python 3.11+
+except ImportError:
+    import sre_parse
+
+# 默认的章节标题规则：{标题类型: 正则表达式}，可以在 config.yml 的 chapter_patterns 中修改
+DEFAULT_CHAPTER_PATTERNS = {
+    # 第X章 章节标题
+    'chapter': r'^\s*第[零一二三四五六七八九十百千\d]+\s*[章节回卷].*?$',
+    # 特殊章节：序、前言、尾声、后记等
+    'preface': r'^\s*(序言?|前言|楔子|引言|开场白|序幕).*?$',
+    'epilogue': r'^\s*(尾声|后记|结语|终章|完结篇|大结局).*?$',
+    'appendix': r'^\s*(附录|附记|补记|外传).*?$',
+    # 数字章节：1. 2. （一）【2】等：
+    'number': r'^\s*[(（\[【「]?[零一二三四五六七八九十百千\d]+[)）\]】」]?[、. ]?\s*$',
+    # 数字章节：1. 2. （一）【2】等,后面带内容的标题
+    'number_title': r'^\s*[(（\[【「]?[零一二三四五六七八九十百千\d]+[)）\]】」、]+.*$',
+    # 符号章节：# 标题
+    'symbol': r'^[#]+.*?$',
+}
+
+# 行尾为这些标点时，表示一个段落结束（不需要和下一行合并）
+END_CHARS = frozenset('.。!！?？…"”)）]】:：=-」')
+
+# 首字符分析时能识别的字符类别
+FIRST_CHAR_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: str.isdecimal,
+    sre_parse.CATEGORY_SPACE: str.isspace,
+    sre_parse.CATEGORY_WORD: lambda ch: ch.isalnum() or ch == '_',
+}
+REPEAT_OPS = tuple(getattr(sre_parse, op) for op in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                   if hasattr(sre_parse, op))
+
+
+# 分析正则表达式（sre_parse 的解析结果）可能匹配的首字符
+# 返回 (字符集合, 字符类别判断函数集合, 是否可以匹配空串)；无法确定时返回 None
+def first_chars(items) -> tuple:
+    chars, categories = set(), set()
+    for op, av in items:
+        if op is sre_parse.AT:      # ^ $ \b 等零宽断言
+            continue
+        if op is sre_parse.LITERAL:
+            chars.add(chr(av))
+            return chars, categories, False
+        if op is sre_parse.IN:
+            for in_op, in_av in av:
+                if in_op is sre_parse.LITERAL:
+                    chars.add(chr(in_av))
+                elif in_op is sre_parse.RANGE and in_av[1] - in_av[0] < 256:
+                    chars.update(map(chr, range(in_av[0], in_av[1] + 1)))
+                elif in_op is sre_parse.CATEGORY and in_av in FIRST_CHAR_CATEGORIES:
+                    categories.add(FIRST_CHAR_CATEGORIES[in_av])
+                else:   # 取反、大范围等
+                    return None
+            return chars, categories, False
+        if op in REPEAT_OPS:
+            sub = first_chars(av[2])
+            nullable = av[0] == 0
+        elif op is sre_parse.SUBPATTERN:
+            if av[1] & sre_parse.SRE_FLAG_IGNORECASE:
+                return None
+            sub = first_chars(av[-1])
+            nullable = False
+        elif op is sre_parse.BRANCH:
+            subs = [first_chars(branch) for branch in av[1]]
+            if None in subs:
+                return None
+            sub = (set().union(*(s[0] for s in subs)), set().union(*(s[1] for s in subs)),
+                   any(s[2] for s in subs))
+            nullable = False
+        else:   # . [^x] 反向引用、前后断言等
+            return None
+        if sub is None:
+            return None
+        chars |= sub[0]
+        categories |= sub[1]
+        if not (nullable or sub[2]):
+            return chars, categories, False
+    return chars, categories, True
+
+
+class chapter_matcher:
+    """
+    将全部章节标题规则合并为一个正则表达式（每条规则一个命名分组），每行只匹配一次，同时得到标题类型。
+    匹配前先检查行首字符：普通正文行的首字符不可能匹配任何规则时直接跳过正则。
+    """
+    def __init__(self, patterns=None):
+        if patterns is None:
+            patterns = DEFAULT_CHAPTER_PATTERNS
+        elif not isinstance(patterns, dict):   # 也可以是规则列表
+            patterns = {f'pattern{i}': p for i, p in enumerate(patterns, 1)}
+        self.errors = []
+        self.kinds = []
+        alternatives = []
+        self._patterns = []
+        self._first_chars = set()
+        self._first_categories = set()
+        prefilter = True
+        combine = True
+        for kind, pattern in patterns.items():
+            if not isinstance(pattern, str):
+                self.errors.append(f"'{kind}': '{pattern}' 不是有效的章节标题规则")
                 continue
-            start_time_str, end_time_str = [t.replace(',', '.') for t in times[:2]]
-            # 将时间字符串转换为时间对象
             try:
-                start_time = datetime.datetime.strptime(start_time_str, '%H:%M:%S.%f')
-                end_time = datetime.datetime.strptime(end_time_str, '%H:%M:%S.%f')
-            except ValueError:
+                re.compile(pattern)
+                parsed = sre_parse.parse(pattern)
+            except re.error as e:
+                self.errors.append(f"章节标题规则'{pattern}'正则表达式语法错误: {e}")
                 continue
-
-            # 将时间字符串转换为时间对象
+            self.kinds.append(str(kind))
+            self._patterns.append(pattern)
+            if re.search(r'\\[1-9]', pattern):    # 编号引用在合并后编号会改变，不能合并
+                combine = False
+            alternatives.append(f'(?P<_{len(alternatives)}>{pattern})')
+            if prefilter:
+                try:
+                    flags = (parsed.state if hasattr(parsed, 'state') else parsed.pattern).flags
+                    first = None if flags & sre_parse.SRE_FLAG_IGNORECASE else first_chars(parsed)
+                except Exception:
+                    first = None
+                if first is None or first[2]:   # 可能以任意字符开头，或可以匹配空行
+                    prefilter = False
+                else:
+                    self._first_chars |= first[0]
+                    self._first_categories |= first[1]
+        self.prefilter = prefilter
+        self._re = None
+        if combine and alternatives:
             try:
-                start_time = datetime.datetime.strptime(start_time_str, '%H:%M:%S.%f')
-                end_time = datetime.datetime.strptime(end_time_str, '%H:%M:%S.%f')
-            except ValueError:
-                continue
-
-            # 计算持续时间（秒）
-            duration = (end_time - start_time).total_seconds()
-
-            # 如果持续时间超过max_duration秒，则调整为max_duration秒
-            if duration > self.max_duration:
-                end_time = start_time + datetime.timedelta(seconds=self.max_duration)
-                end_time_str = end_time.strftime('%H:%M:%S.%f')[:-4]  # 保留毫秒部分2位
-
-            # 格式化时间字符串（ASS格式）
-            start_time_str = start_time.strftime('%H:%M:%S.%f')[:-4]  # 保留毫秒部分2位
-            end_time_str = end_time.strftime('%H:%M:%S.%f')[:-4]  # 保留毫秒部分2位
-
-            # 处理strftime 的格式占位符会把小时 固定 为两位（%H）的问题：
-            start_time_str = start_time_str[1:] if start_time_str.startswith('0') else start_time_str
-            end_time_str = end_time_str[1:] if end_time_str.startswith('0') else end_time_str
+                self._re = re.compile('|'.join(alternatives))
+            except re.error:    # 例如规则中使用了同名的分组
+                pass
+        if self._re is None:    # 不能合并时逐条匹配
+            self._patterns = [re.compile(p) for p in self._patterns]
+
+    # 返回匹配的标题类型，不是标题时返回 None；line 为已经去除首尾空白的非空行
+    def match(self, line: str):
+        if not self.kinds:
+            return None
+        if self.prefilter:
+            ch = line[0]
+            if ch not in self._first_chars and not any(f(ch) for f in self._first_categories):
+                return None
+        if self._re is not None:
+            m = self._re.match(line)
+            return self.kinds[int(m.lastgroup[1:])] if m else None
+        for kind, pattern in zip(self.kinds, self._patterns):
+            if pattern.match(line):
+                return kind
+        return None
 
-            prefix = f"Dialogue: 0,{start_time_str},{end_time_str},Default,,0,0,0,,"
-            ##################################################
+    # 打印编译时发现的无效规则
+    def report_errors(self, log=print):
+        for error in self.errors:
+            log(error)
 
-            # ASS 文本常带 \N 手动换行
-            lines = text.replace(r'\N', '\n').splitlines()
-            cleaned = [self.clean_line(l) for l in lines]
-            cleaned_txt = r'\N'.join(cleaned)
-            if cleaned_txt:
-                new_dialogues.append(prefix + cleaned_txt)
-            # 空白则直接丢弃该行
 
-        content = self.ass_style.strip() + '\n' + '\n'.join(new_dialogues)
-        # 增加对于 .ssa 文件的处理
-        result_path = self.current_file.replace('.ssa', '.ass')
-        # 9. 写入文件（UTF-8-BOM编码）
-        with open(result_path, 'w', encoding='utf-8-sig') as f:  # utf-8-sig添加BOM确保兼容性
-            f.write(content)
-        print(f'✓ {self.current_file} -> {result_path}')
-    
-    # sub_process类的入口函数：
-    def process_all(self, input_file):
-        self.current_file = input_file  
-        print(f"正在处理: {self.current_file}")
+# 小说按章节拆分时输出文件夹的后缀
+NOVEL_SPLIT_SUFFIX = '_章节'
+# 并行处理大文件时每块的大约字符数
+NOVEL_CHUNK_CHARS = 1 << 20
+INVALID_FILENAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
 
-        self.current_content = read_file(self.current_file)
-        print("✓ 文件读取完成")
 
-        self.current_content = tw2cn(self.current_content)
-        print("✓ 繁体->简体转换完成")
-
-        _, ext = os.path.splitext(input_file)
-        if ext.lower() == '.srt':
-            self.process_srt()
-        else:
-            self.process_ass()
+# 将章节标题转为可以用作文件名的字符串
+def safe_filename(title: str, max_length: int = 50) -> str:
+    return INVALID_FILENAME_RE.sub('_', title).strip(' .')[:max_length] or '_'
 
 
 class novel_process:
-    def __init__(self, config_file='config.yml'):
+    def __init__(self, config_file='config.yml', quiet: bool = False):
         self.config_file = config_file
+        self.quiet = quiet
         self.replace_words ={}
+        self.replace_rules = replace_rules()
+        # 替换结果缓存：每章都出现的“本章完”、求票等固定的行只替换一次
+        self.line_memo = line_memo(self._replace_line)
+        self.result_path = ''
+        # 是否记录性能统计（--profile）
+        self.profile = False
+        self.profiler = None
+        self.fsync = False
+        # 输出文件的写入函数、保存成功的信息及预读的文件内容，与 sub_process 相同
+        self.writer = write_chunks
+        self.saved_log = None
+        self.source_data = None
         self.is_indent = True
         self.is_2lines_space = True
         self.is_short_title = True
         self.short_title_length = 12
         self.indent_chars = '  '
-
-        self.chapter_patterns = [
-            # 第X章 章节标题
-            r'^\s*第[零一二三四五六七八九十百千\d]+\s*[章节回卷].*?$',           
-            # 特殊章节：序、前言、尾声、后记等
-            r'^\s*(序言?|前言|楔子|引言|开场白|序幕).*?$',
-            r'^\s*(尾声|后记|结语|终章|完结篇|大结局).*?$',
-            r'^\s*(附录|附记|补记|外传).*?$',
-            # 数字章节：1. 2. （一）【2】等：
-            r'^\s*[(（\[【「]?[零一二三四五六七八九十百千\d]+[)）\]】」]?[、. ]?\s*$',
-            # 数字章节：1. 2. （一）【2】等,后面带内容的标题
-            r'^\s*[(（\[【「]?[零一二三四五六七八九十百千\d]+[)）\]】」、]+.*$',
-            # 符号章节：# 标题
-            r'^[#]+.*?$'
-        ]
+        # 是否同时输出章节目录（JSON）、是否按章节拆分为多个文件
+        self.novel_toc = False
+        self.novel_split = False
+        self.chapters = []  # 最近一次处理得到的章节列表
+        self.output_size = 0
+        # 超过 novel_parallel_mb 的文件按安全的分界切块，使用 novel_jobs 个进程并行处理（0为全部CPU核心，1为不并行）
+        self.novel_jobs = 0
+        self.novel_parallel_mb = 32
+        self.novel_chunk_chars = NOVEL_CHUNK_CHARS
+
+        # 章节标题规则：{标题类型: 正则表达式}
+        self.chapter_patterns = dict(DEFAULT_CHAPTER_PATTERNS)
+        self.chapter_matcher = chapter_matcher(self.chapter_patterns)
         self.get_config()
+
+    # 打印提示信息，quiet 时不输出
+    def log(self, *args):
+        if not self.quiet:
+            print(*args)
+
+    # 打印保存成功的信息；后台写入时先记下，由 process_batch 在写入完成后打印
+    def log_saved(self, message: str):
+        if self.saved_log is None:
+            print(message)
+        else:
+            self.saved_log.append(message)
+
     def get_config(self):
         # 读取config.yml文件：
         yaml_config = read_yaml_config(self.config_file)
 
         if yaml_config:  # 检查是否为空
-            print(f'找到并将使用 配置文件：{self.config_file}')
+            self.log(f'找到并将使用 配置文件：{self.config_file}')
        
             # 读取配置文件中的替换字典，将整个section转为字典
-            self.replace_words = yaml_config.get("text_replacements", {})
+            self.replace_words = yaml_config.get("text_replacements", {}) or {}
             if self.replace_words:
-                print(f"找到并将使用 替换单词")
+                self.log("找到并将使用 替换单词")
+            self.replace_rules = replace_rules(self.replace_words)
+            self.replace_rules.report_errors(self.log)
+            self.line_memo = line_memo(self._replace_line, int(yaml_config.get("line_memo_size", LINE_MEMO_SIZE) or 0))
             # for key, value in self.replace_words.items():
             #     print(f"替换单词：{key} -> {value}")
             self.is_indent = yaml_config.get("is_indent", True)
@@ -474,157 +1967,1017 @@ class novel_process:
             self.is_short_title = yaml_config.get("is_short_title", True)
             self.short_title_length = yaml_config.get("short_title_length", 12)
             self.indent_chars = yaml_config.get("indent_chars", "  ")
+            self.profile = bool(yaml_config.get("profile", False))
+            self.fsync = bool(yaml_config.get("fsync", False))
+            self.novel_toc = bool(yaml_config.get("novel_toc", False))
+            self.novel_split = bool(yaml_config.get("novel_split", False))
+            self.novel_jobs = int(yaml_config.get("novel_jobs", 0) or 0)
+            self.novel_parallel_mb = yaml_config.get("novel_parallel_mb", 32) or 0
+            chapter_patterns = yaml_config.get("chapter_patterns")
+            if chapter_patterns:
+                self.log("找到并将使用 章节标题规则")
+                self.chapter_patterns = chapter_patterns
+                self.chapter_matcher = chapter_matcher(chapter_patterns)
+                self.chapter_matcher.report_errors(self.log)
             
         else:
-            print(f"警告：没有或未找到配置文件：{self.config_file}\n")
-
+            self.log(f"警告：没有或未找到配置文件：{self.config_file}\n")
+
+    # 影响小说处理结果的配置的哈希值，配置改变后处理记录失效
+    def config_hash(self) -> str:
+        return hash_config(['novel', list(self.replace_words.items()), self.is_indent, self.is_2lines_space,
+                            self.is_short_title, self.short_title_length, self.indent_chars,
+                            list(self.chapter_patterns.items()) if isinstance(self.chapter_patterns, dict)
+                            else list(self.chapter_patterns), self.novel_toc, self.novel_split])
         
-    def save_file(self, file_path: str, content: str):
-        """保存处理后的文件"""
-        try:
-            base_name = os.path.splitext(file_path)[0]
-            output_path = f"{base_name}_已处理.txt"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"文件已保存为: {output_path}")
-            return output_path
-        except Exception as e:
-            print(f"保存文件时出错: {e}")
-            return None
-    
     def replace_line(self, line: str) -> str:
+        """将指定的单词替换为对应的值（重复的行直接使用缓存的结果）"""
+        if self.profiler is not None:
+            self.profiler.count('lines')
+            return self.line_memo.counted(line, self.profiler)
+        return self.line_memo(line)
+
+    def _replace_line(self, line: str) -> str:
         text = line.strip()
-        """将指定的单词替换为对应的值"""
-        for old_wd, new_wd in self.replace_words.items():
-            try:
-                text = re.sub(old_wd, new_wd, text, flags=re.UNICODE)
-            except re.error as e:
-                print(f"'{old_wd}'正则表达式语法错误: {e}")
-                continue
-            except Exception as e:
-                continue
+        if self.profiler is not None:
+            if self.replace_rules:
+                text = self.profiler.apply_rules(self.replace_rules, text)
+        elif self.replace_rules:
+            text = self.replace_rules.apply(text)
         return text.strip()
 
 
     def process_novel(self, file_path: str) -> bool:
 
-        """处理小说的主函数"""
+        """处理小说的主函数：逐行读取，段落拼接完成后立即写入 原文件名_已处理.txt"""
         print(f"开始处理文件: {file_path}")
-        
-        # 读取文件
-        content = read_file(file_path)
-        if not content:
+        self.result_path = ''
+        self.profiler = profiler = stage_profiler() if self.profile else None
+        data = self.source_data
+        if (len(data) if data is not None else os.path.getsize(file_path)) == 0:
             return False
-        
-        #1. 将所有的换行符统一替换为 \n
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
-        """处理段落格式"""
-        lines = content.split('\n')
-        processed_lines = []
+        output_path = f"{os.path.splitext(file_path)[0]}_已处理.txt"
+        # 按章节拆分时需要读取写好的输出文件，不能后台写入
+        writer = write_chunks if self.novel_split else self.writer
+        # 大文件切块后在多个进程中并行处理，结果按顺序拼接，与逐行处理的输出完全相同
+        jobs = self.novel_jobs if self.novel_jobs > 0 else (os.cpu_count() or 1)
+        size = len(data) if data is not None else os.path.getsize(file_path)
+        if jobs > 1 and size >= self.novel_parallel_mb * (1 << 20):
+            print(f"文件较大，使用 {jobs} 个进程并行处理")
+            iter_paragraphs = lambda lines: self.iter_paragraphs_parallel(lines, jobs)
+        else:
+            iter_paragraphs = self.iter_paragraphs
+        print("6. 保存文件...")
+        for encoding in candidate_encodings(file_path, data):
+            lines = iter_file_lines(file_path, encoding, data)
+            try:
+                if profiler is None:
+                    writer(output_path, self.iter_output(iter_paragraphs(lines)), encoding='utf-8', fsync=self.fsync)
+                else:
+                    paragraphs = profiler.iter(iter_paragraphs(profiler.iter(lines, 'read')), 'reflow')
+                    memo = self.line_memo.stats()
+                    with profiler.stage('write'):
+                        writer(output_path, self.iter_output(paragraphs), encoding='utf-8', fsync=self.fsync)
+                    profiler.count_memo(self.line_memo, memo)
+            except UnicodeDecodeError:
+                # 检测的编码解码失败，换下一个常见编码重新处理
+                continue
+            except OSError as e:
+                print(f"保存文件时出错: {e}")
+                print("处理失败！")
+                return False
+            self.result_path = output_path
+            self.log_saved(f"文件已保存为: {output_path}")
+            try:
+                if self.novel_split:
+                    self.split_chapters(output_path)
+                if self.novel_toc:
+                    self.write_toc(output_path)
+            except OSError as e:
+                print(f"保存章节时出错: {e}")
+                print("处理失败！")
+                return False
+            self.log_saved("处理完成！")
+            return True
+        raise Exception(f"无法解码文件: {file_path}")
 
-        # 2. 去除硬回车。核心正则：如果换行符前不是结束标点，就删除换行符（用空字符串替换）
-        # 这个正则更完善，考虑了引号、括号等可能出现在行尾的情况
-        not_end_pattern = re.compile(r'.*?[^.。!！?？…\"\”\)）\]】:：.=\-」]$', re.MULTILINE)
-        temp_content = ''
+    # 处理内存中的小说文本，返回处理结果（不读写文件、不打印），章节目录保存在 self.chapters 中
+    def process_text(self, text: str) -> str:
+        self.profiler = None
+        lines = io.StringIO(normalize_newlines(text).lstrip('\ufeff'))
+        return ''.join(self.iter_output(self.iter_paragraphs(lines)))
+
+    # 段落之间用空行（或两个空行）分隔，文件末尾不加换行
+    # 需要输出目录或拆分章节时，同时记录每个章节标题在输出文件中的字节偏移和行号
+    def iter_output(self, paragraphs: Iterable[Tuple[str, str]]) -> Iterator[str]:
+        separator = '\n\n' if self.is_2lines_space else '\n'
+        self.chapters = chapters = []
+        track = self.novel_toc or self.novel_split
+        # 文本方式写入时 \n 会被转换为 os.linesep
+        newline_extra = len(os.linesep) - 1
+        offset, line_no = 0, 1
+        count = 0
+        for count, (kind, paragraph) in enumerate(paragraphs, 1):
+            chunk = paragraph if count == 1 else separator + paragraph
+            if track:
+                if count > 1:
+                    offset += len(separator) * (1 + newline_extra)
+                    line_no += len(separator)
+                if kind is not None:
+                    chapters.append({'title': paragraph, 'kind': kind, 'line': line_no, 'offset': offset})
+                newlines = paragraph.count('\n')
+                offset += len(paragraph.encode('utf-8')) + newlines * newline_extra
+                line_no += newlines
+            yield chunk
+        if self.profiler is not None:
+            self.profiler.count('paragraphs', count)
+        if track:
+            self.output_size = offset
+
+    # 将章节目录保存为 原文件名_已处理.json，阅读器可以直接定位到章节的字节偏移
+    def write_toc(self, output_path: str):
+        toc_path = os.path.splitext(output_path)[0] + '.json'
+        toc = {
+            'output': os.path.basename(output_path),
+            'encoding': 'utf-8',
+            'size': self.output_size,
+            'chapters': self.chapters,
+        }
+        write_chunks(toc_path, [json.dumps(toc, ensure_ascii=False, indent=1)], encoding='utf-8', fsync=self.fsync)
+        print(f"章节目录已保存为: {toc_path}")
+
+    # 按章节标题（不含短标题）将输出文件拆分到 原文件名_已处理_章节 文件夹中，每章一个文件
+    # 第一个章节之前的内容保存为 0000.txt；直接按目录中的字节偏移复制，不重新解析全文
+    def split_chapters(self, output_path: str):
+        starts = [c for c in self.chapters if c['kind'] != 'short_title']
+        if not starts:
+            return
+        split_dir = os.path.splitext(output_path)[0] + NOVEL_SPLIT_SUFFIX
+        temp_dir = split_dir + '.tmp'
+        separator_size = (2 if self.is_2lines_space else 1) * len(os.linesep)
+        parts = []
+        if starts[0]['offset'] > 0:
+            parts.append(('0000.txt', 0, starts[0]['offset'] - separator_size, None))
+        for n, chapter in enumerate(starts, 1):
+            end = starts[n]['offset'] - separator_size if n < len(starts) else self.output_size
+            parts.append((f"{n:04d}_{safe_filename(chapter['title'])}.txt", chapter['offset'], end, chapter))
+
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+        os.makedirs(temp_dir)
+        try:
+            with open(output_path, 'rb') as src:
+                for name, start, end, chapter in parts:
+                    src.seek(start)
+                    with open(os.path.join(temp_dir, name), 'wb') as dst:
+                        remaining = end - start
+                        while remaining > 0:
+                            data = src.read(min(remaining, 1 << 20))
+                            if not data:
+                                break
+                            dst.write(data)
+                            remaining -= len(data)
+                    if chapter is not None:
+                        chapter['file'] = os.path.basename(split_dir) + '/' + name
+            if os.path.exists(split_dir):
+                shutil.rmtree(split_dir)
+            os.replace(temp_dir, split_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        print(f"已按章节拆分为 {len(parts)} 个文件: {split_dir}")
+
+    # 去除硬回车、识别章节标题、段落缩进，逐个返回处理好的段落 (标题类型, 段落)
+    # 章节标题单独作为一段，普通段落的标题类型为 None
+    def iter_paragraphs(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        # 去除硬回车。如果行尾不是结束标点，就和下一行合并
+        # 行尾字符的判断考虑了引号、括号等可能出现在行尾的情况
+        # 同一段落的各行先放入 fragments，段落结束时一次拼接，避免超长段落反复拼接字符串
+        fragments = []
+        indent = self.indent_chars if self.is_indent else ''   # 段落首行缩进
+        matcher = self.chapter_matcher
+        profiler = self.profiler
         
         for line in lines:
             line = self.replace_line(line)
             if line:
                 # 检测是否是章节标题
-                is_chapter = any(re.match(pattern,line) for pattern in self.chapter_patterns)
-                # for pattern in self.chapter_patterns:
-                #     if re.match(pattern, line):
-                #         is_chapter = True
-                #         break
-                if not temp_content and self.is_short_title and len(line) <= self.short_title_length:     # 短标题处理
-                    is_chapter = True 
-
-                if is_chapter :
-                    if temp_content:  # 如果有临时内容，则先处理
-                            if self.is_indent:  # 段落缩进
-                                temp_content = self.indent_chars + temp_content # 首行缩进
-                            processed_lines.append(temp_content)
-                            temp_content = ''
-                    processed_lines.append(line)  
-
+                kind = matcher.match(line)
+                if kind is None and not fragments and self.is_short_title and len(line) <= self.short_title_length:     # 短标题处理
+                    kind = 'short_title'
+
+                if kind is not None:
+                    if profiler is not None:
+                        profiler.count(f'heading_{kind}')
+                    if fragments:  # 如果有未结束的段落，则先输出
+                        yield None, indent + ''.join(fragments)
+                        fragments = []
+                    yield kind, line
                 else:
-                    if re.match(not_end_pattern, line):
-                        temp_content += line
-                    else:
-                        line = temp_content + line
-                        if self.is_indent:  # 段落缩进
-                            line = self.indent_chars + line  # 首行缩进
-                        processed_lines.append(line)
-                        temp_content = ''
-        # 最后一个line 处理
-        if temp_content:  # 如果有临时内容，则先处理
-            if self.is_indent:  # 段落缩进
-                processed_lines.append(f"{self.indent_chars}{temp_content}")  # 首行缩进两个英文空格
+                    fragments.append(line)
+                    if line[-1] in END_CHARS:
+                        yield None, indent + ''.join(fragments)
+                        fragments = []
+        # 最后一个段落
+        if fragments:
+            yield None, indent + ''.join(fragments)
+
+    # 将各行切分为约 novel_chunk_chars 个字符的块，只在段落状态一定为空的位置切分，各块单独执行 iter_paragraphs 的结果
+    # 按顺序拼接后与整体执行完全相同：
+    # 1. 章节标题（chapter_patterns）之前：标题会先输出之前未结束的段落，与上一块末尾输出的最后一个段落相同
+    # 2. 替换后以结束标点结尾的行之后：该行之后不会有未结束的段落
+    # 注意空行并不结束段落（没有结束标点的行会和空行之后的行合并），所以不在空行处切分
+    def iter_chunks(self, lines: Iterable[str]) -> Iterator[List[str]]:
+        chunk, size = [], 0
+        limit = self.novel_chunk_chars
+        rules, matcher = self.replace_rules, self.chapter_matcher
+        for line in lines:
+            if size >= limit:
+                # 只检查达到大小之后的几行，直接使用替换规则（不计入性能统计）
+                text = rules.apply(line.strip()).strip() if rules else line.strip()
+                if text and matcher.match(text) is not None:
+                    yield chunk
+                    chunk, size = [], 0
+                elif text and text[-1] in END_CHARS:
+                    chunk.append(line)
+                    yield chunk
+                    chunk, size = [], 0
+                    continue
+            chunk.append(line)
+            size += len(line)
+        if chunk:
+            yield chunk
+
+    # 与 iter_paragraphs 相同，各块在进程池中处理；同时最多有 2 * jobs 个块在处理中，内存占用有上限
+    def iter_paragraphs_parallel(self, lines: Iterable[str], jobs: int) -> Iterator[Tuple[str, str]]:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_novel_worker,
+                                       initargs=(self.reflow_settings(),))
+        try:
+            pending = collections.deque()
+            for chunk in self.iter_chunks(lines):
+                pending.append(executor.submit(_reflow_chunk, chunk))
+                while len(pending) > 2 * jobs:
+                    yield from self._take_chunk(pending.popleft())
+            while pending:
+                yield from self._take_chunk(pending.popleft())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # 取出一个块的结果，合并子进程中的性能统计
+    def _take_chunk(self, future) -> List[Tuple[str, str]]:
+        paragraphs, stats = future.result()
+        if self.profiler is not None and stats is not None:
+            counts, rule_hits = stats
+            for name, n in counts.items():
+                self.profiler.count(name, n)
+            for key, n in rule_hits.items():
+                self.profiler.rule_hits[key] = self.profiler.rule_hits.get(key, 0) + n
+        return paragraphs
+
+    # 并行处理时传给子进程的设置（影响 iter_paragraphs 结果的部分）
+    def reflow_settings(self) -> dict:
+        return {'replace_words': self.replace_words, 'is_indent': self.is_indent, 'is_short_title': self.is_short_title,
+                'short_title_length': self.short_title_length, 'indent_chars': self.indent_chars,
+                'chapter_patterns': self.chapter_patterns, 'profile': self.profile}
+
+    @classmethod
+    def from_reflow_settings(cls, settings: dict) -> 'novel_process':
+        run = cls(config_file='', quiet=True)
+        for name, value in settings.items():
+            setattr(run, name, value)
+        run.replace_rules = replace_rules(run.replace_words)
+        run.chapter_matcher = chapter_matcher(run.chapter_patterns)
+        run.line_memo = line_memo(run._replace_line)
+        return run
+
+
+# 并行处理单个大文件时，每个子进程中的 novel_process
+_novel_worker_run = None
+
+
+def _init_novel_worker(settings: dict):
+    global _novel_worker_run
+    _novel_worker_run = novel_process.from_reflow_settings(settings)
+
+
+# 处理一块，返回 ([(标题类型, 段落)...], 性能统计)；未开启性能统计时统计为 None
+def _reflow_chunk(lines: List[str]) -> tuple:
+    run = _novel_worker_run
+    run.profiler = stage_profiler() if run.profile else None
+    paragraphs = list(run.iter_paragraphs(lines))
+    return paragraphs, (run.profiler.counts, run.profiler.rule_hits) if run.profiler is not None else None
+
+
+
+############################## 处理记录 ############################
+# 处理记录的格式版本，处理逻辑有不兼容的修改时增加该值，使旧的记录全部失效
+MANIFEST_VERSION = 1
+# 处理记录的文件名
+MANIFEST_NAME = '.sub_process_manifest.json'
+
+
+# 计算配置的哈希值
+def hash_config(settings) -> str:
+    data = json.dumps([MANIFEST_VERSION, settings], ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# 计算文件内容的哈希值
+def file_digest(file_path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class processing_manifest:
+    """
+    处理记录：记录每个文件处理时的内容哈希和配置哈希，再次运行时跳过内容和配置都没有变化的文件。
+    记录文件保存在处理的目标文件夹中，该文件夹不可写时保存在缓存文件夹中。
+    """
+    def __init__(self, manifest_file: str, root_dir: str):
+        self.manifest_file = manifest_file
+        self.root_dir = root_dir
+        self.entries = {}
+        self._outputs = None    # 所有输出文件的集合，第一次使用时生成
+        self.changed = False
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    # 根据处理的文件或文件夹，确定处理记录文件的位置
+    @classmethod
+    def for_path(cls, file_path: str, cache_dir: str = ''):
+        file_path = os.path.abspath(file_path)
+        root_dir = file_path if os.path.isdir(file_path) else os.path.dirname(file_path)
+        if os.access(root_dir, os.W_OK) or not cache_dir:
+            manifest_file = os.path.join(root_dir, MANIFEST_NAME)
+        else:
+            name = hashlib.blake2b(root_dir.encode('utf-8'), digest_size=8).hexdigest()
+            manifest_file = os.path.join(cache_dir, 'manifests', name + '.json')
+        return cls(manifest_file, root_dir)
+
+    # 文件是否是其他文件处理后生成的输出文件（如 srt 转换得到的 ass、小说的 _已处理.txt）
+    def is_output(self, file_path: str) -> bool:
+        if self._outputs is None:
+            self._outputs = {entry['output'] for k, entry in self.entries.items()
+                             if entry.get('output') and entry['output'] != k}
+        return self._key(file_path) in self._outputs
+
+    def _key(self, file_path: str) -> str:
+        return os.path.relpath(os.path.abspath(file_path), self.root_dir).replace(os.sep, '/')
+
+    # 文件是否已经用相同的配置处理过，且内容没有变化
+    def is_done(self, file_path: str, config_hash: str) -> bool:
+        entry = self.entries.get(self._key(file_path))
+        if not entry or entry.get('config') != config_hash:
+            return False
+        output = entry.get('output')
+        if output and not os.path.exists(os.path.join(self.root_dir, output)):
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime_ns:
+            return True
+        # 文件大小或修改时间变化时，比较内容哈希
+        if entry.get('size') != stat.st_size or file_digest(file_path) != entry.get('hash'):
+            return False
+        entry['mtime'] = stat.st_mtime_ns
+        self.changed = True
+        return True
+
+    # 记录处理完成的文件；输出文件就是源文件（原地处理）时，记录的是处理后的内容
+    def record(self, file_path: str, config_hash: str, output: str = ''):
+        try:
+            stat = os.stat(file_path)
+            digest = file_digest(file_path)
+        except OSError:
+            return
+        self.entries[self._key(file_path)] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': digest,
+            'config': config_hash,
+            'output': self._key(output) if output else '',
+        }
+        self._outputs = None
+        self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            write_chunks(self.manifest_file, [json.dumps({'version': MANIFEST_VERSION, 'files': self.entries},
+                                                         ensure_ascii=False, indent=1)], encoding='utf-8')
+            self.changed = False
+        except OSError as e:
+            print(f"警告：处理记录保存失败：{e}")
+
+
+############################## 批量处理 ############################
+# txt 文件按小说处理，其他文件按字幕处理
+def is_novel_file(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() == '.txt'
+
+
+class processors:
+    """
+    批处理使用的 sub_process 和 novel_process，第一次用到时才创建：
+    只处理小说时不加载字幕的模板等，只处理字幕时也不创建 novel_process。
+    quiet 为 True 时不打印读取配置时的提示信息，novel_jobs 不为 None 时替换配置中的 novel_jobs（进程池的 worker 中使用）
+    """
+    def __init__(self, is_srt2ass: bool, config_file='config.yml', profile: bool = False, quiet: bool = False,
+                 novel_jobs: int = None):
+        self.is_srt2ass = is_srt2ass
+        self.config_file = config_file
+        self.profile = profile
+        self.quiet = quiet
+        self.novel_jobs = novel_jobs
+        self._sub = None
+        self._novel = None
+
+    def _create(self, factory):
+        run = factory()
+        if self.profile:
+            run.profile = True
+        return run
+
+    @property
+    def sub(self) -> 'sub_process':
+        if self._sub is None:
+            self._sub = self._create(lambda: sub_process(self.is_srt2ass, config_file=self.config_file, quiet=self.quiet))
+        return self._sub
+
+    @property
+    def novel(self) -> 'novel_process':
+        if self._novel is None:
+            self._novel = self._create(lambda: novel_process(config_file=self.config_file, quiet=self.quiet))
+            if self.novel_jobs is not None:
+                self._novel.novel_jobs = self.novel_jobs
+        return self._novel
+
+    # 已经创建的处理对象：{'sub': ..., 'novel': ...}
+    def created(self) -> dict:
+        return {kind: run for kind, run in (('sub', self._sub), ('novel', self._novel)) if run is not None}
+
+
+# 处理单个文件，返回结果字典；任何异常都被捕获，不会中断整个批处理
+def process_file(runs: processors, file_path: str, capture: bool = False, data: bytes = None,
+                 writer=None) -> dict:
+    """
+    根据扩展名分派到 novel_process 或 sub_process。
+    capture 为 True 时，处理过程中的输出被收集到结果的 'log' 中（进程池模式下由主进程按顺序打印）
+    data 为预读的文件内容，writer 为替换 write_chunks 的写入函数（见 io_pipeline），
+    此时保存成功的信息不直接打印，收集在结果的 'saved_log' 中，写入完成后由调用者打印
+    """
+    result = {'file': file_path, 'ok': False, 'error': '', 'log': '', 'output': ''}
+    log = io.StringIO()
+    run = None
+    try:
+        with contextlib.redirect_stdout(log) if capture else contextlib.nullcontext():
+            # 不是txt文件，则执行字幕处理功能
+            if is_novel_file(file_path):
+                run, result['kind'] = runs.novel, 'novel'
             else:
-                processed_lines.append(temp_content)
+                run, result['kind'] = runs.sub, 'sub'
+            run.source_data, run.writer = data, writer or write_chunks
+            run.saved_log = None
+            if writer:
+                run.saved_log = result['saved_log'] = []
+            if result['kind'] == 'novel':
+                result['ok'] = bool(run.process_novel(file_path))
+            else:
+                result['ok'] = bool(run.process_all(file_path))
+            result['output'] = run.result_path
+            if run.profiler is not None:
+                result['profile'] = run.profiler.to_dict()
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        if run is not None:
+            run.source_data, run.writer, run.saved_log = None, write_chunks, None
+    result['log'] = log.getvalue()
+    return result
+
+
+# 读写流水线中交给写入线程的文本块大小（字符数）及最多等待写入的块数：每个文件的输出在内存中最多约 1MB
+PIPELINE_BLOCK_SIZE = 1 << 18
+PIPELINE_QUEUE_BLOCKS = 4
+
+
+class io_pipeline:
+    """
+    串行批处理时的读写流水线：后台线程预读后面 depth 个文件的内容，处理生成的输出通过有界队列逐块交给后台线程写入，
+    （网络）磁盘的读写与正则处理同时进行，输出不会整个保存在内存中。超过 max_size 的文件不预读，仍然边读边处理边写入。
+    """
+    def __init__(self, files: List[str], depth: int = 2, max_size: int = 64 << 20):
+        from concurrent.futures import ThreadPoolExecutor
+        self.files = files
+        self.depth = depth
+        self.max_size = max_size
+        self._reader = ThreadPoolExecutor(max_workers=depth, thread_name_prefix='prefetch')
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='writer')
+        self._reads = {}        # 文件序号 -> 预读的 Future
+        self._scheduled = 0     # 已经提交预读的文件数
+        self._writes = []       # 当前文件提交的写入
+
+    def _read(self, file_path: str):
+        try:
+            if os.path.getsize(file_path) > self.max_size:
+                return None
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except OSError:     # 读取失败时由处理过程直接读取文件并报告错误
+            return None
 
-        if self.is_2lines_space:  # 两行空行
-            final_content =  '\n\n'.join(processed_lines)
+    # 返回第 index 个文件预读的内容（没有预读时为 None），并提交后面 depth 个文件的预读
+    def read(self, index: int):
+        while self._scheduled < min(index + 1 + self.depth, len(self.files)):
+            self._reads[self._scheduled] = self._reader.submit(self._read, self.files[self._scheduled])
+            self._scheduled += 1
+        future = self._reads.pop(index, None)
+        return future.result() if future else None
+
+    # 与 write_chunks 的参数相同：在当前线程生成内容（解码错误等在这里抛出），凑够一块后放入队列，由后台线程写入；
+    # 队列满时等待写入线程。生成内容时出错则取消写入（删除临时文件）后再抛出，调用者可以换一种编码重新处理
+    def write(self, result_path: str, chunks: Iterable[str], encoding='utf-8-sig', fsync: bool = False):
+        import queue
+        blocks = queue.Queue(maxsize=PIPELINE_QUEUE_BLOCKS)
+        future = self._writer.submit(write_chunks, result_path, self._iter_blocks(blocks), encoding, fsync)
+        self._writes.append(future)
+        try:
+            buffer, size = [], 0
+            for chunk in chunks:
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= PIPELINE_BLOCK_SIZE:
+                    if not self._put(blocks, future, ''.join(buffer)):
+                        return      # 写入失败，错误由 take_writes 返回的 Future 报告
+                    buffer, size = [], 0
+            if self._put(blocks, future, ''.join(buffer)):
+                self._put(blocks, future, None)
+        except BaseException:
+            self._writes.remove(future)
+            if not future.cancel():
+                self._put(blocks, future, InterruptedError('输出内容生成失败，已取消写入'))
+                with contextlib.suppress(Exception):
+                    future.result()
+            raise
+
+    # 放入队列，写入线程已经结束（写入失败）时返回 False
+    @staticmethod
+    def _put(blocks, future, item) -> bool:
+        import queue
+        while True:
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if future.done():
+                    return False
+
+    # 写入线程中逐块取出文本，None 表示结束，异常表示取消
+    @staticmethod
+    def _iter_blocks(blocks) -> Iterator[str]:
+        while True:
+            block = blocks.get()
+            if block is None:
+                return
+            if isinstance(block, BaseException):
+                raise block
+            yield block
+
+    # 取出当前文件提交的写入
+    def take_writes(self) -> list:
+        writes, self._writes = self._writes, []
+        return writes
+
+    # 等待已提交的写入全部完成
+    def close(self):
+        self._reader.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True)
+
+
+# 进程池中每个 worker 持有的处理对象（配置、OpenCC、正则在每个 worker 中只加载一次）
+_worker_runs = None
+
+
+def _init_worker(is_srt2ass: bool, config_file: str, encoding_cache_file: str, profile: bool = False):
+    global _worker_runs
+    # 配置读取时的提示信息在主进程中已经打印过，这里不再重复输出；已经按文件并行，单个小说不再使用进程池
+    _worker_runs = processors(is_srt2ass, config_file=config_file, profile=profile, quiet=True, novel_jobs=1)
+    if encoding_cache_file:
+        ENCODING_CACHE.load(encoding_cache_file)
+
+
+# 创建处理文件的进程池：每个 worker 的配置、OpenCC 转换器和替换规则只加载一次，监视模式下在多次批处理之间复用
+def create_worker_pool(jobs: int, is_srt2ass: bool, config_file='config.yml', profile: bool = False):
+    from concurrent.futures import ProcessPoolExecutor
+    cache_dir = get_cache_dir((read_yaml_config(config_file) or {}).get('cache_dir'))
+    encoding_cache_file = os.path.join(cache_dir, 'encodings.json') if cache_dir else ''
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                               initargs=(is_srt2ass, config_file, encoding_cache_file, profile))
+
+
+def _run_worker(file_path: str) -> dict:
+    result = process_file(_worker_runs, file_path, capture=True)
+    # 新检测的文件编码交给主进程统一保存
+    result['encodings'] = ENCODING_CACHE.pop_new_entries()
+    return result
+
+
+# 批量处理文件列表，jobs > 1 时使用进程池并行处理；结果按输入顺序返回
+# root_path 不为空时使用该路径下的处理记录，跳过内容和配置都没有变化的文件；force 为 True 时全部重新处理
+# profile 不为 None 时（或配置文件中 profile: true）记录性能统计，写入 profile 指定的路径（为空时写入 root_path 所在文件夹）
+# prefetch 为串行处理时预读的文件数（None 时使用配置文件中的 prefetch），为 0 时不使用读写流水线
+# runs、executor 为已经创建的处理对象和进程池（监视模式下多次调用时复用），为 None 时新建
+def process_batch(input_files: List[str], is_srt2ass: bool, config_file='config.yml', jobs: int = 1,
+                  root_path: str = '', force: bool = False, profile: str = None, prefetch: int = None,
+                  runs: processors = None, executor=None) -> List[dict]:
+    # 配置文件只解析一次，批处理本身的设置和两个处理对象共用
+    config = read_yaml_config(config_file) or {}
+    if runs is None:
+        runs = processors(is_srt2ass, config_file=config_file, profile=profile is not None)
+    is_profile = profile is not None or bool(config.get('profile', False))
+    if prefetch is None:
+        prefetch = int(config.get('prefetch', 2) or 0)
+    prefetch_max_size = int((config.get('prefetch_max_mb', 64) or 0) * (1 << 20))
+    cache_dir = get_cache_dir(config.get('cache_dir'))
+    encoding_cache_file = os.path.join(cache_dir, 'encodings.json') if cache_dir else ''
+    if encoding_cache_file:
+        ENCODING_CACHE.load(encoding_cache_file)
+
+    # 每类文件对应的配置哈希：修改小说的配置不会使字幕的处理记录失效，反之亦然
+    config_hashes = {}
+    def config_hash_of(file_path: str) -> str:
+        is_novel = is_novel_file(file_path)
+        if is_novel not in config_hashes:
+            config_hashes[is_novel] = (runs.novel if is_novel else runs.sub).config_hash()
+        return config_hashes[is_novel]
+
+    manifest = processing_manifest.for_path(root_path, cache_dir) if root_path else None
+    results = [None] * len(input_files)
+    pending = []
+    for idx, target_file in enumerate(input_files):
+        # 本工具生成的输出文件即使使用 --force 也不再重复处理
+        if manifest and (manifest.is_output(target_file) or
+                         not force and manifest.is_done(target_file, config_hash_of(target_file))):
+            results[idx] = {'file': target_file, 'ok': True, 'skipped': True, 'error': '', 'log': '', 'output': ''}
         else:
-            final_content = '\n'.join(processed_lines)
-        
-        print("6. 保存文件...")
-        output_path = self.save_file(file_path, final_content)
-        if output_path:
-            print("处理完成！")
-            return True
+            pending.append(idx)
+    if len(pending) < len(input_files):
+        print(f"✓ 跳过 {len(input_files) - len(pending)} 个内容和配置都没有变化的文件或输出文件（使用 --force 重新处理）\n")
+
+    count = len(pending)
+    def handle_result(i: int, idx: int, result: dict):
+        if result['error']:
+            print(f"✗ 处理失败: {result['file']}\n  {result['error']}")
+        if manifest and result['ok']:
+            manifest.record(result['file'], config_hash_of(result['file']), result['output'])
+        results[idx] = result
+        print(f"✓ 已处理 {i}/{count} 个文件。\n")
+
+    # 后台写入完成（或失败）后再记录结果，写入成功时才打印保存成功的信息
+    def finish_write(i: int, idx: int, result: dict, writes: list):
+        for future in writes:
+            try:
+                future.result()
+            except Exception as e:
+                result['ok'] = False
+                result['error'] = f'{type(e).__name__}: {e}'
+        if not result['error']:
+            for message in result.pop('saved_log', None) or []:
+                print(message)
+        handle_result(i, idx, result)
+
+    try:
+        if (jobs <= 1 or count <= 1) and prefetch > 0 and count > 1:
+            # 读写流水线：预读后面的文件，后台写入；等待写入的文件数不超过 prefetch 个
+            files = [input_files[idx] for idx in pending]
+            pipe = io_pipeline(files, prefetch, prefetch_max_size)
+            waiting = collections.deque()
+            try:
+                for i, idx in enumerate(pending, 1):
+                    data = pipe.read(i - 1)
+                    result = process_file(runs, files[i - 1], data=data,
+                                          writer=pipe.write if data is not None else None)
+                    waiting.append((i, idx, result, pipe.take_writes()))
+                    while waiting and (len(waiting) > prefetch or all(f.done() for f in waiting[0][3])):
+                        finish_write(*waiting.popleft())
+                while waiting:
+                    finish_write(*waiting.popleft())
+            finally:
+                pipe.close()
+        elif jobs <= 1 or count <= 1:
+            for i, idx in enumerate(pending, 1):
+                handle_result(i, idx, process_file(runs, input_files[idx]))
         else:
-            print("处理失败！")
-            return False
+            print(f"使用 {jobs} 个进程并行处理 {count} 个文件\n")
+            pool = executor or create_worker_pool(jobs, is_srt2ass, config_file, profile is not None)
+            try:
+                # map 按输入顺序返回结果，worker 的输出在主进程中按顺序打印
+                worker_results = pool.map(_run_worker, [input_files[idx] for idx in pending])
+                for i, (idx, result) in enumerate(zip(pending, worker_results), 1):
+                    print(result['log'], end='')
+                    ENCODING_CACHE.merge(result.pop('encodings', {}))
+                    handle_result(i, idx, result)
+            finally:
+                if executor is None:
+                    pool.shutdown()
+    finally:
+        # 中途中断时也保存已经完成的部分
+        ENCODING_CACHE.save()
+        if manifest:
+            manifest.save()
+    if is_profile:
+        if not profile:
+            root_dir = root_path if os.path.isdir(root_path) else os.path.dirname(root_path)
+            profile = os.path.join(root_dir, 'sub_process_profile')
+        total = write_profile_report([r for r in results if r], profile, {
+            kind: run.replace_rules.rule_keys() for kind, run in runs.created().items()})
+        print_profile(total, profile)
+    return results
+
+
+# 打印性能统计的汇总信息
+def print_profile(total: dict, report_base: str):
+    print("性能统计（秒）：" + '，'.join(f"{k} {v:.3f}" for k, v in total['times'].items()))
+    if total['counts']:
+        print("计数：" + '，'.join(f"{k} {v}" for k, v in total['counts'].items()))
+    memo_total = total['counts'].get('memo_hits', 0) + total['counts'].get('memo_misses', 0)
+    if memo_total:
+        print(f"清理结果缓存命中率：{total['counts']['memo_hits'] / memo_total:.1%}")
+    unused = sum(len(v) for v in total['unused_rules'].values())
+    if unused:
+        print(f"有 {unused} 条替换规则一次都没有命中")
+    print(f"详细结果已保存到 {report_base}.json 和 {report_base}.csv\n")
+
+
+# 打印批处理汇总信息
+def print_summary(results: List[dict]):
+    failed = [r for r in results if not r['ok']]
+    skipped = sum(1 for r in results if r.get('skipped'))
+    print(f"✓ 全部 {len(results)} 文件已处理完成！成功 {len(results) - len(failed) - skipped} 个，"
+          f"跳过 {skipped} 个，失败 {len(failed)} 个")
+    for r in failed:
+        print(f"  ✗ {r['file']}" + (f"：{r['error']}" if r['error'] else ''))
+
+
+############################## 监视文件夹 ############################
+class folder_watcher:
+    """
+    轮询文件夹中需要处理的文件：新增或修改的文件在连续两次轮询之间修改时间和大小都没有变化（已经写入完成）后才交给处理。
+    处理过的文件（包括原地覆盖的字幕）和输出文件按处理后的状态记录，不会再次触发
+    """
+    def __init__(self, root_path: str, type_lst):
+        self.root_path = root_path
+        self.type_lst = type_lst
+        self.seen = {}      # 已经处理过的文件: (修改时间, 大小)
+        self.pending = {}   # 等待写入完成的文件: 上一次轮询时的 (修改时间, 大小)
+
+    @staticmethod
+    def signature(file_path: str):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    # 返回已经写入完成、需要处理的文件
+    def poll(self) -> List[str]:
+        ready = []
+        current = {}
+        for file_path in find_files(self.root_path, self.type_lst):
+            sig = self.signature(file_path)
+            if sig is None or self.seen.get(file_path) == sig:
+                continue
+            current[file_path] = sig
+            if self.pending.get(file_path) == sig:
+                ready.append(file_path)
+        # 已删除的文件不再记录
+        self.seen = {k: v for k, v in self.seen.items() if os.path.exists(k)}
+        self.pending = {k: v for k, v in current.items() if k not in ready}
+        return ready
+
+    # 记录处理后的状态（处理失败的文件在再次修改后才重新处理）
+    def mark_done(self, file_paths: Iterable[str]):
+        for file_path in file_paths:
+            sig = self.signature(file_path)
+            if sig is not None:
+                self.seen[file_path] = sig
+
+
+# 监视模式：常驻运行，配置、OpenCC 转换器和替换规则只加载一次，新文件写入完成后立即处理；Ctrl-C 退出
+# jobs > 1 时整个监视期间使用同一个进程池；配置文件被修改时重新创建处理对象和进程池
+def watch_folder(root_path: str, is_srt2ass: bool, type_lst, config_file='config.yml', interval: float = 2.0,
+                 jobs: int = 1, force: bool = False, profile: str = None, prefetch: int = None):
+    watcher = folder_watcher(root_path, type_lst)
+    runs, executor, config_sig = None, None, None
+    print(f"开始监视: {root_path}（每 {interval:g} 秒检查一次，按 Ctrl-C 退出）\n")
+    try:
+        while True:
+            ready = watcher.poll()
+            if ready:
+                sig = folder_watcher.signature(config_file)
+                if runs is None or sig != config_sig:
+                    if runs is not None:
+                        print("配置文件已修改，重新加载配置\n")
+                    runs = processors(is_srt2ass, config_file=config_file, profile=profile is not None)
+                    if executor is not None:
+                        executor.shutdown()
+                    executor = create_worker_pool(jobs, is_srt2ass, config_file, profile is not None) if jobs > 1 else None
+                    config_sig = sig
+                results = process_batch(ready, is_srt2ass, config_file=config_file, jobs=jobs, root_path=root_path,
+                                        force=force, profile=profile, prefetch=prefetch, runs=runs, executor=executor)
+                print_summary(results)
+                watcher.mark_done(ready + [r['output'] for r in results if r.get('output')])
+                print(f"\n继续监视: {root_path}\n")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("已停止监视")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+############################## 内存接口 ############################
+# 作为库使用时的处理对象：按 (是否转为ASS, 配置文件) 缓存，配置、OpenCC 转换器、替换规则和ASS模板只加载一次
+_api_processors = {}
+
+
+def get_processors(to_ass: bool = False, config_file='config.yml') -> processors:
+    key = (bool(to_ass), os.path.abspath(config_file))
+    runs = _api_processors.get(key)
+    if runs is None:
+        runs = _api_processors[key] = processors(bool(to_ass), config_file=config_file, quiet=True, novel_jobs=1)
+    return runs
+
+
+# 内存中的内容：bytes 时检测编码后解码
+def content_text(data) -> str:
+    if isinstance(data, str):
+        return data
+    text = decode_bytes(data)
+    if text is None:
+        raise ValueError('无法解码内容')
+    return text
+
+
+# 处理内存中的字幕（bytes 时自动检测编码），返回处理后的文本；fmt 为 'srt'、'ass' 或 'ssa'
+# to_ass 为 True 时 srt 转为 ass；不读写文件、不打印
+def process_subtitle(data, fmt: str = 'srt', to_ass: bool = False, config_file='config.yml') -> str:
+    return get_processors(to_ass, config_file).sub.process_text(content_text(data), fmt)
+
+
+# 处理内存中的小说文本（bytes 时自动检测编码），返回处理后的文本
+def process_text(data, config_file='config.yml') -> str:
+    return get_processors(False, config_file).novel.process_text(content_text(data))
+
+
+# 批量处理内存中的内容：items 为 (内容, 格式) 的序列，格式为 'srt'、'ass'、'ssa' 或 'txt'（小说）
+# 按顺序逐个返回结果字典 {'ok', 'text', 'error'}，单个内容处理失败不影响其他内容
+def process_many(items: Iterable[Tuple[object, str]], to_ass: bool = False, config_file='config.yml') -> Iterator[dict]:
+    for data, fmt in items:
+        try:
+            if fmt.lower().lstrip('.') == 'txt':
+                text = process_text(data, config_file)
+            else:
+                text = process_subtitle(data, fmt.lower().lstrip('.'), to_ass, config_file)
+            yield {'ok': True, 'text': text, 'error': ''}
+        except Exception as e:
+            yield {'ok': False, 'text': '', 'error': f'{type(e).__name__}: {e}'}
+
+
+############################## 管道模式 ############################
+# ASS/SSA 文件开头的行：节名或 Script Info 中的字段
+ASS_FIRST_LINE_RE = re.compile(r'^(?:\[[^\]]+\]|(?:Dialogue|Comment|ScriptType|Title)\s*:)', re.IGNORECASE)
+
+
+# 根据第一个非空行判断格式：ASS 的节名等 -> 'ass'；序号或时间行 -> 'srt'；其他为小说 'txt'
+def detect_stream_format(first_line: str) -> str:
+    line = first_line.strip().lstrip('\ufeff')
+    if ASS_FIRST_LINE_RE.match(line):
+        return 'ass'
+    if not line or line.isdigit() or '-->' in line:
+        return 'srt'
+    return 'txt'
+
+
+# 管道模式：从标准输入逐行读取，根据开头的内容判断格式，处理完一条字幕就写出一条
+# output 为空时写入标准输出（不含BOM），否则写入该文件；提示信息只输出到标准错误，标准输出只有处理结果
+def run_filter(is_srt2ass: bool, to: str = None, output: str = '', config_file='config.yml') -> int:
+    lines = iter_stream_lines(sys.stdin.buffer)
+    head = []
+    for line in lines:
+        head.append(line)
+        if line.strip():
+            break
+    fmt = detect_stream_format(head[-1] if head else '')
+    lines = itertools.chain(head, lines)
+    runs = processors(is_srt2ass, config_file=config_file, quiet=True, novel_jobs=1)
+    try:
+        if fmt == 'txt':
+            run, encoding = runs.novel, 'utf-8'
+            run.profiler = None
+            chunks = run.iter_output(run.iter_paragraphs(lines))
+        else:
+            run, encoding = runs.sub, 'utf-8-sig'
+            run.profiler = None
+            converter = get_converter(run.opencc_profile)
+            to_ass = None if to is None else to == 'ass'
+            chunks = run.iter_subtitle(converter.convert_lines(lines), fmt, to_ass, batch_size=1)
+        if output:
+            write_chunks(output, chunks, encoding)
+            print(f'✓ - -> {output}', file=sys.stderr)
+            return 0
+        out = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        for chunk in chunks:
+            out.write(chunk)
+            out.flush()
+    except BrokenPipeError:
+        # 下游（如 head）提前退出：不再输出，退出时也不再报错
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except Exception as e:
+        print(f'处理失败: {type(e).__name__}: {e}', file=sys.stderr)
+        return 1
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='字幕及小说文本处理工具')
+    parser.add_argument('file_path', help='需要处理的文件或文件夹路径；为 - 时从标准输入读取（管道模式）')
+    # 兼容原来的用法：除文件路径外还有其他参数时，执行字幕srt->ass的功能
+    parser.add_argument('is_srt2ass', nargs='?', help='提供该参数时，srt文件将被转为ass文件')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='并行处理的进程数，默认为1；为0时使用全部CPU核心')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='忽略处理记录，重新处理所有文件（之前生成的输出文件仍会跳过）')
+    parser.add_argument('--prefetch', type=int, default=None, metavar='N',
+                        help='串行处理时预读后面N个文件并在后台写入输出，为0时不预读；默认使用配置文件中的 prefetch（2）')
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='REPORT',
+                        help='记录各阶段耗时、计数及替换规则命中次数，结果写入 REPORT.json/.csv（默认写入输入路径所在文件夹）')
+    parser.add_argument('--watch', nargs='?', type=float, const=2.0, default=None, metavar='SECONDS',
+                        help='常驻监视文件夹，新增或修改的文件写入完成后立即处理；SECONDS 为检查间隔，默认2秒')
+    parser.add_argument('--to', choices=['srt', 'ass'], default=None,
+                        help='管道模式下字幕的输出格式，默认与输入相同（提供 is_srt2ass 时 srt 转为 ass）')
+    parser.add_argument('-o', '--output', default='-', metavar='PATH',
+                        help='管道模式下的输出文件，默认为 -（标准输出）')
+    return parser.parse_args(argv)
 
-    
 
-    
 def main():
-    new_path = change_to_exe_dir()
-    print(f"当前工作目录已修改为: \t{new_path}")
-
     # 检查参数数量
     if len(sys.argv) < 2:
         print("错误：请至少提供文件或文件夹路径作为参数。")
-        print("用法: 工具.exe", sys.argv[0], "<文件路径>", "[is_srt2ass]")
+        print("用法: 工具.exe", sys.argv[0], "<文件路径|->", "[is_srt2ass]", "[--jobs N]", "[--force]", "[--prefetch N]", "[--profile [REPORT]]", "[--watch [SECONDS]]", "[--to srt|ass]", "[-o PATH]")
         sys.exit(1)
-    elif len(sys.argv) == 2:    # 只有一个参数时，单纯执行字幕繁->简、替换等处理功能
-        is_srt2ass = False
-    else:   # 多于一个参数时，执行字幕srt->ass的功能
-        is_srt2ass = True
+
+    args = parse_args()
+    if args.file_path == '-':
+        # 管道模式：输出文件的相对路径相对于当前目录，标准输出只输出处理结果
+        output = os.path.abspath(args.output) if args.output != '-' else ''
+        change_to_exe_dir()
+        sys.exit(run_filter(args.is_srt2ass is not None, args.to, output, config_file='config.yml'))
+
+    new_path = change_to_exe_dir()
+    print(f"当前工作目录已修改为: \t{new_path}")
+    # 只有一个参数时，单纯执行字幕繁->简、替换等处理功能；多于一个参数时，执行字幕srt->ass的功能
+    is_srt2ass = args.is_srt2ass is not None
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     # 获取文件路径
-    file_path = sys.argv[1]
+    file_path = args.file_path
 
     # # 手动测试时：
     # file_path = r"test\testn.txt"
     # is_srt2ass = True
 
-    # # 实例化类并执行其中的总流程：
-    sub_run = sub_process(is_srt2ass, config_file='config.yml')
-    novel_run = novel_process()
-
     # 查找的文件类型
     target_filetype = ['.srt', '.ass', '.ssa', '.txt']
 
-    input_files = find_files(file_path, target_filetype)
-    i = 0
-    count = len(input_files)
-    for target_file in input_files:
-        _, ext = os.path.splitext(target_file)
-
-        if  ext.lower() == '.txt':
-            novel_run.process_novel(target_file)
-        # 不是txt文件，则执行字幕处理功能
-        else:   
-            sub_run.process_all(target_file)
+    if args.watch is not None:
+        watch_folder(file_path, is_srt2ass, target_filetype, config_file='config.yml', interval=max(args.watch, 0.1),
+                     jobs=jobs, force=args.force, profile=args.profile, prefetch=args.prefetch)
+        return
 
-        i = i + 1
-        print(f"✓ 已处理 {i}/{count} 个文件。\n")
-    print(f"✓ 全部 {count} 文件已处理完成！")
+    input_files = find_files(file_path, target_filetype)
+    results = process_batch(input_files, is_srt2ass, config_file='config.yml', jobs=jobs,
+                            root_path=file_path, force=args.force, profile=args.profile, prefetch=args.prefetch)
+    print_summary(results)
 
 
 if __name__ == "__main__":
+    # PyInstaller 打包后使用多进程时需要
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+sub_process 的快速检查（几秒内完成），可以直接运行：
+    python -m pytest -q test_sub_process.py
+    python test_sub_process.py
+"""
+import contextlib
+import io
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+
+import bench
+import sub_process
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_FILE = os.path.join(ROOT_DIR, 'sub_process.py')
+CONFIG_FILE = os.path.join(ROOT_DIR, 'config.yml')
+
+# 单独检测时 chardet 容易误判为 cp949 的标题行
+GBK_TITLE = '第1章 嗯电话'
+BIG5_TITLE = '第1章 電話電話'
+
+
+# 生成小说文本：标题之后是按每行30个字硬换行的段落
+def make_novel(title: str, trad_ratio: float, paragraphs: int = 40, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    lines = [title, '']
+    for _ in range(paragraphs):
+        paragraph = ''.join(bench.make_sentence(rnd, trad_ratio, rnd.randint(3, 10)) for _ in range(rnd.randint(2, 6)))
+        lines += [paragraph[i:i + 30] for i in range(0, len(paragraph), 30)]
+    return '\r\n'.join(lines) + '\r\n'
+
+
+# 生成 SRT 字幕文本
+def make_srt(title: str, trad_ratio: float, count: int = 200, seed: int = 0) -> str:
+    cues = bench.make_cues(random.Random(seed), count, trad_ratio)
+    cues[0] = (cues[0][0], cues[0][1], [title])
+    return ''.join(f'{i}\n{sub_process.ms_to_srt_time(start)} --> {sub_process.ms_to_srt_time(end)}\n'
+                   + '\n'.join(lines) + '\n\n' for i, (start, end, lines) in enumerate(cues, 1))
+
+
+# 以管道模式运行 sub_process.py，返回标准输出
+def run_pipe(data: bytes, *args) -> str:
+    result = subprocess.run([sys.executable, SCRIPT_FILE, '-', *args], input=data, capture_output=True, check=True)
+    return result.stdout.decode('utf-8')
+
+
+############################## 时间轴 ############################
+def test_time_conversion():
+    # SRT 与 ASS 格式、1~3位小数、超过10小时
+    for text, ms in [('00:00:39,560', 39560), ('0:00:39.56', 39560), ('0:00:39.5', 39500), (' 1:02:03.4 ', 3723400),
+                     ('10:00:00.00', 36000000), ('123:04:05,678', 443045678)]:
+        assert sub_process.time_to_ms(text) == ms, text
+    # ASS 厘秒四舍五入（进位到分钟、小时），负数按0输出
+    for ms, srt, ass in [(0, '00:00:00,000', '0:00:00.00'), (39564, '00:00:39,564', '0:00:39.56'),
+                         (39565, '00:00:39,565', '0:00:39.57'), (59995, '00:00:59,995', '0:01:00.00'),
+                         (3599999, '00:59:59,999', '1:00:00.00'), (36000000, '10:00:00,000', '10:00:00.00'),
+                         (443045678, '123:04:05,678', '123:04:05.68'), (-20, '00:00:00,000', '0:00:00.00')]:
+        assert (sub_process.ms_to_srt_time(ms), sub_process.ms_to_ass_time(ms)) == (srt, ass), ms
+    for ms in (0, 39560, 36000000, 443045670):
+        assert sub_process.time_to_ms(sub_process.ms_to_srt_time(ms)) == ms
+        assert sub_process.time_to_ms(sub_process.ms_to_ass_time(ms)) == ms
+
+
+# 重叠修正不会产生持续时间为0或负数的字幕，也不会短于 min_duration；NumPy 与纯 Python 的结果相同
+def test_fix_overlap_keeps_duration():
+    cues = [(0, 500), (200, 900), (256, 1000), (5000, 6000)]
+    for min_duration, expected in [(0, [(0, 100), (200, 201), (256, 1000), (5000, 6000)]),
+                                   (0.2, [(0, 200), (200, 400), (256, 1000), (5000, 6000)])]:
+        timing = sub_process.cue_timing(min_duration=min_duration, fix_overlap=True, min_gap=0.1)
+        for size in (len(cues), sub_process.NUMPY_MIN_BATCH):
+            batch = sub_process.cue_batch()
+            for start, end in cues * (size // len(cues)):
+                batch.append(start, end, ['x'], sub_process.DEFAULT_STYLE, 0, sub_process.DEFAULT_FIELDS, '')
+            timing.apply(batch, 5000)
+            result = list(zip(batch.starts, batch.ends))[:len(cues)]
+            assert result == expected, (min_duration, size)
+            assert all(end > start for start, end in zip(batch.starts, batch.ends))
+
+
+# 分批调整时间（每批最后一条留到下一批做重叠修正）与整体调整一次的结果相同，各列原样保留
+def test_timed_batches_match_single_batch():
+    rnd = random.Random(0)
+    cues, start = [], 0
+    for i in range(50):
+        start += rnd.randint(0, 3000)
+        cues.append((start, start + rnd.randint(0, 5000), f'第{i}句', rnd.choice(['Default', 'Sign']), rnd.randint(0, 2),
+                     f',Name{i},0,0,0,', 'Comment: x\n' if i % 7 == 0 else ''))
+    timing = sub_process.cue_timing(offset=-1.5, fps_from=23.976, fps_to=25, min_duration=0.8, fix_overlap=True,
+                                    min_gap=0.05)
+    whole = sub_process.cue_batch()
+    for cue in cues:
+        whole.append(*cue)
+    timing.apply(whole)
+    for batch_size in (1, 3, 16):
+        batches = list(sub_process.iter_timed_batches(cues, timing, batch_size))
+        assert [cue for batch in batches for cue in batch] == list(whole), batch_size
+    assert [cue[2:] for cue in whole] == [cue[2:] for cue in cues]
+    last = list(whole)[-1]
+    assert whole.pop() == last and len(whole) == len(cues) - 1
+
+
+############################## ASS 字幕 ############################
+ASS_STYLE_FORMAT = ('Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, '
+                    'Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, '
+                    'Alignment, MarginL, MarginR, MarginV, Encoding')
+SIGN_STYLE = 'Style: Sign,Arial,60,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,0,8,10,10,10,1'
+TEMPLATE_STYLE = 'Style: Default,Microsoft YaHei,60,&H0000FFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1'
+TEMPLATE_ASS = f'''[Script Info]
+ScriptType: v4.00+
+PlayResX: 1280
+PlayResY: 720
+
+[V4+ Styles]
+{ASS_STYLE_FORMAT}
+{TEMPLATE_STYLE}
+
+[Events]
+'''
+
+
+# 每条字幕的 Layer、Style、Name、边距、Effect、覆盖标签和 Comment 行原样保留
+def test_ass_fields_preserved():
+    events = [
+        'Comment: 0,0:00:00.00,0:00:01.00,Sign,,0,0,0,,注释',
+        'Dialogue: 2,0:00:01.00,0:00:02.50,Sign,Bob,15,20,30,Scroll up,{\\pos(960,100)}你好\\N世界',
+        'Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,好的',
+    ]
+    text = f'''[Script Info]
+ScriptType: v4.00+
+PlayResX: 1920
+PlayResY: 1080
+
+[V4+ Styles]
+{ASS_STYLE_FORMAT}
+{SIGN_STYLE}
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+''' + '\n'.join(events) + '\n'
+    run = sub_process.sub_process(False, config_file=CONFIG_FILE, quiet=True)
+    run.ass_template = sub_process.ass_template.parse(TEMPLATE_ASS)
+    output = run.process_text(text, 'ass')
+    assert output.split('[Events]\n')[1].splitlines()[1:] == events
+    # 输入文件的分辨率和样式在前，模板中没有的样式补在后面
+    assert 'PlayResX: 1920' in output and 'PlayResX: 1280' not in output
+    assert output.index(SIGN_STYLE) < output.index(TEMPLATE_STYLE)
+
+
+def test_ass_template_merge():
+    template = sub_process.ass_template.parse(TEMPLATE_ASS)
+    # 样式格式相同：使用输入文件的 Script Info（ScriptType 除外）和样式，同名样式以输入文件为准，其他节保留
+    own_default = TEMPLATE_STYLE.replace('Microsoft YaHei', 'SimHei')
+    same = sub_process.ass_template.parse(f'''[Script Info]
+ScriptType: v4.00
+PlayResX: 1920
+
+[V4+ Styles]
+{ASS_STYLE_FORMAT}
+{own_default}
+{SIGN_STYLE}
+
+[Fonts]
+fontname: x.ttf
+
+[Events]
+''')
+    merged = template.merge(same)
+    assert merged.sections['Script Info'] == ['ScriptType: v4.00+', 'PlayResX: 1920']
+    assert merged.sections['V4+ Styles'] == [ASS_STYLE_FORMAT, own_default, SIGN_STYLE]
+    assert merged.sections['Fonts'] == ['fontname: x.ttf']
+    assert merged.render().endswith('[Events]\n' + sub_process.ass_template.EVENTS_FORMAT + '\n')
+    # SSA 的 [V4 Styles]：格式不同，使用模板的 Script Info 和样式
+    ssa = sub_process.ass_template.parse('''[Script Info]
+ScriptType: v4.00
+PlayResX: 640
+
+[V4 Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Arial,20
+
+[Events]
+''')
+    assert template.merge(ssa).sections == template.sections
+    assert template.merge(sub_process.ass_template({})) is template
+
+
+# 合并相邻的重复字幕：间隔不超过 merge_gap、Style 等字段相同、中间没有其他行、合并后不超过 max_duration
+def test_merge_cues():
+    run = sub_process.sub_process(False, config_file=CONFIG_FILE, quiet=True)
+    run.timing = sub_process.cue_timing(max_duration=5, merge_duplicates=True, merge_gap=0.2)
+    cue = lambda start, end, text='好的', style='Default', pre='': (start, end, text, style, 0, ',,0,0,0,', pre)
+    cues = [
+        cue(0, 1000), cue(1100, 2000), cue(2000, 2500),     # 合并为 0-2500
+        cue(2800, 3000),                                     # 间隔超过 merge_gap
+        cue(3000, 3500, style='Sign'),                       # Style 不同
+        cue(3500, 4000, style='Sign', pre='Comment: x\n'),   # 中间有其他行
+        cue(4000, 4500, text='再见'), cue(4500, 9100, text='再见'),   # 合并后超过 max_duration
+        cue(9000, 9500, text='再见'), cue(9200, 9300, text='再见'),   # 包含在上一条之内
+    ]
+    assert list(run.merge_cues(cues)) == [
+        cue(0, 2500), cue(2800, 3000), cue(3000, 3500, style='Sign'), cue(3500, 4000, style='Sign', pre='Comment: x\n'),
+        cue(4000, 4500, text='再见'), cue(4500, 9500, text='再见')]
+    assert run.cues_merged == 4
+    # 处理整个文件时删除和合并的条数在 cue_report 中报告
+    run.cues_merged = 0
+    srt = ''.join(f'{i}\n00:00:0{i},000 --> 00:00:0{i},900\n好的\n\n' for i in range(1, 4))
+    assert run.process_text(srt).count('好的') == 1 and run.cues_merged == 2
+    assert '合并重复字幕 2 条' in run.cue_report()
+
+
+############################## 替换规则 ############################
+# 按配置顺序依次执行 re.sub，返回结果和每条规则的命中次数
+def sequential_replace(rules: dict, text: str):
+    hits = {}
+    for old_wd, new_wd in rules.items():
+        text, count = re.subn(old_wd, new_wd, text, flags=re.UNICODE)
+        if count:
+            hits[old_wd] = hits.get(old_wd, 0) + count
+    return text, hits
+
+
+def assert_rules_sequential(rules: dict, texts):
+    engine = sub_process.replace_rules(rules)
+    assert not engine.errors
+    for text in texts:
+        expected, expected_hits = sequential_replace(rules, text)
+        hits = {}
+        assert engine.apply(text) == expected, (rules, text)
+        assert engine.apply_counted(text, hits) == expected, (rules, text)
+        # 提前执行的整行删除规则删除的行不再统计之前的规则的命中
+        drop_keys = {k for k in rules if sub_process.drop_line_literal(k, rules[k])}
+        if drop_keys & set(expected_hits):
+            expected_hits = {k: v for k, v in expected_hits.items() if k in drop_keys}
+            hits = {k: v for k, v in hits.items() if k in drop_keys}
+        assert hits == expected_hits, (rules, text)
+
+
+def test_rules_match_sequential_config():
+    config = sub_process.read_yaml_config(CONFIG_FILE)
+    texts = [line for seed in range(3) for line in make_novel(GBK_TITLE, 0.3, seed=seed).split('\r\n')]
+    texts += ['第98堂课', '嗯嗯嗯嗯好的', '太熟悉了太熟悉', '', '喂喂喂\n第98堂课\n好']
+    for key in ('replacements', 'text_replacements'):
+        assert_rules_sequential(config.get(key) or {}, texts)
+
+
+def test_rules_match_sequential_adversarial():
+    cases = [
+        ({'a': 'b', 'bc': 'X'}, ['ac', 'abc', 'bac']),
+        ({'a': 'b', 'cb': 'X'}, ['ca', 'cba']),
+        ({'a': '', 'bc': 'X'}, ['bac', 'abc']),
+        ({'ab': 'c', 'bc': 'X'}, ['abc', 'ab', 'c']),
+        ({'foo': '98堂', '.*98堂.*': ''}, ['foo bar', 'bar']),
+        ({'98': '', '.*98堂.*': ''}, ['x98堂y', 'x堂y']),
+        ({'.*甲.*': '', '.*乙.*': '', '丙': '乙'}, ['甲乙', '乙甲', '丙', '甲\n乙\n丙']),
+    ]
+    for rules, texts in cases:
+        assert_rules_sequential(rules, texts)
+    # 小字母表上的随机规则：纯文本、整行删除和正则混合
+    rnd = random.Random(0)
+    word = lambda low, high: ''.join(rnd.choice('abc') for _ in range(rnd.randint(low, high)))
+    for _ in range(300):
+        rules = {}
+        for _ in range(rnd.randint(1, 5)):
+            kind = rnd.random()
+            if kind < 0.2:
+                rules[f'.*{word(1, 2)}.*'] = ''
+            elif kind < 0.3:
+                rules[f'{rnd.choice("abc")}+'] = word(0, 1)
+            else:
+                rules[word(1, 3)] = word(0, 2)
+        texts = [word(0, 8) for _ in range(20)] + [word(1, 4) + '\n' + word(1, 4)]
+        assert_rules_sequential(rules, texts)
+
+
+# 一行包含多个整行删除关键词时，命中记在配置中第一条规则上（与依次替换相同），而不是最靠左的关键词
+def test_drop_hits_follow_config_order():
+    engine = sub_process.replace_rules({'.*乙.*': '', '.*甲.*': ''})
+    hits = {}
+    assert engine.apply_counted('甲乙', hits) == ''
+    assert hits == {'.*乙.*': 1}
+    hits = {}
+    assert engine.apply_counted('甲\n乙甲\n丙', hits) == '\n\n丙'
+    assert hits == {'.*乙.*': 1, '.*甲.*': 1}
+
+
+############################## 繁简转换 ############################
+def test_convert_lines_phrases():
+    import opencc
+    converter = sub_process.get_converter('t2s')
+    base = opencc.OpenCC('t2s')
+    # 只有在词组中才会被转换的字符（瞭、藉、覆）出现在第一个繁体字之前
+    lines = ['1\n', '00:00:01,000 --> 00:00:02,000\n', '我瞭解你的藉口\n', '\n', '2\n', '答覆\n', '乾燥的時間\n']
+    assert list(converter.convert_lines(lines)) == [base.convert(line) for line in lines]
+    assert sub_process.tw2cn('答覆') == base.convert('答覆')
+
+
+# 会被转换的字符集在进程内生成，不调用外部程序；不知道词组字符的转换配置提示后不跳过任何文本
+def test_trigger_chars_in_process():
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError('不应调用外部程序')
+    saved = subprocess.run, subprocess.Popen, sub_process.OPENCC_PHRASE_CHARS
+    subprocess.run = subprocess.Popen = no_subprocess
+    try:
+        chars = sub_process.opencc_converter('t2s').trigger_chars
+        assert set('瞭藉覆電話') <= chars and not set('电话了') & chars
+        converter = sub_process.opencc_converter('t2s')
+        sub_process.OPENCC_PHRASE_CHARS = {}
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            assert converter.trigger_chars is None and converter.needs_convert('电话')
+        assert 't2s' in err.getvalue()
+    finally:
+        subprocess.run, subprocess.Popen, sub_process.OPENCC_PHRASE_CHARS = saved
+
+
+############################## 小说切块并行处理 ############################
+# 多个章节的小说
+def make_chapters(count: int = 6) -> str:
+    return ''.join(make_novel(f'第{i}章 标题{i}', 0.3, paragraphs=12, seed=i) + '\r\n' for i in range(1, count + 1))
+
+
+# 逐行处理与切块并行处理（块很小，分界很多）的输出和章节目录必须完全相同
+def assert_parallel_identical(run: sub_process.novel_process, text: str):
+    run.novel_toc = True
+    serial, serial_toc = run.process_text(text), run.chapters
+    for chunk_chars in (1, 37, 4096):
+        run.novel_chunk_chars = chunk_chars
+        lines = io.StringIO(sub_process.normalize_newlines(text))
+        parallel = ''.join(run.iter_output(run.iter_paragraphs_parallel(lines, 2)))
+        assert parallel == serial, chunk_chars
+        assert run.chapters == serial_toc, chunk_chars
+
+
+def test_novel_parallel_identical():
+    run = sub_process.novel_process(config_file=CONFIG_FILE, quiet=True)
+    text = make_chapters()
+    assert_parallel_identical(run, text)
+    # 没有任何结束标点：只能在章节标题之前切分
+    assert_parallel_identical(run, ''.join(c for c in text if c not in sub_process.END_CHARS))
+    # 替换规则改变行尾的字符：切分位置按替换后的文本判断
+    run.replace_words = {'。': '', '，': '。', '嗯$': '嗯！', '第3章': '第三部分'}
+    run.replace_rules = sub_process.replace_rules(run.replace_words)
+    run.line_memo = sub_process.line_memo(run._replace_line)
+    assert_parallel_identical(run, text)
+
+
+############################## 清理结果缓存 ############################
+def test_memo_keeps_rule_hits():
+    lines = ['第98堂课', '好的', '第98堂课', '嗯嗯', '第98堂课'] * 20 + ['电话' * 60] * 3
+    results = []
+    for size in (0, sub_process.LINE_MEMO_SIZE):
+        for run in (sub_process.sub_process(False, config_file=CONFIG_FILE, quiet=True),
+                    sub_process.novel_process(config_file=CONFIG_FILE, quiet=True)):
+            memo_func = run.line_memo._func
+            run.line_memo = sub_process.line_memo(memo_func, size)
+            run.profiler = sub_process.stage_profiler()
+            clean = run.clean_line if isinstance(run, sub_process.sub_process) else run.replace_line
+            results.append(([clean(line) for line in lines], run.profiler.rule_hits))
+    assert results[0] == results[2] and results[1] == results[3]
+    assert results[0][1]['.*98堂.*'] == 60
+
+
+############################## 写入文件 ############################
+# 写入成功后替换目标文件（保留权限）；生成内容时出错则删除临时文件，原文件不变
+def test_write_chunks_atomic():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'out.srt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('原内容')
+        os.chmod(path, 0o640)
+
+        def failing_chunks():
+            yield '新' * (sub_process.WRITE_BUFFER_SIZE + 1)
+            raise UnicodeDecodeError('gbk', b'\xff', 0, 1, 'bad')
+        try:
+            sub_process.write_chunks(path, failing_chunks())
+            assert False, '应该抛出异常'
+        except UnicodeDecodeError:
+            pass
+        assert os.listdir(temp_dir) == ['out.srt']
+        with open(path, 'r', encoding='utf-8') as f:
+            assert f.read() == '原内容'
+
+        sub_process.write_chunks(path, ['第一块', '第二块'] * 3, fsync=True)
+        assert os.listdir(temp_dir) == ['out.srt']
+        with open(path, 'rb') as f:
+            assert f.read() == ('第一块第二块' * 3).encode('utf-8-sig')
+        if os.name != 'nt':
+            assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+############################## 读写流水线 ############################
+# 后台写入时，保存成功的信息在写入完成后才打印；写入失败的文件不打印
+def test_pipeline_reports_saved_after_write():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = [os.path.join(temp_dir, f'{i}.srt') for i in range(3)]
+        for i, path in enumerate(files):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(make_srt(GBK_TITLE, 0.3, count=20, seed=i))
+        # 输出路径是文件夹，后台写入失败
+        os.mkdir(os.path.join(temp_dir, '1.ass'))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            results = sub_process.process_batch(files, True, config_file=CONFIG_FILE, prefetch=2)
+        log = out.getvalue()
+        assert [r['ok'] for r in results] == [True, False, True]
+        assert f'✓ {files[0]} -> ' in log and f'✓ {files[2]} -> ' in log and f'✓ {files[1]} -> ' not in log
+        assert log.index(f'✓ {files[0]} -> ') < log.index('✓ 已处理 1/3')
+
+
+############################## 管道模式 ############################
+def test_stream_lines_match_file_decoding():
+    novel = make_novel(GBK_TITLE, 0.3)
+    cases = [
+        novel.encode('gbk'),
+        make_novel(BIG5_TITLE, 1.0).encode('big5', 'replace'),
+        # 非ASCII内容在第一个检测样本块之后才出现
+        ('x' * 79 + '\n') * 1200 + novel,
+        novel.encode('utf-8'),
+        # 只用 \r 换行（老式 Mac 格式），以及 \r\n 被读取的边界分开
+        novel.replace('\r\n', '\r').encode('gbk'),
+        novel.replace('\r\n', '\r').encode('utf-8'),
+        ('y' * 65535 + '\r\n') * 3,
+        b'',
+    ]
+    for data in cases:
+        if isinstance(data, str):
+            data = data.encode('gbk')
+        lines = list(sub_process.iter_stream_lines(io.BufferedReader(io.BytesIO(data))))
+        assert ''.join(lines) == sub_process.decode_bytes(data)
+        assert all(line.count('\n') <= 1 for line in lines)
+
+
+# 逐次返回给定数据块的流，记录已经读取的次数
+class chunked_stream(io.RawIOBase):
+    def __init__(self, chunks):
+        self.chunks, self.reads = list(chunks), 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.chunks:
+            return 0
+        self.reads += 1
+        data = self.chunks.pop(0)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def test_stream_utf8_without_waiting():
+    raw = chunked_stream([b'1\n', '00:00:01,000 --> 00:00:02,000\n'.encode(), '你好\n'.encode(), b'\n'] + [b'x\n'] * 100)
+    lines = sub_process.iter_stream_lines(io.BufferedReader(raw))
+    assert [next(lines) for _ in range(3)][-1] == '你好\n'
+    assert raw.reads == 3
+
+
+def test_pipe_novel_gbk_big5():
+    for title, trad_ratio, encoding in [(GBK_TITLE, 0.3, 'gbk'), (BIG5_TITLE, 1.0, 'big5')]:
+        data = make_novel(title, trad_ratio).encode(encoding, 'replace')
+        assert run_pipe(data) == sub_process.process_text(data, config_file=CONFIG_FILE)
+
+
+def test_pipe_subtitle_gbk_big5():
+    for title, trad_ratio, encoding in [(GBK_TITLE, 0.3, 'gbk'), (BIG5_TITLE, 1.0, 'big5')]:
+        data = make_srt(title, trad_ratio).encode(encoding, 'replace')
+        assert run_pipe(data) == sub_process.process_subtitle(data, 'srt', config_file=CONFIG_FILE)
+        assert run_pipe(data, '--to', 'ass') == \
+            sub_process.process_subtitle(data, 'srt', to_ass=True, config_file=CONFIG_FILE)
+
+
+# 只用 \r 换行的输入按行处理，与读取文件的结果相同
+def test_pipe_subtitle_cr_only():
+    for encoding in ('gbk', 'utf-8'):
+        data = make_srt(GBK_TITLE, 0.3).replace('\n', '\r').encode(encoding)
+        output = run_pipe(data)
+        assert output == sub_process.process_subtitle(data, 'srt', config_file=CONFIG_FILE)
+        assert output.count('\n') > 600 and '\r' not in output
+
+
+if __name__ == '__main__':
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            func()
+            print(f'✓ {name}')